@@ -1,53 +1,137 @@
 """Configuration settings for the Lead Validation Reporting project."""
 import os
+from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
+from typing import Optional
 from dotenv import load_dotenv
 
-# Load environment variables from .env file
-load_dotenv()
-
 # Project paths
 PROJECT_ROOT = Path(__file__).parent.parent
 DATA_DIR = PROJECT_ROOT / "data"
 LOGS_DIR = PROJECT_ROOT / "logs"
 REPORTS_DIR = PROJECT_ROOT / "reports"
+FIG_CACHE_DIR = DATA_DIR / "fig_cache"
+
+
+@lru_cache(maxsize=1)
+def ensure_dirs():
+    """Create the data, logs and reports directories (once per process)."""
+    for directory in (DATA_DIR, LOGS_DIR, REPORTS_DIR):
+        directory.mkdir(exist_ok=True)
+
+
+@dataclass(frozen=True)
+class Settings:
+    """Environment-derived settings, resolved once per process."""
+    
+    # Project paths
+    data_dir: Path
+    logs_dir: Path
+    reports_dir: Path
+    
+    # DuckDB Configuration
+    duckdb_path: str
+    duckdb_memory_limit: str
+    cache_size_mb: int
+    
+    # Salesforce Configuration
+    sf_client_id: Optional[str]
+    sf_client_secret: Optional[str]
+    sf_username: Optional[str]
+    sf_password: Optional[str]
+    sf_security_token: Optional[str]
+    sf_token_url: Optional[str]
+    
+    # Dashboard Configuration
+    dashboard_host: str
+    dashboard_port: int
+    dashboard_title: str
+    
+    # Validation Configuration
+    validation_rules_strict: bool
+    compliance_checks_enabled: bool
+    data_retention_days: int
+    duplicate_threshold: float
+    min_completeness_score: float
+    
+    # External Services
+    clearbit_api_key: Optional[str]
+    zerobounce_api_key: Optional[str]
+    
+    # Logging Configuration
+    log_level: str
+    log_file: str
+
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Load the .env file and parse environment settings (cached per process)."""
+    load_dotenv()
+    
+    return Settings(
+        data_dir=DATA_DIR,
+        logs_dir=LOGS_DIR,
+        reports_dir=REPORTS_DIR,
+        duckdb_path=os.getenv("DUCKDB_PATH", str(DATA_DIR / "leads.duckdb")),
+        duckdb_memory_limit=os.getenv("DUCKDB_MEMORY_LIMIT", "2GB"),
+        cache_size_mb=int(os.getenv("CACHE_SIZE_MB", "256")),
+        sf_client_id=os.getenv("SF_CLIENT_ID"),
+        sf_client_secret=os.getenv("SF_CLIENT_SECRET"),
+        sf_username=os.getenv("SF_USERNAME"),
+        sf_password=os.getenv("SF_PASSWORD"),
+        sf_security_token=os.getenv("SF_SECURITY_TOKEN"),
+        sf_token_url=os.getenv("SF_TOKEN_URL"),
+        dashboard_host=os.getenv("DASHBOARD_HOST", "localhost"),
+        dashboard_port=int(os.getenv("DASHBOARD_PORT", "8501")),
+        dashboard_title=os.getenv("DASHBOARD_TITLE", "Lead Validation Dashboard"),
+        validation_rules_strict=os.getenv("VALIDATION_RULES_STRICT", "true").lower() == "true",
+        compliance_checks_enabled=os.getenv("COMPLIANCE_CHECKS_ENABLED", "true").lower() == "true",
+        data_retention_days=int(os.getenv("DATA_RETENTION_DAYS", "90")),
+        duplicate_threshold=float(os.getenv("DUPLICATE_THRESHOLD", "0.85")),
+        min_completeness_score=float(os.getenv("MIN_COMPLETENESS_SCORE", "0.7")),
+        clearbit_api_key=os.getenv("CLEARBIT_API_KEY"),
+        zerobounce_api_key=os.getenv("ZEROBOUNCE_API_KEY"),
+        log_level=os.getenv("LOG_LEVEL", "INFO"),
+        log_file=os.getenv("LOG_FILE", str(LOGS_DIR / "validation.log")),
+    )
+
 
-# Ensure directories exist
-DATA_DIR.mkdir(exist_ok=True)
-LOGS_DIR.mkdir(exist_ok=True)
-REPORTS_DIR.mkdir(exist_ok=True)
+SETTINGS = get_settings()
 
+# Module-level aliases kept for existing importers
 # DuckDB Configuration
-DUCKDB_PATH = os.getenv("DUCKDB_PATH", str(DATA_DIR / "leads.duckdb"))
-DUCKDB_MEMORY_LIMIT = os.getenv("DUCKDB_MEMORY_LIMIT", "2GB")
+DUCKDB_PATH = SETTINGS.duckdb_path
+DUCKDB_MEMORY_LIMIT = SETTINGS.duckdb_memory_limit
+CACHE_SIZE_MB = SETTINGS.cache_size_mb
 
 # Salesforce Configuration
-SF_CLIENT_ID = os.getenv("SF_CLIENT_ID")
-SF_CLIENT_SECRET = os.getenv("SF_CLIENT_SECRET")
-SF_USERNAME = os.getenv("SF_USERNAME")
-SF_PASSWORD = os.getenv("SF_PASSWORD")
-SF_SECURITY_TOKEN = os.getenv("SF_SECURITY_TOKEN")
-SF_TOKEN_URL = os.getenv("SF_TOKEN_URL")
+SF_CLIENT_ID = SETTINGS.sf_client_id
+SF_CLIENT_SECRET = SETTINGS.sf_client_secret
+SF_USERNAME = SETTINGS.sf_username
+SF_PASSWORD = SETTINGS.sf_password
+SF_SECURITY_TOKEN = SETTINGS.sf_security_token
+SF_TOKEN_URL = SETTINGS.sf_token_url
 
 # Dashboard Configuration
-DASHBOARD_HOST = os.getenv("DASHBOARD_HOST", "localhost")
-DASHBOARD_PORT = int(os.getenv("DASHBOARD_PORT", "8501"))
-DASHBOARD_TITLE = os.getenv("DASHBOARD_TITLE", "Lead Validation Dashboard")
+DASHBOARD_HOST = SETTINGS.dashboard_host
+DASHBOARD_PORT = SETTINGS.dashboard_port
+DASHBOARD_TITLE = SETTINGS.dashboard_title
 
 # Validation Configuration
-VALIDATION_RULES_STRICT = os.getenv("VALIDATION_RULES_STRICT", "true").lower() == "true"
-COMPLIANCE_CHECKS_ENABLED = os.getenv("COMPLIANCE_CHECKS_ENABLED", "true").lower() == "true"
-DATA_RETENTION_DAYS = int(os.getenv("DATA_RETENTION_DAYS", "90"))
-DUPLICATE_THRESHOLD = float(os.getenv("DUPLICATE_THRESHOLD", "0.85"))
-MIN_COMPLETENESS_SCORE = float(os.getenv("MIN_COMPLETENESS_SCORE", "0.7"))
+VALIDATION_RULES_STRICT = SETTINGS.validation_rules_strict
+COMPLIANCE_CHECKS_ENABLED = SETTINGS.compliance_checks_enabled
+DATA_RETENTION_DAYS = SETTINGS.data_retention_days
+DUPLICATE_THRESHOLD = SETTINGS.duplicate_threshold
+MIN_COMPLETENESS_SCORE = SETTINGS.min_completeness_score
 
 # External Services
-CLEARBIT_API_KEY = os.getenv("CLEARBIT_API_KEY")
-ZEROBOUNCE_API_KEY = os.getenv("ZEROBOUNCE_API_KEY")
+CLEARBIT_API_KEY = SETTINGS.clearbit_api_key
+ZEROBOUNCE_API_KEY = SETTINGS.zerobounce_api_key
 
 # Logging Configuration
-LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO")
-LOG_FILE = os.getenv("LOG_FILE", str(LOGS_DIR / "validation.log"))
+LOG_LEVEL = SETTINGS.log_level
+LOG_FILE = SETTINGS.log_file
 
 # Required Lead Fields for Validation
 REQUIRED_FIELDS = [
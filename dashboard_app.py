@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""
+Single Streamlit entrypoint for all Lead Validation dashboards.
+
+One interpreter serves every page, so pandas, plotly and the DuckDB
+connection are loaded once per process instead of once per dashboard.
+
+Usage:
+    streamlit run dashboard_app.py
+
+    Or open on a specific page:
+    streamlit run dashboard_app.py -- --page=daily_fake_leads
+"""
+
+import sys
+from pathlib import Path
+
+import streamlit as st
+
+DASHBOARD_DIR = Path(__file__).parent / "src" / "dashboard"
+
+# Page key -> (script, title, icon)
+PAGES = {
+    "simplified": ("simplified_dashboard.py", "Simplified Report", "📊"),
+    "daily_fake_leads": ("daily_fake_leads_report.py", "Fake Leads Report", "🚨"),
+    "validation": ("validation_dashboard.py", "Validation Dashboard", "✅"),
+}
+DEFAULT_PAGE = "simplified"
+
+
+def requested_page(argv) -> str:
+    """Return the page key given as --page=<key>, or the default page."""
+    for i, arg in enumerate(argv):
+        if arg.startswith("--page="):
+            key = arg.split("=", 1)[1]
+        elif arg == "--page" and i + 1 < len(argv):
+            key = argv[i + 1]
+        else:
+            continue
+
+        if key in PAGES:
+            return key
+
+    return DEFAULT_PAGE
+
+
+def main():
+    """Register the dashboards as pages and run the selected one."""
+    default_key = requested_page(sys.argv[1:])
+    pages = [
+        st.Page(
+            str(DASHBOARD_DIR / script),
+            title=title,
+            icon=icon,
+            url_path=key,
+            default=key == default_key
+        )
+        for key, (script, title, icon) in PAGES.items()
+    ]
+    st.navigation(pages).run()
+
+
+main()
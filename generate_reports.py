@@ -4,114 +4,58 @@ Lead Validation Report Generator
 Generates comprehensive PDF reports from validation data
 """
 
+from __future__ import annotations
+
 import os
 import sys
 import argparse
+import gzip
+import time
 from datetime import datetime, timedelta
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Any
-import pandas as pd
+from typing import TYPE_CHECKING, Dict, Any, List, Optional
 import logging
-from jinja2 import Template
 
 # Add project root to path for imports
 project_root = Path(__file__).parent
 sys.path.append(str(project_root))
 
-from src.dashboard.data_loader import (
-    load_validation_metrics, load_validation_summary, load_validation_by_source,
-    load_validation_trends, load_problematic_leads, load_conversion_analysis
-)
-from config.settings import REPORTS_DIR
+from config.settings import get_settings, ensure_dirs
 
+# pandas, jinja2 and the DuckDB-backed loaders are imported on first use so
+# that `--help` and plain imports of this module stay fast
+if TYPE_CHECKING:
+    import pandas as pd
+    from jinja2 import Environment
+    from jinja2.environment import TemplateStream
 
-class LeadValidationReporter:
-    """Generate lead validation reports."""
-    
-    def __init__(self):
-        self.logger = logging.getLogger(__name__)
-        logging.basicConfig(level=logging.INFO)
-        
-    def generate_comprehensive_report(self) -> str:
-        """Generate comprehensive validation report."""
-        try:
-            self.logger.info("📊 Generating comprehensive validation report...")
-            
-            # Load all data
-            metrics_data = load_validation_metrics()
-            summary_data = load_validation_summary()
-            source_data = load_validation_by_source()
-            trends_data = load_validation_trends()
-            problematic_data = load_problematic_leads()
-            conversion_data = load_conversion_analysis()
-            
-            if metrics_data.empty:
-                raise Exception("No validation data available")
-            
-            # Generate report
-            report_content = self._create_comprehensive_html(
-                metrics_data.iloc[0],
-                summary_data,
-                source_data,
-                trends_data,
-                problematic_data,
-                conversion_data
-            )
-            
-            # Save report
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            report_filename = f"lead_validation_comprehensive_{timestamp}.html"
-            report_path = REPORTS_DIR / report_filename
-            
-            with open(report_path, 'w', encoding='utf-8') as f:
-                f.write(report_content)
-            
-            self.logger.info(f"✅ Report generated: {report_path}")
-            return str(report_path)
-            
-        except Exception as e:
-            self.logger.error(f"❌ Report generation failed: {e}")
-            raise
-    
-    def generate_compliance_report(self) -> str:
-        """Generate compliance-focused report."""
-        try:
-            self.logger.info("📋 Generating compliance report...")
-            
-            # Load compliance-related data
-            metrics_data = load_validation_metrics()
-            problematic_data = load_problematic_leads()
-            
-            if metrics_data.empty:
-                raise Exception("No validation data available")
-            
-            # Generate compliance report
-            report_content = self._create_compliance_html(
-                metrics_data.iloc[0],
-                problematic_data
-            )
-            
-            # Save report
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            report_filename = f"lead_validation_compliance_{timestamp}.html"
-            report_path = REPORTS_DIR / report_filename
-            
-            with open(report_path, 'w', encoding='utf-8') as f:
-                f.write(report_content)
-            
-            self.logger.info(f"✅ Compliance report generated: {report_path}")
-            return str(report_path)
-            
-        except Exception as e:
-            self.logger.error(f"❌ Compliance report generation failed: {e}")
-            raise
-    
-    def _create_comprehensive_html(self, metrics: pd.Series, summary_df: pd.DataFrame, 
-                                 source_df: pd.DataFrame, trends_df: pd.DataFrame,
-                                 problematic_df: pd.DataFrame, conversion_df: pd.DataFrame) -> str:
-        """Create comprehensive HTML report."""
-        
-        template_str = """
+REPORTS_DIR = get_settings().reports_dir
+DATA_RETENTION_DAYS = get_settings().data_retention_days
+
+# Reports are streamed to disk through a 128 KiB write buffer
+REPORT_WRITE_BUFFER = 1 << 17
+
+REPORT_DATE_FORMAT = '%B %d, %Y at %I:%M %p'
+
+# Datasets (load_all_report_data names) each report renders
+COMPREHENSIVE_REPORT_DATA = ['metrics', 'by_source', 'problematic']
+COMPLIANCE_REPORT_DATA = ['metrics', 'problematic']
+
+
+# Layout and table styles shared by both reports (prepended to each <style>)
+_BASE_CSS = """\
+        body { font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif; line-height: 1.6; margin: 0; padding: 20px; background-color: #f8f9fa; }
+        .container { max-width: 1200px; margin: 0 auto; background: white; padding: 30px; border-radius: 8px; box-shadow: 0 4px 6px rgba(0,0,0,0.1); }
+        .header { text-align: center; margin-bottom: 40px; padding-bottom: 20px; border-bottom: 3px solid #3498db; }
+        .header h1 { color: #2c3e50; font-size: 2.5em; margin: 0; }
+        .section h2 { color: #2c3e50; border-bottom: 2px solid #3498db; padding-bottom: 10px; }
+        .table { width: 100%; border-collapse: collapse; margin-bottom: 20px; }
+        .table th, .table td { padding: 12px; text-align: left; border-bottom: 1px solid #ddd; }
+        .table th { background-color: #f8f9fa; font-weight: bold; }
+"""
+
+_COMPREHENSIVE_TEMPLATE_STR = """
 <!DOCTYPE html>
 <html lang="en">
 <head>
@@ -119,32 +63,7 @@ class LeadValidationReporter:
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
     <title>Lead Validation Report - {{ report_date }}</title>
     <style>
-        body {
-            font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
-            line-height: 1.6;
-            margin: 0;
-            padding: 20px;
-            background-color: #f8f9fa;
-        }
-        .container {
-            max-width: 1200px;
-            margin: 0 auto;
-            background: white;
-            padding: 30px;
-            border-radius: 8px;
-            box-shadow: 0 4px 6px rgba(0,0,0,0.1);
-        }
-        .header {
-            text-align: center;
-            margin-bottom: 40px;
-            padding-bottom: 20px;
-            border-bottom: 3px solid #3498db;
-        }
-        .header h1 {
-            color: #2c3e50;
-            font-size: 2.5em;
-            margin: 0;
-        }
+""" + _BASE_CSS + """\
         .header .subtitle {
             color: #7f8c8d;
             font-size: 1.2em;
@@ -176,25 +95,9 @@ class LeadValidationReporter:
             margin-bottom: 40px;
         }
         .section h2 {
-            color: #2c3e50;
-            border-bottom: 2px solid #3498db;
-            padding-bottom: 10px;
-            margin-bottom: 20px;
-        }
-        .table {
-            width: 100%;
-            border-collapse: collapse;
             margin-bottom: 20px;
         }
-        .table th,
-        .table td {
-            padding: 12px;
-            text-align: left;
-            border-bottom: 1px solid #ddd;
-        }
         .table th {
-            background-color: #f8f9fa;
-            font-weight: bold;
             color: #2c3e50;
         }
         .table tr:hover {
@@ -243,19 +146,19 @@ class LeadValidationReporter:
 
         <div class="metrics-grid">
             <div class="metric-card">
-                <div class="metric-value">{{ "{:,}".format(metrics.total_leads) }}</div>
+                <div class="metric-value">{{ fmt.total_leads }}</div>
                 <div class="metric-label">Total Leads</div>
             </div>
             <div class="metric-card">
-                <div class="metric-value">{{ "{:.3f}".format(metrics.avg_overall_score) }}</div>
+                <div class="metric-value">{{ fmt.avg_overall_score }}</div>
                 <div class="metric-label">Avg Quality Score</div>
             </div>
             <div class="metric-card">
-                <div class="metric-value">{{ "{:.1f}%".format(metrics.quality_leads_percentage) }}</div>
+                <div class="metric-value">{{ fmt.quality_leads_percentage }}</div>
                 <div class="metric-label">Quality Leads</div>
             </div>
             <div class="metric-card">
-                <div class="metric-value">{{ "{:.1f}%".format(metrics.conversion_rate_percentage) }}</div>
+                <div class="metric-value">{{ fmt.conversion_rate_percentage }}</div>
                 <div class="metric-label">Conversion Rate</div>
             </div>
         </div>
@@ -265,15 +168,15 @@ class LeadValidationReporter:
             {% set quality_percentage = metrics.quality_leads_percentage %}
             {% if quality_percentage >= 80 %}
                 <div class="alert alert-success">
-                    ✅ <strong>Excellent:</strong> High percentage of quality leads ({{ "{:.1f}%".format(quality_percentage) }})!
+                    ✅ <strong>Excellent:</strong> High percentage of quality leads ({{ fmt.quality_leads_percentage }})!
                 </div>
             {% elif quality_percentage >= 60 %}
                 <div class="alert alert-warning">
-                    ⚠️ <strong>Moderate:</strong> Consider improving lead quality processes ({{ "{:.1f}%".format(quality_percentage) }}).
+                    ⚠️ <strong>Moderate:</strong> Consider improving lead quality processes ({{ fmt.quality_leads_percentage }}).
                 </div>
             {% else %}
                 <div class="alert alert-danger">
-                    🚨 <strong>Action Required:</strong> Low lead quality detected ({{ "{:.1f}%".format(quality_percentage) }})!
+                    🚨 <strong>Action Required:</strong> Low lead quality detected ({{ fmt.quality_leads_percentage }})!
                 </div>
             {% endif %}
             
@@ -288,28 +191,28 @@ class LeadValidationReporter:
                 <tbody>
                     <tr>
                         <td><span class="quality-excellent">Excellent (0.9-1.0)</span></td>
-                        <td>{{ "{:,}".format(metrics.excellent_count) }}</td>
-                        <td>{{ "{:.1f}%".format(metrics.excellent_percentage) }}</td>
+                        <td>{{ fmt.excellent_count }}</td>
+                        <td>{{ fmt.excellent_percentage }}</td>
                     </tr>
                     <tr>
                         <td><span class="quality-good">Good (0.8-0.9)</span></td>
-                        <td>{{ "{:,}".format(metrics.good_count) }}</td>
-                        <td>{{ "{:.1f}%".format(metrics.good_percentage) }}</td>
+                        <td>{{ fmt.good_count }}</td>
+                        <td>{{ fmt.good_percentage }}</td>
                     </tr>
                     <tr>
                         <td><span class="quality-fair">Fair (0.6-0.8)</span></td>
-                        <td>{{ "{:,}".format(metrics.fair_count) }}</td>
-                        <td>{{ "{:.1f}%".format(metrics.fair_percentage) }}</td>
+                        <td>{{ fmt.fair_count }}</td>
+                        <td>{{ fmt.fair_percentage }}</td>
                     </tr>
                     <tr>
                         <td><span class="quality-poor">Poor (0.4-0.6)</span></td>
-                        <td>{{ "{:,}".format(metrics.poor_count) }}</td>
-                        <td>{{ "{:.1f}%".format(metrics.poor_percentage) }}</td>
+                        <td>{{ fmt.poor_count }}</td>
+                        <td>{{ fmt.poor_percentage }}</td>
                     </tr>
                     <tr>
                         <td><span class="quality-invalid">Invalid (0.0-0.4)</span></td>
-                        <td>{{ "{:,}".format(metrics.invalid_count) }}</td>
-                        <td>{{ "{:.1f}%".format(metrics.invalid_percentage) }}</td>
+                        <td>{{ fmt.invalid_count }}</td>
+                        <td>{{ fmt.invalid_percentage }}</td>
                     </tr>
                 </tbody>
             </table>
@@ -329,7 +232,7 @@ class LeadValidationReporter:
                     </tr>
                 </thead>
                 <tbody>
-                    {% for _, source in source_df.head(10).iterrows() %}
+                    {% for source in source_rows %}
                     <tr>
                         <td>{{ source.lead_source }}</td>
                         <td>{{ "{:,}".format(source.total_leads) }}</td>
@@ -346,7 +249,7 @@ class LeadValidationReporter:
         {% if not problematic_df.empty %}
         <div class="section">
             <h2>🚨 Problematic Leads (Score < 0.6)</h2>
-            <p><strong>{{ "{:,}".format(problematic_df|length) }}</strong> leads require attention:</p>
+            <p><strong>{{ "{:,}".format(problematic_count) }}</strong> leads require attention:</p>
             <table class="table">
                 <thead>
                     <tr>
@@ -359,20 +262,20 @@ class LeadValidationReporter:
                     </tr>
                 </thead>
                 <tbody>
-                    {% for _, lead in problematic_df.head(20).iterrows() %}
+                    {% for lead in problematic_rows %}
                     <tr>
                         <td>{{ lead.lead_id|truncate(15) }}</td>
                         <td>{{ "{:.3f}".format(lead.overall_score) }}</td>
-                        <td>{{ (lead.first_name or "") + " " + (lead.last_name or "") }}</td>
-                        <td>{{ lead.company or "N/A" }}</td>
+                        <td>{{ lead.full_name }}</td>
+                        <td>{{ lead.company }}</td>
                         <td>{{ lead.email or "N/A" }}</td>
                         <td>{{ lead.lead_source or "Unknown" }}</td>
                     </tr>
                     {% endfor %}
                 </tbody>
             </table>
-            {% if problematic_df|length > 20 %}
-            <p><em>... and {{ "{:,}".format(problematic_df|length - 20) }} more leads</em></p>
+            {% if problematic_extra > 0 %}
+            <p><em>... and {{ "{:,}".format(problematic_extra) }} more leads</em></p>
             {% endif %}
         </div>
         {% endif %}
@@ -390,12 +293,12 @@ class LeadValidationReporter:
                     {% endif %}
                 </li>
                 <li><strong>Conversion Performance:</strong> 
-                    {{ "{:.1f}%".format(metrics.conversion_rate_percentage) }} overall conversion rate
+                    {{ fmt.conversion_rate_percentage }} overall conversion rate
                 </li>
                 <li><strong>Data Freshness:</strong> {{ metrics.data_freshness_status }}</li>
                 {% if not source_df.empty %}
-                <li><strong>Best Performing Source:</strong> {{ source_df.iloc[0].lead_source }} 
-                    ({{ "{:.3f}".format(source_df.iloc[0].avg_score) }} avg score)</li>
+                <li><strong>Best Performing Source:</strong> {{ source_rows[0].lead_source }} 
+                    ({{ "{:.3f}".format(source_rows[0].avg_score) }} avg score)</li>
                 {% endif %}
             </ul>
         </div>
@@ -403,27 +306,15 @@ class LeadValidationReporter:
         <div class="footer">
             <p>Generated by Lead Validation Reporting System<br>
             Report Date: {{ report_date }}<br>
-            Data Period: {{ metrics.earliest_lead_date.strftime('%Y-%m-%d') if metrics.earliest_lead_date else 'N/A' }} 
-            to {{ metrics.latest_lead_date.strftime('%Y-%m-%d') if metrics.latest_lead_date else 'N/A' }}</p>
+            Data Period: {{ period_start }} 
+            to {{ period_end }}</p>
         </div>
     </div>
 </body>
 </html>
-        """
-        
-        template = Template(template_str)
-        
-        return template.render(
-            report_date=datetime.now().strftime('%B %d, %Y at %I:%M %p'),
-            metrics=metrics,
-            source_df=source_df,
-            problematic_df=problematic_df
-        )
-    
-    def _create_compliance_html(self, metrics: pd.Series, problematic_df: pd.DataFrame) -> str:
-        """Create compliance-focused HTML report."""
-        
-        template_str = """
+"""
+
+_COMPLIANCE_TEMPLATE_STR = """
 <!DOCTYPE html>
 <html lang="en">
 <head>
@@ -431,18 +322,14 @@ class LeadValidationReporter:
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
     <title>Lead Compliance Report - {{ report_date }}</title>
     <style>
-        body { font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif; line-height: 1.6; margin: 0; padding: 20px; background-color: #f8f9fa; }
-        .container { max-width: 1000px; margin: 0 auto; background: white; padding: 30px; border-radius: 8px; box-shadow: 0 4px 6px rgba(0,0,0,0.1); }
-        .header { text-align: center; margin-bottom: 40px; padding-bottom: 20px; border-bottom: 3px solid #dc3545; }
-        .header h1 { color: #2c3e50; font-size: 2.5em; margin: 0; }
+""" + _BASE_CSS + """\
+        .container { max-width: 1000px; }
+        .header { border-bottom-color: #dc3545; }
         .compliance-status { padding: 20px; border-radius: 8px; margin-bottom: 30px; text-align: center; font-size: 1.2em; }
         .compliant { background-color: #d4edda; color: #155724; border: 2px solid #28a745; }
         .non-compliant { background-color: #f8d7da; color: #721c24; border: 2px solid #dc3545; }
-        .table { width: 100%; border-collapse: collapse; margin-bottom: 20px; }
-        .table th, .table td { padding: 12px; text-align: left; border-bottom: 1px solid #ddd; }
-        .table th { background-color: #f8f9fa; font-weight: bold; }
         .section { margin-bottom: 30px; }
-        .section h2 { color: #2c3e50; border-bottom: 2px solid #dc3545; padding-bottom: 10px; }
+        .section h2 { border-bottom-color: #dc3545; }
     </style>
 </head>
 <body>
@@ -454,32 +341,32 @@ class LeadValidationReporter:
 
         <div class="compliance-status {% if metrics.quality_leads_percentage >= 70 %}compliant{% else %}non-compliant{% endif %}">
             {% if metrics.quality_leads_percentage >= 70 %}
-                ✅ <strong>COMPLIANT:</strong> {{ "{:.1f}%".format(metrics.quality_leads_percentage) }} of leads meet quality standards
+                ✅ <strong>COMPLIANT:</strong> {{ fmt.quality_leads_percentage }} of leads meet quality standards
             {% else %}
-                ⚠️ <strong>NON-COMPLIANT:</strong> Only {{ "{:.1f}%".format(metrics.quality_leads_percentage) }} of leads meet quality standards
+                ⚠️ <strong>NON-COMPLIANT:</strong> Only {{ fmt.quality_leads_percentage }} of leads meet quality standards
             {% endif %}
         </div>
 
         <div class="section">
             <h2>🎯 Compliance Metrics</h2>
             <table class="table">
-                <tr><td><strong>Total Leads Processed</strong></td><td>{{ "{:,}".format(metrics.total_leads) }}</td></tr>
-                <tr><td><strong>Quality Leads (Score ≥ 0.8)</strong></td><td>{{ "{:,}".format(metrics.excellent_count + metrics.good_count) }} ({{ "{:.1f}%".format(metrics.quality_leads_percentage) }})</td></tr>
-                <tr><td><strong>Non-Compliant Leads (Score < 0.6)</strong></td><td>{{ "{:,}".format(metrics.poor_count + metrics.invalid_count) }} ({{ "{:.1f}%".format(metrics.poor_percentage + metrics.invalid_percentage) }})</td></tr>
-                <tr><td><strong>Average Quality Score</strong></td><td>{{ "{:.3f}".format(metrics.avg_overall_score) }}</td></tr>
+                <tr><td><strong>Total Leads Processed</strong></td><td>{{ fmt.total_leads }}</td></tr>
+                <tr><td><strong>Quality Leads (Score ≥ 0.8)</strong></td><td>{{ fmt.quality_count }} ({{ fmt.quality_leads_percentage }})</td></tr>
+                <tr><td><strong>Non-Compliant Leads (Score < 0.6)</strong></td><td>{{ fmt.non_compliant_count }} ({{ fmt.non_compliant_percentage }})</td></tr>
+                <tr><td><strong>Average Quality Score</strong></td><td>{{ fmt.avg_overall_score }}</td></tr>
             </table>
         </div>
 
         {% if not problematic_df.empty %}
         <div class="section">
             <h2>🚨 Non-Compliant Leads Requiring Review</h2>
-            <p><strong>{{ "{:,}".format(problematic_df|length) }}</strong> leads below compliance threshold:</p>
+            <p><strong>{{ "{:,}".format(problematic_count) }}</strong> leads below compliance threshold:</p>
             <table class="table">
                 <thead>
                     <tr><th>Lead ID</th><th>Quality Score</th><th>Status</th><th>Issues</th></tr>
                 </thead>
                 <tbody>
-                    {% for _, lead in problematic_df.head(50).iterrows() %}
+                    {% for lead in problematic_rows %}
                     <tr>
                         <td>{{ lead.lead_id|truncate(15) }}</td>
                         <td>{{ "{:.3f}".format(lead.overall_score) }}</td>
@@ -507,14 +394,231 @@ class LeadValidationReporter:
     </div>
 </body>
 </html>
+"""
+
+
+@lru_cache(maxsize=1)
+def _get_environment() -> Environment:
+    """Build the template environment on first use; it compiles each template once."""
+    from jinja2 import DictLoader, Environment
+    
+    return Environment(
+        loader=DictLoader({
+            'comprehensive.html': _COMPREHENSIVE_TEMPLATE_STR,
+            'compliance.html': _COMPLIANCE_TEMPLATE_STR,
+        }),
+        autoescape=True,
+        auto_reload=False,
+        keep_trailing_newline=True,
+        trim_blocks=True,
+        lstrip_blocks=True
+    )
+
+
+def _format_metrics(metrics: pd.Series) -> Dict[str, str]:
+    """Format the headline metrics once so the templates only slot in strings."""
+    fmt = {name: f"{metrics[name]:,}" for name in (
+        'total_leads', 'excellent_count', 'good_count', 'fair_count', 'poor_count', 'invalid_count'
+    )}
+    fmt.update({name: f"{metrics[name]:.1f}%" for name in (
+        'quality_leads_percentage', 'conversion_rate_percentage', 'excellent_percentage',
+        'good_percentage', 'fair_percentage', 'poor_percentage', 'invalid_percentage'
+    )})
+    fmt['avg_overall_score'] = f"{metrics['avg_overall_score']:.3f}"
+    fmt['quality_count'] = f"{metrics['excellent_count'] + metrics['good_count']:,}"
+    fmt['non_compliant_count'] = f"{metrics['poor_count'] + metrics['invalid_count']:,}"
+    fmt['non_compliant_percentage'] = f"{metrics['poor_percentage'] + metrics['invalid_percentage']:.1f}%"
+    return fmt
+
+
+def _format_period_date(value) -> str:
+    """Format a data-period bound for the report footer."""
+    import pandas as pd
+    
+    return value.strftime('%Y-%m-%d') if pd.notna(value) and value else 'N/A'
+
+
+def write_report(report_stream: TemplateStream, report_path: Path, compress: bool = False):
+    """Stream a rendered report to disk, removing the partial file if rendering fails.
+    
+    Compressed reports use gzip level 1, which is cheap to write and still
+    shrinks the repetitive HTML several times over.
+    """
+    try:
+        if compress:
+            with gzip.open(report_path, 'wt', encoding='utf-8', compresslevel=1) as f:
+                report_stream.dump(f)
+        else:
+            with report_path.open('w', encoding='utf-8', buffering=REPORT_WRITE_BUFFER) as f:
+                report_stream.dump(f)
+    except Exception:
+        report_path.unlink(missing_ok=True)
+        raise
+
+
+def purge_old_reports(days: int = DATA_RETENTION_DAYS) -> int:
+    """Delete generated reports older than the retention window.
+    
+    Only lead_validation_* report files are considered; ETL backups in the
+    same directory are left alone. Returns the number of files removed.
+    """
+    if not REPORTS_DIR.exists():
+        return 0
+    
+    cutoff = time.time() - days * 86400
+    removed = 0
+    
+    # scandir returns the directory entries with their stat info in one pass
+    with os.scandir(REPORTS_DIR) as entries:
+        for entry in entries:
+            if (entry.name.startswith('lead_validation_')
+                    and entry.name.endswith(('.html', '.html.gz'))
+                    and entry.is_file()
+                    and entry.stat().st_mtime < cutoff):
+                os.unlink(entry.path)
+                removed += 1
+    
+    return removed
+
+
+class LeadValidationReporter:
+    """Generate lead validation reports."""
+    
+    def __init__(self, compress: bool = False):
+        ensure_dirs()
+        self.compress = compress
+        self.report_suffix = ".html.gz" if compress else ".html"
+        self.logger = logging.getLogger(__name__)
+        logging.basicConfig(level=logging.INFO)
+        
+    def generate_comprehensive_report(self, data: Optional[Dict[str, pd.DataFrame]] = None) -> str:
+        """Generate comprehensive validation report.
+        
+        Pass data already loaded with load_all_report_data() to skip the queries.
+        """
+        try:
+            self.logger.info("📊 Generating comprehensive validation report...")
+            
+            if data is None:
+                from src.dashboard.data_loader import load_all_report_data
+                
+                # Load the datasets the report renders over a single connection
+                data = load_all_report_data(report_names=COMPREHENSIVE_REPORT_DATA)
+            metrics_data = data['metrics']
+            source_data = data['by_source']
+            problematic_data = data['problematic']
+            
+            if metrics_data.empty:
+                raise Exception("No validation data available")
+            
+            # Generate report
+            generated_at = datetime.now()
+            report_stream = self._create_comprehensive_html(
+                metrics_data.iloc[0],
+                source_data,
+                problematic_data,
+                generated_at
+            )
+            
+            # Save report
+            timestamp = generated_at.strftime("%Y%m%d_%H%M%S")
+            report_filename = f"lead_validation_comprehensive_{timestamp}{self.report_suffix}"
+            report_path = REPORTS_DIR / report_filename
+            
+            write_report(report_stream, report_path, self.compress)
+            
+            self.logger.info(f"✅ Report generated: {report_path}")
+            return str(report_path)
+            
+        except Exception as e:
+            self.logger.error(f"❌ Report generation failed: {e}")
+            raise
+    
+    def generate_compliance_report(self, data: Optional[Dict[str, pd.DataFrame]] = None) -> str:
+        """Generate compliance-focused report.
+        
+        Pass data already loaded with load_all_report_data() to skip the queries.
         """
+        try:
+            self.logger.info("📋 Generating compliance report...")
+            
+            if data is None:
+                from src.dashboard.data_loader import load_all_report_data
+                
+                # Load compliance-related data
+                data = load_all_report_data(report_names=COMPLIANCE_REPORT_DATA)
+            metrics_data = data['metrics']
+            problematic_data = data['problematic']
+            
+            if metrics_data.empty:
+                raise Exception("No validation data available")
+            
+            # Generate compliance report
+            generated_at = datetime.now()
+            report_stream = self._create_compliance_html(
+                metrics_data.iloc[0],
+                problematic_data,
+                generated_at
+            )
+            
+            # Save report
+            timestamp = generated_at.strftime("%Y%m%d_%H%M%S")
+            report_filename = f"lead_validation_compliance_{timestamp}{self.report_suffix}"
+            report_path = REPORTS_DIR / report_filename
+            
+            write_report(report_stream, report_path, self.compress)
+            
+            self.logger.info(f"✅ Compliance report generated: {report_path}")
+            return str(report_path)
+            
+        except Exception as e:
+            self.logger.error(f"❌ Compliance report generation failed: {e}")
+            raise
+    
+    def generate_all_reports(self) -> List[str]:
+        """Generate the comprehensive and compliance reports from one data load."""
+        from src.dashboard.data_loader import load_all_report_data
+        
+        report_names = list(dict.fromkeys(COMPREHENSIVE_REPORT_DATA + COMPLIANCE_REPORT_DATA))
+        data = load_all_report_data(report_names=report_names)
         
-        template = Template(template_str)
+        return [
+            self.generate_comprehensive_report(data),
+            self.generate_compliance_report(data)
+        ]
+    
+    def _create_comprehensive_html(self, metrics: pd.Series, source_df: pd.DataFrame,
+                                 problematic_df: pd.DataFrame,
+                                 generated_at: Optional[datetime] = None) -> TemplateStream:
+        """Create comprehensive HTML report as a stream to be dumped to file."""
+        generated_at = generated_at or datetime.now()
         
-        return template.render(
-            report_date=datetime.now().strftime('%B %d, %Y at %I:%M %p'),
+        return _get_environment().get_template('comprehensive.html').stream(
+            report_date=generated_at.strftime(REPORT_DATE_FORMAT),
+            period_start=_format_period_date(metrics.get('earliest_lead_date')),
+            period_end=_format_period_date(metrics.get('latest_lead_date')),
             metrics=metrics,
-            problematic_df=problematic_df
+            fmt=_format_metrics(metrics),
+            source_df=source_df,
+            source_rows=source_df.head(10).to_dict('records'),
+            problematic_df=problematic_df,
+            problematic_rows=problematic_df.head(20).to_dict('records'),
+            problematic_count=len(problematic_df),
+            problematic_extra=max(len(problematic_df) - 20, 0)
+        )
+    
+    def _create_compliance_html(self, metrics: pd.Series, problematic_df: pd.DataFrame,
+                               generated_at: Optional[datetime] = None) -> TemplateStream:
+        """Create compliance-focused HTML report as a stream to be dumped to file."""
+        generated_at = generated_at or datetime.now()
+        
+        return _get_environment().get_template('compliance.html').stream(
+            report_date=generated_at.strftime(REPORT_DATE_FORMAT),
+            metrics=metrics,
+            fmt=_format_metrics(metrics),
+            problematic_df=problematic_df,
+            problematic_rows=problematic_df.head(50).to_dict('records'),
+            problematic_count=len(problematic_df)
         )
 
 
@@ -523,22 +627,34 @@ def main():
     parser = argparse.ArgumentParser(description="Lead Validation Report Generator")
     parser.add_argument(
         "--report-type",
-        choices=["comprehensive", "compliance"],
+        choices=["comprehensive", "compliance", "both"],
         default="comprehensive",
         help="Type of report to generate"
     )
+    parser.add_argument(
+        "--compress",
+        action="store_true",
+        help="Write the report gzip-compressed (.html.gz)"
+    )
     
     args = parser.parse_args()
     
-    reporter = LeadValidationReporter()
+    reporter = LeadValidationReporter(compress=args.compress)
+    
+    removed = purge_old_reports()
+    if removed:
+        print(f"🗑️ Removed {removed} reports older than {DATA_RETENTION_DAYS} days")
     
     try:
-        if args.report_type == "comprehensive":
-            report_path = reporter.generate_comprehensive_report()
+        if args.report_type == "both":
+            report_paths = reporter.generate_all_reports()
+        elif args.report_type == "comprehensive":
+            report_paths = [reporter.generate_comprehensive_report()]
         else:
-            report_path = reporter.generate_compliance_report()
+            report_paths = [reporter.generate_compliance_report()]
         
-        print(f"✅ Report generated successfully: {report_path}")
+        for report_path in report_paths:
+            print(f"✅ Report generated successfully: {report_path}")
         
     except Exception as e:
         print(f"❌ Report generation failed: {e}")
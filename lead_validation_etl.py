@@ -8,12 +8,21 @@ import os
 import sys
 import argparse
 import logging
+import re
+import threading
+import time
 import requests
-from datetime import datetime, timedelta
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from datetime import datetime
 from pathlib import Path
 from typing import Optional, Dict, Any, List
+import numpy as np
 import pandas as pd
-import duckdb
+import pyarrow as pa
+import orjson
+from requests.adapters import HTTPAdapter
+from urllib3.util.request import ACCEPT_ENCODING
+from urllib3.util.retry import Retry
 from simple_salesforce import Salesforce
 from dotenv import load_dotenv
 
@@ -23,16 +32,196 @@ sys.path.append(str(project_root))
 
 from config.settings import (
     SF_CLIENT_ID, SF_CLIENT_SECRET, SF_USERNAME, SF_PASSWORD, 
-    SF_SECURITY_TOKEN, DUCKDB_PATH, DATA_RETENTION_DAYS
+    SF_SECURITY_TOKEN, DUCKDB_PATH, DATA_RETENTION_DAYS, ensure_dirs
 )
 from src.utils.validation_parser import ValidationDataParser
+from src.dashboard.data_loader import DuckDBManager, connect_database, refresh_report_tables
+
+# Salesforce sessions last two hours by default; refresh a little before that
+AUTH_TOKEN_TTL_SECONDS = 7000
+
+# Full Task query; {filters} takes the date and/or Id restrictions
+TASK_QUERY = """
+    SELECT Id,
+           WhoId,
+           WhatId,
+           TYPEOF Who
+             WHEN Lead THEN LeadSource, Company, Email
+           END,
+           Subject,
+           Description,
+           CreatedDate,
+           LastModifiedDate
+    FROM Task
+    WHERE Subject LIKE 'Lead Validation%'
+    AND   WhoId IN (SELECT Id FROM Lead)
+    {filters}
+    ORDER BY LastModifiedDate DESC
+"""
+
+# Same tasks without the (large) Description, used to find what changed
+TASK_STUB_QUERY = """
+    SELECT Id, LastModifiedDate
+    FROM Task
+    WHERE Subject LIKE 'Lead Validation%'
+    AND   WhoId IN (SELECT Id FROM Lead)
+    {filters}
+"""
+
+# Task ids per "Id IN (...)" query, keeping the GET URL well under its limit
+SOQL_ID_CHUNK_SIZE = 300
+
+# Stored tasks, renamed back to the Salesforce fields the parser reads
+STORED_TASKS_QUERY = """
+    SELECT task_id AS Id, who_id AS WhoId, what_id AS WhatId, subject AS Subject,
+           description AS Description, lead_source AS LeadSource, lead_company AS Company,
+           lead_email AS Email, created_date AS CreatedDate, last_modified_date AS LastModifiedDate
+    FROM validation_tasks
+"""
+
+# Stored tasks re-parsed per batch in validation-only runs
+REPARSE_BATCH_ROWS = 100000
+
+# validation_tasks columns refreshed when an extracted task already exists
+TASK_UPDATE_COLUMNS = [
+    'who_id', 'what_id', 'subject', 'description', 'lead_source', 'lead_company',
+    'lead_email', 'created_date', 'last_modified_date', 'extracted_at'
+]
+
+# Concurrent requests used to fetch the pages of a Salesforce query
+PAGE_FETCH_WORKERS = 8
+
+# Keep-alive connections held open to Salesforce, shared by all API calls
+HTTP_POOL_SIZE = 16
+
+# Smallest number of tasks worth handing to a separate parser process
+PARSE_CHUNK_MIN_ROWS = 1000
+
+# Columns kept from each Task record, with the Who (Lead) fields flattened in
+TASK_SCHEMA = pa.schema([
+    ('Id', pa.string()),
+    ('WhoId', pa.string()),
+    ('WhatId', pa.string()),
+    ('Subject', pa.string()),
+    ('Description', pa.string()),
+    ('CreatedDate', pa.string()),
+    ('LastModifiedDate', pa.string()),
+    ('LeadSource', pa.string()),
+    ('Company', pa.string()),
+    ('Email', pa.string()),
+])
+
+# Validation insights, aggregated in DuckDB after the data is saved
+INSIGHTS_SCORE_BUCKETS_QUERY = """
+SELECT 
+    CASE 
+        WHEN score >= 9 THEN 'Excellent (9-10)'
+        WHEN score >= 7 THEN 'Good (7-9)'
+        WHEN score >= 5 THEN 'Fair (5-7)'
+        WHEN score >= 3 THEN 'Poor (3-5)'
+        ELSE 'Invalid (0-3)'
+    END as bucket,
+    COUNT(*) as count
+FROM (
+    SELECT COALESCE(api_quality_score, quality_score) as score
+    FROM parsed_validations
+    WHERE parse_error IS NULL
+) scores
+WHERE score IS NOT NULL
+GROUP BY bucket
+ORDER BY MIN(score) DESC
+"""
+
+INSIGHTS_BY_SOURCE_QUERY = """
+SELECT 
+    lead_source,
+    ROUND(AVG(COALESCE(api_quality_score, quality_score)), 2) as avg_quality,
+    ROUND(AVG(api_lead_score), 2) as avg_lead,
+    ROUND(AVG(api_fraud_score), 2) as avg_fraud,
+    COUNT(*) as count
+FROM parsed_validations
+WHERE parse_error IS NULL
+GROUP BY lead_source
+ORDER BY avg_quality DESC NULLS LAST
+LIMIT 10
+"""
+
+INSIGHTS_WORST_SOURCES_QUERY = """
+SELECT 
+    lead_source,
+    ROUND(AVG(COALESCE(api_quality_score, quality_score)), 2) as avg_quality,
+    COUNT(*) as count
+FROM parsed_validations
+WHERE parse_error IS NULL
+GROUP BY lead_source
+ORDER BY avg_quality ASC NULLS LAST
+LIMIT 3
+"""
+
+INSIGHTS_TOTALS_QUERY = """
+SELECT 
+    COUNT(*) FILTER (WHERE parse_error IS NULL),
+    COUNT(*) FILTER (WHERE api_fake_lead),
+    COUNT(*) FILTER (WHERE api_disposable_email),
+    COUNT(*) FILTER (WHERE api_fake_phone)
+FROM parsed_validations
+"""
+
+
+def build_auth_info(access_token: str, instance_url: str) -> Dict[str, Any]:
+    """Bundle a Salesforce token with the query URL and headers every request reuses."""
+    return {
+        'access_token': access_token,
+        'instance_url': instance_url,
+        'expires_at': time.time() + AUTH_TOKEN_TTL_SECONDS,
+        'query_url': instance_url + '/services/data/v58.0/query',
+        'headers': {
+            'Authorization': 'Bearer ' + access_token,
+            'Accept': 'application/json',
+            # Every compression this install can decode (adds br when brotli is present)
+            'Accept-Encoding': ACCEPT_ENCODING
+        }
+    }
+
+
+def upsert_assignments(columns: List[str]) -> str:
+    """Build the SET list of an ON CONFLICT DO UPDATE from the inserted values."""
+    return ', '.join(f"{column} = excluded.{column}" for column in columns)
+
+
+def records_to_batch(records: List[Dict[str, Any]]) -> pa.RecordBatch:
+    """Convert one page of Task records to an Arrow batch.
+    
+    Each page is converted as soon as it arrives, so the raw JSON dicts of a
+    page can be freed before the next one is processed. The polymorphic Who
+    relationship is flattened into the LeadSource, Company and Email columns.
+    """
+    rows = [{**record, **(record.get('Who') or {})} for record in records]
+    return pa.RecordBatch.from_pylist(rows, schema=TASK_SCHEMA)
+
+
+def serialize_api_responses(responses: pd.Series) -> List[str]:
+    """Serialize parsed API responses for storage.
+    
+    Non-empty dicts are encoded with orjson (much faster than json.dumps);
+    other non-empty values are stored as their string form and empty ones
+    as '{}'.
+    """
+    return [
+        orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
+        if isinstance(value, dict) and value
+        else str(value) if value else '{}'
+        for value in responses.to_numpy()
+    ]
 
 
 class LeadValidationETL:
     """Main ETL pipeline for lead validation."""
     
     def __init__(self):
+        ensure_dirs()
         self.auth_info = None
+        self.session = self._create_session()
         self.parser = ValidationDataParser()
         self.db_path = DUCKDB_PATH
         self.results = {
@@ -50,6 +239,21 @@ class LeadValidationETL:
         )
         self.logger = logging.getLogger(__name__)
     
+    @staticmethod
+    def _create_session() -> requests.Session:
+        """Create a keep-alive session that retries throttled or failed calls."""
+        retry = Retry(
+            total=3,
+            backoff_factor=0.3,
+            status_forcelist=[429, 500, 502, 503, 504],
+            raise_on_status=False
+        )
+        adapter = HTTPAdapter(pool_connections=HTTP_POOL_SIZE, pool_maxsize=HTTP_POOL_SIZE, max_retries=retry)
+        session = requests.Session()
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        return session
+    
     def authenticate_salesforce(self) -> bool:
         """Authenticate to Salesforce using OAuth 2.0 Password Flow."""
         try:
@@ -79,14 +283,12 @@ class LeadValidationETL:
             
             # Make authentication request (matching analytics project)
             headers = {'Content-Type': 'application/x-www-form-urlencoded'}
-            response = requests.post(token_url, data=params, headers=headers)
+            response = self.session.post(token_url, data=params, headers=headers)
             
             if response.status_code == 200:
                 token_data = response.json()
-                self.auth_info = {
-                    'access_token': token_data['access_token'],
-                    'instance_url': token_data['instance_url']  # Always use the URL from auth response
-                }
+                # Always use the URL from auth response
+                self.auth_info = build_auth_info(token_data['access_token'], token_data['instance_url'])
                     
                 self.logger.info(f"✅ Successfully authenticated to Salesforce")
                 self.logger.info(f"Instance URL: {self.auth_info['instance_url']}")
@@ -99,13 +301,19 @@ class LeadValidationETL:
             self.logger.error(f"❌ Salesforce authentication failed: {e}")
             return False
     
+    def _ensure_authenticated(self) -> bool:
+        """Authenticate only if there is no cached token or it has expired."""
+        if self.auth_info and time.time() < self.auth_info.get('expires_at', 0):
+            return True
+        return self.authenticate_salesforce()
+    
     def extract_validation_tasks(self, force_refresh: bool = False, days_back: int = 30) -> pd.DataFrame:
         """Extract lead validation tasks from Salesforce."""
         try:
             self.logger.info("📊 Extracting lead validation tasks from Salesforce...")
             
-            # Re-authenticate right before the query to ensure fresh token
-            if not self.authenticate_salesforce():
+            # Reuse the cached token while it is still valid
+            if not self._ensure_authenticated():
                 self.logger.error("Failed to authenticate for data extraction")
                 return pd.DataFrame()
             
@@ -115,132 +323,34 @@ class LeadValidationETL:
                 date_filter = ""
                 self.logger.info("🔄 Force refresh mode: extracting all validation tasks")
             else:
-                # Get tasks from last N days
-                cutoff_date = datetime.now() - timedelta(days=days_back)
-                date_filter = f"AND LastModifiedDate >= {cutoff_date.strftime('%Y-%m-%dT%H:%M:%SZ')}"
+                # Get tasks from last N days (relative date literals let Salesforce use its index)
+                date_filter = f"AND LastModifiedDate = LAST_N_DAYS:{days_back}"
                 self.logger.info(f"📅 Incremental mode: extracting tasks from last {days_back} days")
             
-            # SOQL query for validation task extraction
-            soql_query = f"""
-                SELECT Id,
-                       WhoId,
-                       WhatId,
-                       TYPEOF Who
-                         WHEN Lead THEN LeadSource, Company, Email
-                       END,
-                       Subject,
-                       Description,
-                       CreatedDate,
-                       LastModifiedDate
-                FROM Task
-                WHERE Subject LIKE 'Lead Validation%'
-                AND   WhoId IN (SELECT Id FROM Lead)
-                {date_filter}
-                ORDER BY LastModifiedDate DESC
-            """
-            
-            # Execute query with pagination handling (like analytics project)
-            access_token = self.auth_info['access_token']
-            instance_url = self.auth_info['instance_url']
-            
-            # Salesforce REST API endpoint
-            query_url = f"{instance_url}/services/data/v58.0/query"
-            headers = {
-                'Authorization': f'Bearer {access_token}',
-                'Content-Type': 'application/json'
-            }
-            
-            all_records = []
-            next_records_url = None
-            batch_count = 0
-            
-            self.logger.info(f"📊 Executing SOQL query...")
-            
-            # First query
-            params = {'q': soql_query.strip()}
-            response = requests.get(query_url, headers=headers, params=params)
+            if force_refresh:
+                table = self._run_soql_query(TASK_QUERY.format(filters=date_filter))
+            else:
+                table = self._extract_changed_tasks(date_filter)
             
-            if response.status_code != 200:
-                self.logger.error(f"Query failed: {response.status_code} - {response.text}")
+            if table is None:
                 return pd.DataFrame()
-                
-            result = response.json()
-            total_size = result.get('totalSize', 0)
-            self.logger.info(f"📈 Total records found: {total_size:,}")
             
-            # Process first batch
-            records = result.get('records', [])
-            all_records.extend(records)
-            batch_count += 1
-            if records:
-                self.logger.info(f"📦 Batch {batch_count}: {len(records):,} records")
-            
-            # Handle pagination if there are more records
-            next_records_url = result.get('nextRecordsUrl')
-            
-            while next_records_url:
-                full_url = f"{instance_url}{next_records_url}"
-                response = requests.get(full_url, headers=headers)
-                
-                if response.status_code != 200:
-                    self.logger.error(f"Pagination failed: {response.status_code}")
-                    break
-                    
-                result = response.json()
-                records = result.get('records', [])
-                all_records.extend(records)
-                batch_count += 1
-                self.logger.info(f"📦 Batch {batch_count}: {len(records):,} records (total: {len(all_records):,})")
-                
-                next_records_url = result.get('nextRecordsUrl')
-            
-            self.logger.info(f"✅ Extraction complete: {len(all_records):,} total records")
-            records = all_records
-            
-            self.logger.info(f"📈 Retrieved {len(records)} validation tasks from Salesforce")
+            self.logger.info(f"✅ Extraction complete: {table.num_rows:,} total records")
+            self.logger.info(f"📈 Retrieved {table.num_rows} validation tasks from Salesforce")
             
             # Convert to DataFrame
-            tasks_df = pd.DataFrame(records)
+            tasks_df = table.to_pandas(split_blocks=True, self_destruct=True)
+            del table
             
             if tasks_df.empty:
                 self.logger.warning("No validation tasks found")
                 return pd.DataFrame()
             
-            # Handle the TYPEOF polymorphic query results
-            # Flatten the Who relationship data
-            who_data = []
-            for record in records:
-                who_info = record.get('Who', {})
-                if who_info:
-                    who_data.append({
-                        'WhoId': record.get('WhoId'),
-                        'LeadSource': who_info.get('LeadSource'),
-                        'Company': who_info.get('Company'), 
-                        'Email': who_info.get('Email')
-                    })
-                else:
-                    who_data.append({
-                        'WhoId': record.get('WhoId'),
-                        'LeadSource': None,
-                        'Company': None,
-                        'Email': None
-                    })
-            
-            # Create DataFrame from flattened Who data
-            who_df = pd.DataFrame(who_data)
-            
-            # Remove Salesforce metadata columns
-            metadata_columns = ['attributes', 'Who']
-            tasks_df = tasks_df.drop(columns=[col for col in metadata_columns if col in tasks_df.columns])
-            
-            # Merge Who data back into tasks
-            tasks_df = tasks_df.merge(who_df, on='WhoId', how='left')
-            
-            # Convert date columns
+            # Convert date columns (Salesforce always sends ISO 8601, so skip format inference)
             date_columns = ['CreatedDate', 'LastModifiedDate']
             for col in date_columns:
                 if col in tasks_df.columns:
-                    tasks_df[col] = pd.to_datetime(tasks_df[col], errors='coerce')
+                    tasks_df[col] = pd.to_datetime(tasks_df[col], format='ISO8601', utc=True, errors='coerce')
             
             self.results['leads_extracted'] = len(tasks_df)
             self.logger.info(f"✅ Successfully extracted {len(tasks_df)} validation tasks")
@@ -251,6 +361,189 @@ class LeadValidationETL:
             self.logger.error(f"❌ Error extracting leads: {e}")
             return pd.DataFrame()
     
+    def _run_soql_query(self, soql_query: str) -> Optional[pa.Table]:
+        """Run a Task query and return every page as one Arrow table (None on failure)."""
+        # Execute query with pagination handling (like analytics project)
+        batches = []
+        batch_count = 0
+        
+        self.logger.info(f"📊 Executing SOQL query...")
+        
+        # First query
+        params = {'q': soql_query.strip()}
+        response = self.session.get(self.auth_info['query_url'], headers=self.auth_info['headers'], params=params)
+        
+        if response.status_code == 401 and self.authenticate_salesforce():
+            # Token was revoked or expired early; retry once with a new one
+            response = self.session.get(self.auth_info['query_url'], headers=self.auth_info['headers'], params=params)
+        
+        if response.status_code != 200:
+            self.logger.error(f"Query failed: {response.status_code} - {response.text}")
+            return None
+            
+        result = orjson.loads(response.content)
+        total_size = result.get('totalSize', 0)
+        self.logger.info(f"📈 Total records found: {total_size:,}")
+        
+        # Process first batch
+        records = result.get('records', [])
+        batches.append(records_to_batch(records))
+        batch_count += 1
+        if records:
+            self.logger.info(f"📦 Batch {batch_count}: {len(records):,} records")
+        
+        # Handle pagination if there are more records
+        next_records_url = result.get('nextRecordsUrl')
+        if next_records_url:
+            batches.extend(self._fetch_remaining_pages(next_records_url, total_size, batch_count))
+        
+        return pa.Table.from_batches(batches, schema=TASK_SCHEMA)
+    
+    def _extract_changed_tasks(self, date_filter: str) -> Optional[pa.Table]:
+        """Fetch full records only for tasks that are new or changed since the last extract.
+        
+        Descriptions dominate the payload, so the matching tasks are listed
+        first without them and compared against validation_tasks; unchanged
+        tasks are not downloaded again.
+        """
+        stubs = self._run_soql_query(TASK_STUB_QUERY.format(filters=date_filter))
+        if stubs is None:
+            return None
+        
+        changed_ids = self._find_changed_task_ids(stubs)
+        self.logger.info(f"🔎 {len(changed_ids):,} of {stubs.num_rows:,} tasks are new or changed")
+        
+        tables = []
+        for offset in range(0, len(changed_ids), SOQL_ID_CHUNK_SIZE):
+            id_list = ', '.join(f"'{task_id}'" for task_id in changed_ids[offset:offset + SOQL_ID_CHUNK_SIZE])
+            table = self._run_soql_query(TASK_QUERY.format(filters=f"AND Id IN ({id_list})"))
+            if table is None:
+                return None
+            tables.append(table)
+        
+        if not tables:
+            return TASK_SCHEMA.empty_table()
+        return pa.concat_tables(tables).sort_by([('LastModifiedDate', 'descending')])
+    
+    def _find_changed_task_ids(self, stubs: pa.Table) -> List[str]:
+        """Return the ids of listed tasks that are not stored with the same LastModifiedDate."""
+        stubs_df = stubs.select(['Id', 'LastModifiedDate']).to_pandas()
+        stubs_df['LastModifiedDate'] = pd.to_datetime(stubs_df['LastModifiedDate'], format='ISO8601', utc=True, errors='coerce')
+        
+        try:
+            with connect_database(self.db_path, read_only=True) as conn:
+                return [row[0] for row in conn.execute("""
+                    SELECT s.Id
+                    FROM stubs_df s
+                    LEFT JOIN validation_tasks v
+                      ON v.task_id = s.Id AND v.last_modified_date = s.LastModifiedDate
+                    WHERE v.task_id IS NULL
+                """).fetchall()]
+        except:
+            # No database or table yet, so every task is new
+            return stubs_df['Id'].tolist()
+    
+    def _fetch_remaining_pages(self, next_records_url: str, total_size: int,
+                               batch_count: int) -> List[pa.RecordBatch]:
+        """Fetch the query pages after the first one as Arrow record batches.
+        
+        A nextRecordsUrl has the form .../query/<locator>-<offset>, so once the
+        first page is in, the URL of every remaining page is known and the pages
+        are fetched concurrently over the pooled session. If the URL does not
+        have that form, or the concurrent pages do not add up to the query
+        total, the pages are walked one by one instead.
+        """
+        batches = []
+        match = re.match(r'^(.*-)(\d+)$', next_records_url)
+        instance_url = self.auth_info['instance_url']
+        refresh_lock = threading.Lock()
+        
+        def get_page(url):
+            sent_auth = self.auth_info
+            response = self.session.get(url, headers=sent_auth['headers'])
+            if response.status_code == 401:
+                # Only the first thread to see the stale token re-authenticates
+                with refresh_lock:
+                    if self.auth_info is sent_auth:
+                        self.authenticate_salesforce()
+                response = self.session.get(url, headers=self.auth_info['headers'])
+            return response
+        
+        if match:
+            prefix, batch_size = match.group(1), int(match.group(2))
+            page_urls = [
+                instance_url + prefix + str(offset)
+                for offset in range(batch_size, total_size, batch_size)
+            ]
+            
+            def fetch_page(url):
+                response = get_page(url)
+                if response.status_code != 200:
+                    return None, response.status_code
+                return records_to_batch(orjson.loads(response.content).get('records', [])), 200
+            
+            with ThreadPoolExecutor(max_workers=PAGE_FETCH_WORKERS) as executor:
+                # map() yields in URL order, so records keep the query ordering
+                pages = list(executor.map(fetch_page, page_urls))
+            
+            # The URLs assume every page but the last is full; if a page failed
+            # or came back short, the pages do not add up to the query total
+            expected_rows = [
+                min(batch_size, total_size - offset)
+                for offset in range(batch_size, total_size, batch_size)
+            ]
+            if all(page_batch is not None and page_batch.num_rows == rows
+                   for (page_batch, _), rows in zip(pages, expected_rows)):
+                for page_batch, _ in pages:
+                    batches.append(page_batch)
+                    batch_count += 1
+                    self.logger.info(f"📦 Batch {batch_count}: {page_batch.num_rows:,} records")
+                return batches
+            
+            fetched_rows = batch_size + sum(page_batch.num_rows for page_batch, _ in pages if page_batch is not None)
+            self.logger.warning(f"⚠️ Concurrent pages returned {fetched_rows:,} of {total_size:,} records, "
+                                f"walking nextRecordsUrl instead")
+        
+        while next_records_url:
+            response = get_page(instance_url + next_records_url)
+            
+            if response.status_code != 200:
+                self.logger.error(f"Pagination failed: {response.status_code}")
+                break
+            
+            result = orjson.loads(response.content)
+            page_batch = records_to_batch(result.get('records', []))
+            batches.append(page_batch)
+            batch_count += 1
+            self.logger.info(f"📦 Batch {batch_count}: {page_batch.num_rows:,} records")
+            
+            next_records_url = result.get('nextRecordsUrl')
+        
+        return batches
+    
+    def _parse_in_parallel(self, tasks_df: pd.DataFrame) -> pd.DataFrame:
+        """Run the parser over chunks of tasks in worker processes.
+        
+        Description parsing is pure-Python regex/JSON work, so it is split
+        across processes rather than threads. Small batches are parsed inline,
+        and a failing pool falls back to parsing in this process.
+        """
+        workers = min(os.cpu_count() or 1, -(-len(tasks_df) // PARSE_CHUNK_MIN_ROWS))
+        if workers <= 1:
+            return self.parser.parse_batch(tasks_df)
+        
+        chunk_size = -(-len(tasks_df) // workers)
+        chunks = [tasks_df.iloc[start:start + chunk_size] for start in range(0, len(tasks_df), chunk_size)]
+        
+        try:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                parts = list(executor.map(self.parser.parse_batch, chunks))
+        except Exception as e:
+            self.logger.warning(f"⚠️ Parallel parsing failed, parsing in-process: {e}")
+            return self.parser.parse_batch(tasks_df)
+        
+        return pd.concat(parts, ignore_index=True)
+    
     def parse_validation_data(self, tasks_df: pd.DataFrame) -> pd.DataFrame:
         """Parse validation data from task descriptions."""
         if tasks_df.empty:
@@ -261,39 +554,40 @@ class LeadValidationETL:
             self.logger.info(f"🔍 Starting parsing of {len(tasks_df)} validation tasks...")
             
             # Use the parser to extract validation data
-            parsed_df = self.parser.parse_batch(tasks_df)
+            parsed_df = self._parse_in_parallel(tasks_df)
             
             if parsed_df.empty:
                 self.logger.warning("No validation data could be parsed")
                 return pd.DataFrame()
             
             # Calculate summary statistics
-            self.results['validations_parsed'] = len(parsed_df)
+            self.results['validations_parsed'] += len(parsed_df)
             
             # Count high/low quality leads based on API scores
             high_quality_threshold = 7  # Based on quality_score or api_quality_score
             
-            high_quality = 0
-            low_quality = 0
-            parsing_errors = 0
+            if 'parse_error' in parsed_df.columns:
+                error_mask = parsed_df['parse_error'].notna()
+            else:
+                error_mask = pd.Series(False, index=parsed_df.index)
             
-            for _, row in parsed_df.iterrows():
-                if 'parse_error' in row and pd.notna(row['parse_error']):
-                    parsing_errors += 1
-                    continue
-                
-                # Use quality_score if available, otherwise api_quality_score
-                quality_score = row.get('quality_score') or row.get('api_quality_score')
-                
-                if pd.notna(quality_score):
-                    if quality_score >= high_quality_threshold:
-                        high_quality += 1
-                    else:
-                        low_quality += 1
+            # Use quality_score if available, otherwise api_quality_score
+            missing_scores = pd.Series(float('nan'), index=parsed_df.index)
+            quality_score = pd.to_numeric(
+                parsed_df.get('quality_score', missing_scores), errors='coerce'
+            ).fillna(pd.to_numeric(parsed_df.get('api_quality_score', missing_scores), errors='coerce'))
             
-            self.results['high_quality_leads'] = high_quality
-            self.results['low_quality_leads'] = low_quality
-            self.results['parsing_errors'] = parsing_errors
+            # Count on plain NumPy arrays (NaN scores fall in neither bucket)
+            errors = error_mask.to_numpy(dtype=bool, na_value=False)
+            scores = quality_score.to_numpy(dtype=float, na_value=np.nan)[~errors]
+            
+            high_quality = int(np.count_nonzero(scores >= high_quality_threshold))
+            low_quality = int(np.count_nonzero(scores < high_quality_threshold))
+            parsing_errors = int(np.count_nonzero(errors))
+            
+            self.results['high_quality_leads'] += high_quality
+            self.results['low_quality_leads'] += low_quality
+            self.results['parsing_errors'] += parsing_errors
             
             self.logger.info(f"✅ Parsing complete:")
             self.logger.info(f"   📊 Total validations parsed: {self.results['validations_parsed']}")
@@ -312,7 +606,7 @@ class LeadValidationETL:
         try:
             self.logger.info("🗄️ Setting up database...")
             
-            with duckdb.connect(self.db_path) as conn:
+            with connect_database(self.db_path) as conn:
                 # Skip schema creation and use table names directly
                 
                 # Create validation tasks table
@@ -418,6 +712,17 @@ class LeadValidationETL:
                     )
                 """)
                 
+                # Completed pipeline runs; the latest batch_id keys dashboard caches
+                conn.execute("""
+                    CREATE TABLE IF NOT EXISTS etl_runs (
+                        batch_id VARCHAR PRIMARY KEY,
+                        validation_only BOOLEAN,
+                        tasks_extracted INTEGER,
+                        validations_parsed INTEGER,
+                        completed_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                    )
+                """)
+                
                 self.logger.info("✅ Database setup complete")
                 
         except Exception as e:
@@ -429,74 +734,30 @@ class LeadValidationETL:
         try:
             self.logger.info("💾 Saving data to database...")
             
-            with duckdb.connect(self.db_path) as conn:
+            with connect_database(self.db_path) as conn:
+                # Both upserts commit together in one transaction
+                conn.begin()
+                
                 # Save raw validation tasks
                 if not tasks_df.empty:
-                    # Add extraction timestamp
-                    tasks_df['extracted_at'] = datetime.now()
-                    
-                    # Use INSERT OR REPLACE to handle duplicates
-                    conn.register('tasks_df', tasks_df)
-                    conn.execute("""
-                        INSERT OR REPLACE INTO validation_tasks 
+                    # Upsert straight from the DataFrame (DuckDB scans it in place);
+                    # the extraction timestamp is filled in by DuckDB
+                    conn.execute(f"""
+                        INSERT INTO validation_tasks 
                         SELECT Id as task_id, WhoId as who_id, WhatId as what_id, Subject as subject, 
                                Description as description, LeadSource as lead_source, Company as lead_company, 
                                Email as lead_email, CreatedDate as created_date, LastModifiedDate as last_modified_date,
-                               extracted_at 
+                               CURRENT_TIMESTAMP as extracted_at 
                         FROM tasks_df
+                        ON CONFLICT (task_id) DO UPDATE SET {upsert_assignments(TASK_UPDATE_COLUMNS)}
                     """)
                     
                     self.logger.info(f"💾 Saved {len(tasks_df)} validation tasks")
                 
                 # Save parsed validation results
-                if not parsed_df.empty:
-                    # Filter out records with missing task_id (required field)
-                    parsed_df = parsed_df[parsed_df['task_id'].notna() & (parsed_df['task_id'] != '')]
-                    
-                    if parsed_df.empty:
-                        self.logger.warning("⚠️ No valid records to save after filtering missing task_ids")
-                        return
-                    
-                    # Convert raw_api_response to JSON string with proper encoding (if column exists)
-                    import json
-                    if 'raw_api_response' in parsed_df.columns:
-                        parsed_df['raw_api_response'] = parsed_df['raw_api_response'].apply(
-                            lambda x: json.dumps(x, ensure_ascii=True) if x and isinstance(x, dict) else str(x) if x else '{}'
-                        )
-                    
-                    # Use INSERT OR REPLACE to handle duplicates (specify columns to avoid type mismatches)
-                    conn.register('parsed_df', parsed_df)
-                    
-                    # Get the column names from the parsed_df that match our table structure
-                    table_columns = [
-                        'task_id', 'who_id', 'lead_source', 'lead_score', 'quality_score', 'data_quality', 
-                        'fraud_score', 'recommendation', 'quality_level', 'fraud_risk', 'market_segment',
-                        'phone_valid', 'phone_carrier', 'phone_type', 'phone_national_format',
-                        'email_valid', 'email_sendable', 'bounce_likely', 'gibberish_score',
-                        'total_emails', 'valid_emails', 'sendable_emails', 'email_quality_score',
-                        'api_lead_score', 'api_quality_score', 'api_fraud_score', 'api_data_quality_score',
-                        'api_recommendation', 'api_quality_level', 'api_fraud_risk_level', 'api_market_segment',
-                        'api_phone_valid', 'api_phone_carrier', 'api_phone_location',
-                        'api_email_valid', 'api_email_sendable', 'api_bounce_likely', 'api_gibberish_email',
-                        'api_fake_phone', 'api_fake_lead', 'api_disposable_email', 'api_business_strength_score',
-                        'api_first_name', 'api_last_name', 'api_company', 'api_email', 'api_phone',
-                        'api_state', 'api_postal_code', 'api_total_emails', 'api_valid_emails',
-                        'api_sendable_emails', 'api_email_summary_quality_score', 'api_quality_factors',
-                        'api_fraud_factors', 'api_summary_notes', 'lead_company', 'lead_email',
-                        'subject', 'created_date', 'last_modified_date', 'parse_error', 'raw_api_response', 'raw_description'
-                    ]
-                    
-                    # Filter to only columns that exist in parsed_df
-                    existing_columns = [col for col in table_columns if col in parsed_df.columns]
-                    
-                    # Insert only the existing columns
-                    column_list = ', '.join(existing_columns)
-                    conn.execute(f"""
-                        INSERT OR REPLACE INTO parsed_validations ({column_list})
-                        SELECT {column_list} FROM parsed_df
-                    """)
-                    
-                    self.logger.info(f"💾 Saved {len(parsed_df)} parsed validation results")
+                self._upsert_parsed(conn, parsed_df)
+                
+                conn.commit()
                 
                 # Create backup
                 self._create_backup(conn)
@@ -505,16 +766,110 @@ class LeadValidationETL:
             self.logger.error(f"❌ Error saving data: {e}")
             raise
     
+    def reparse_stored_tasks(self) -> int:
+        """Re-parse the stored validation tasks and upsert the results.
+        
+        Tasks are streamed from DuckDB as Arrow record batches and each batch
+        is parsed and saved before the next is read, so memory stays bounded
+        by REPARSE_BATCH_ROWS rather than the size of validation_tasks.
+        Returns the number of tasks read.
+        """
+        try:
+            loaded = 0
+            
+            with connect_database(self.db_path) as conn:
+                reader = conn.execute(STORED_TASKS_QUERY).fetch_record_batch(REPARSE_BATCH_ROWS)
+                writer = conn.cursor()
+                
+                for batch in reader:
+                    tasks_df = batch.to_pandas()
+                    loaded += len(tasks_df)
+                    self.logger.info(f"📊 Loaded {loaded:,} existing validation tasks for parsing")
+                    
+                    parsed_df = self.parse_validation_data(tasks_df)
+                    writer.begin()
+                    self._upsert_parsed(writer, parsed_df)
+                    writer.commit()
+                
+                # Create backup
+                self._create_backup(writer)
+            
+            return loaded
+            
+        except Exception as e:
+            self.logger.error(f"❌ Error re-parsing stored tasks: {e}")
+            raise
+    
+    def _upsert_parsed(self, conn, parsed_df: pd.DataFrame):
+        """Upsert parsed validation results on an open connection (the caller commits)."""
+        if parsed_df.empty:
+            return
+        
+        # Convert raw_api_response to JSON string with proper encoding (if column exists)
+        if 'raw_api_response' in parsed_df.columns:
+            parsed_df = parsed_df.assign(
+                raw_api_response=serialize_api_responses(parsed_df['raw_api_response'])
+            )
+        
+        # Upsert on task_id to handle duplicates (specify columns to avoid type mismatches)
+        # Get the column names from the parsed_df that match our table structure
+        table_columns = [
+            'task_id', 'who_id', 'lead_source', 'lead_score', 'quality_score', 'data_quality', 
+            'fraud_score', 'recommendation', 'quality_level', 'fraud_risk', 'market_segment',
+            'phone_valid', 'phone_carrier', 'phone_type', 'phone_national_format',
+            'email_valid', 'email_sendable', 'bounce_likely', 'gibberish_score',
+            'total_emails', 'valid_emails', 'sendable_emails', 'email_quality_score',
+            'api_lead_score', 'api_quality_score', 'api_fraud_score', 'api_data_quality_score',
+            'api_recommendation', 'api_quality_level', 'api_fraud_risk_level', 'api_market_segment',
+            'api_phone_valid', 'api_phone_carrier', 'api_phone_location',
+            'api_email_valid', 'api_email_sendable', 'api_bounce_likely', 'api_gibberish_email',
+            'api_fake_phone', 'api_fake_lead', 'api_disposable_email', 'api_business_strength_score',
+            'api_first_name', 'api_last_name', 'api_company', 'api_email', 'api_phone',
+            'api_state', 'api_postal_code', 'api_total_emails', 'api_valid_emails',
+            'api_sendable_emails', 'api_email_summary_quality_score', 'api_quality_factors',
+            'api_fraud_factors', 'api_summary_notes', 'lead_company', 'lead_email',
+            'subject', 'created_date', 'last_modified_date', 'parse_error', 'raw_api_response', 'raw_description'
+        ]
+        
+        # Filter to only columns that exist in parsed_df
+        existing_columns = [col for col in table_columns if col in parsed_df.columns]
+        
+        # Hand DuckDB an Arrow table so string columns are scanned zero-copy
+        # instead of value by value from pandas objects; columns whose values
+        # mix types cannot be converted and are scanned from pandas instead
+        total = len(parsed_df)
+        try:
+            parsed_rows = pa.Table.from_pandas(parsed_df[existing_columns], preserve_index=False)
+        except (pa.ArrowInvalid, pa.ArrowTypeError):
+            parsed_rows = parsed_df
+        del parsed_df
+        
+        # Insert only the existing columns, skipping records without the
+        # required task_id (DuckDB reports how many rows it inserted)
+        column_list = ', '.join(existing_columns)
+        update_columns = [col for col in existing_columns if col != 'task_id']
+        saved, = conn.execute(f"""
+            INSERT INTO parsed_validations ({column_list})
+            SELECT {column_list} FROM parsed_rows
+            WHERE task_id IS NOT NULL AND task_id <> ''
+            ON CONFLICT (task_id) DO UPDATE SET {upsert_assignments(update_columns)}
+        """).fetchone()
+        
+        if saved < total:
+            self.logger.warning(f"⚠️ Skipped {total - saved} records with a missing task_id")
+        self.logger.info(f"💾 Saved {saved} parsed validation results")
+    
     def _create_backup(self, conn):
         """Create backup of validation results."""
         try:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            backup_file = project_root / "reports" / f"validation_backup_{timestamp}.csv"
+            backup_file = project_root / "reports" / f"validation_backup_{timestamp}.parquet"
             
-            # Export parsed validation results
+            # Export parsed validation results (Parquet is written in parallel,
+            # compressed, and can be queried directly with read_parquet)
             conn.execute(f"""
                 COPY (SELECT * FROM parsed_validations) 
-                TO '{backup_file}' (FORMAT CSV, HEADER)
+                TO '{backup_file}' (FORMAT PARQUET, COMPRESSION 'zstd', ROW_GROUP_SIZE 100000)
             """)
             
             self.logger.info(f"💾 Backup created: {backup_file}")
@@ -522,6 +877,32 @@ class LeadValidationETL:
         except Exception as e:
             self.logger.warning(f"⚠️ Backup creation failed: {e}")
     
+    def refresh_report_tables(self):
+        """Rebuild the materialized report aggregates from the saved data."""
+        try:
+            with DuckDBManager(self.db_path) as db:
+                refresh_report_tables(db)
+            
+            self.logger.info("📊 Report aggregate tables refreshed")
+            
+        except Exception as e:
+            self.logger.warning(f"⚠️ Report table refresh failed: {e}")
+    
+    def record_etl_run(self, validation_only: bool = False):
+        """Record the completed run; its batch id keys the dashboard figure cache."""
+        batch_id = datetime.now().strftime('%Y%m%d_%H%M%S_%f')
+        try:
+            with connect_database(self.db_path) as conn:
+                conn.execute(
+                    "INSERT INTO etl_runs (batch_id, validation_only, tasks_extracted, validations_parsed) VALUES (?, ?, ?, ?)",
+                    [batch_id, validation_only, self.results.get('leads_extracted', 0), self.results['validations_parsed']]
+                )
+            
+            self.logger.info(f"🏷️ Recorded ETL run {batch_id}")
+            
+        except Exception as e:
+            self.logger.warning(f"⚠️ Recording ETL run failed: {e}")
+    
     def run_full_pipeline(self, force_refresh: bool = False, validation_only: bool = False, days_back: int = 30):
         """Run the complete ETL pipeline."""
         try:
@@ -539,23 +920,24 @@ class LeadValidationETL:
                 if tasks_df.empty:
                     self.logger.warning("⚠️ No validation tasks extracted, ending pipeline")
                     return
-            else:
-                # Load existing tasks from database for parsing only
-                with duckdb.connect(self.db_path) as conn:
-                    tasks_df = conn.execute("SELECT * FROM leads.validation_tasks").df()
-                self.logger.info(f"📊 Loaded {len(tasks_df)} existing validation tasks for parsing")
-            
-            # Parse validation data
-            parsed_df = self.parse_validation_data(tasks_df)
-            if parsed_df.empty:
-                self.logger.warning("⚠️ No validation data could be parsed")
-                return
-            
-            # Save data
-            if not validation_only:
+                
+                # Parse validation data
+                parsed_df = self.parse_validation_data(tasks_df)
+                if parsed_df.empty:
+                    self.logger.warning("⚠️ No validation data could be parsed")
+                    return
+                
+                # Save data
                 self.save_data(tasks_df, parsed_df)
             else:
-                self.save_data(pd.DataFrame(), parsed_df)  # Only save parsed results
+                # Re-parse the tasks already in the database, batch by batch
+                if not self.reparse_stored_tasks():
+                    self.logger.warning("⚠️ No validation data could be parsed")
+                    return
+            
+            # Rebuild report aggregates against the fresh data
+            self.refresh_report_tables()
+            self.record_etl_run(validation_only)
             
             # Print summary
             end_time = datetime.now()
@@ -568,102 +950,58 @@ class LeadValidationETL:
                 self.logger.info(f"   {key}: {value}")
             
             # Print validation insights
-            self._print_validation_insights(parsed_df)
+            self._print_validation_insights()
             
         except Exception as e:
             self.logger.error(f"❌ Pipeline failed: {e}")
             raise
     
-    def _print_validation_insights(self, parsed_df: pd.DataFrame):
-        """Print key validation insights."""
-        if parsed_df.empty:
-            self.logger.info("🔍 Validation Insights: No data to analyze")
-            return
-        
+    def _print_validation_insights(self):
+        """Print key validation insights, aggregated in DuckDB over the stored validations."""
         try:
-            self.logger.info(f"\n🔍 Validation Insights: Processed {len(parsed_df)} records")
-            self.logger.info(f"   📊 Available columns: {len(parsed_df.columns)}")
-            
-            # Simple record count analysis
-            if 'lead_source' in parsed_df.columns:
-                source_counts = parsed_df['lead_source'].value_counts().head(5)
-                self.logger.info("   📊 Top Lead Sources:")
-                for source, count in source_counts.items():
-                    self.logger.info(f"      {source}: {count} records")
-            
-            return  # Skip complex analysis for now to avoid column errors
+            with DuckDBManager(self.db_path) as db:
+                # The stored total and the quality flag counts come from one scan
+                total, fake_leads, disposable_emails, fake_phones = db.conn.execute(
+                    INSIGHTS_TOTALS_QUERY
+                ).fetchone()
+                
+                if not total:
+                    self.logger.info("🔍 Validation Insights: No data to analyze")
+                    return
+                
+                buckets = db.conn.execute(INSIGHTS_SCORE_BUCKETS_QUERY).fetchall()
+                sources = db.conn.execute(INSIGHTS_BY_SOURCE_QUERY).fetchall()
+                worst_sources = db.conn.execute(INSIGHTS_WORST_SOURCES_QUERY).fetchall()
         
         except Exception as e:
             self.logger.warning(f"   ⚠️ Could not generate insights: {e}")
             return
         
-        self.logger.info("\n🔍 Validation Insights:")
-        
-        # Quality score distribution (check which quality score column exists)
-        quality_scores = None
-        if 'api_quality_score' in parsed_df.columns:
-            quality_scores = parsed_df['api_quality_score'].dropna()
-        elif 'quality_score' in parsed_df.columns:
-            quality_scores = parsed_df['quality_score'].dropna()
-        if quality_scores is not None and not quality_scores.empty:
-            score_ranges = [
-                (9, 10, "Excellent"),
-                (7, 9, "Good"),
-                (5, 7, "Fair"),
-                (3, 5, "Poor"),
-                (0, 3, "Invalid")
-            ]
-            
-            for min_score, max_score, label in score_ranges:
-                count = len(quality_scores[(quality_scores >= min_score) & (quality_scores < max_score)])
-                percentage = (count / len(quality_scores)) * 100
-                self.logger.info(f"   {label} ({min_score}-{max_score}): {count} leads ({percentage:.1f}%)")
+        self.logger.info(f"\n🔍 Validation Insights: {total:,} stored validations")
+        
+        # Quality score distribution
+        for label, count in buckets:
+            self.logger.info(f"   {label}: {count} leads ({count / total * 100:.1f}%)")
         
         # Average scores by lead source
-        if 'lead_source' in parsed_df.columns:
-            # Build aggregation dict based on available columns
-            agg_dict = {}
-            if 'api_quality_score' in parsed_df.columns:
-                agg_dict['api_quality_score'] = 'mean'
-            elif 'quality_score' in parsed_df.columns:
-                agg_dict['quality_score'] = 'mean'
-            
-            if 'api_lead_score' in parsed_df.columns:
-                agg_dict['api_lead_score'] = 'mean'
-            
-            if 'api_fraud_score' in parsed_df.columns:
-                agg_dict['api_fraud_score'] = 'mean'
-            
-            if 'task_id' in parsed_df.columns:
-                agg_dict['task_id'] = 'count'
-            
-            if agg_dict:
-                source_analysis = parsed_df.groupby('lead_source').agg(agg_dict).round(2)
-            
-            source_analysis.columns = ['Avg_Quality', 'Avg_Lead', 'Avg_Fraud', 'Count']
-            source_analysis = source_analysis.sort_values('Avg_Quality', ascending=False)
-            
-            self.logger.info("\n📈 Performance by Lead Source:")
-            self.logger.info("   Source | Quality | Lead | Fraud | Count")
-            self.logger.info("   " + "-" * 45)
-            
-            for source, row in source_analysis.head(10).iterrows():
-                self.logger.info(f"   {source[:15]:<15} | {row['Avg_Quality']:>7.1f} | {row['Avg_Lead']:>4.1f} | {row['Avg_Fraud']:>5.1f} | {row['Count']:>5}")
+        self.logger.info("\n📈 Performance by Lead Source:")
+        self.logger.info("   Source | Quality | Lead | Fraud | Count")
+        self.logger.info("   " + "-" * 45)
+        
+        for source, avg_quality, avg_lead, avg_fraud, count in sources:
+            self.logger.info(
+                f"   {(source or 'Unknown')[:15]:<15} | {avg_quality or 0:>7.1f} | "
+                f"{avg_lead or 0:>4.1f} | {avg_fraud or 0:>5.1f} | {count:>5}"
+            )
         
         # Worst performing sources
-        if 'lead_source' in parsed_df.columns and not quality_scores.empty:
-            worst_sources = source_analysis.tail(3)
-            self.logger.info("\n🚨 Sources Needing Attention:")
-            for source, row in worst_sources.iterrows():
-                self.logger.info(f"   ⚠️ {source}: Quality Score {row['Avg_Quality']:.1f} ({row['Count']} leads)")
+        self.logger.info("\n🚨 Sources Needing Attention:")
+        for source, avg_quality, count in worst_sources:
+            self.logger.info(f"   ⚠️ {source or 'Unknown'}: Quality Score {avg_quality or 0:.1f} ({count} leads)")
         
         # Data quality indicators
-        fraud_indicators = parsed_df['api_fake_lead'].sum() if 'api_fake_lead' in parsed_df.columns else 0
-        disposable_emails = parsed_df['api_disposable_email'].sum() if 'api_disposable_email' in parsed_df.columns else 0
-        fake_phones = parsed_df['api_fake_phone'].sum() if 'api_fake_phone' in parsed_df.columns else 0
-        
         self.logger.info(f"\n📊 Data Quality Flags:")
-        self.logger.info(f"   🚨 Fake leads detected: {fraud_indicators}")
+        self.logger.info(f"   🚨 Fake leads detected: {fake_leads}")
         self.logger.info(f"   📧 Disposable emails: {disposable_emails}")
         self.logger.info(f"   📱 Fake phone numbers: {fake_phones}")
 
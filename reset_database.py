@@ -4,8 +4,20 @@ Reset the DuckDB database by deleting the file and starting fresh
 """
 import os
 import shutil
+import threading
+import time
 from pathlib import Path
 
+def discard_file(path: Path) -> threading.Thread:
+    """Rename a file out of the way and unlink it on a background thread."""
+    stale = path.with_name(f"{path.name}.stale.{os.getpid()}.{int(time.time())}")
+    path.rename(stale)
+    
+    # Non-daemon so the unlink still finishes before the interpreter exits
+    cleanup = threading.Thread(target=stale.unlink, name=f"unlink-{stale.name}")
+    cleanup.start()
+    return cleanup
+
 def main():
     project_root = Path(__file__).parent
     data_dir = project_root / "data"
@@ -18,7 +30,12 @@ def main():
     # Remove database file if it exists
     if db_file.exists():
         try:
-            os.remove(db_file)
+            # Rename is an instant metadata update; the slow delete of a large
+            # file (and its WAL) happens in the background
+            discard_file(db_file)
+            wal_file = db_file.with_name(f"{db_file.name}.wal")
+            if wal_file.exists():
+                discard_file(wal_file)
             print(f"✅ Removed existing database: {db_file}")
         except Exception as e:
             print(f"❌ Failed to remove database: {e}")
@@ -27,7 +44,7 @@ def main():
         print("ℹ️ No existing database found")
     
     # Recreate data directory if needed
-    data_dir.mkdir(exist_ok=True)
+    data_dir.mkdir(parents=True, exist_ok=True)
     
     print("🎯 Database reset complete! Ready for fresh ETL run.")
     return True
@@ -10,28 +10,33 @@ Usage:
     
     Or with custom port:
     python run_daily_fake_leads_report.py --port 8503
+    python run_daily_fake_leads_report.py -p 8503
 """
 
 import sys
-import subprocess
 from pathlib import Path
 from datetime import datetime
 
+DEFAULT_PORT = 8503
+
+def parse_port(argv) -> int:
+    """Parse the --port/-p option from the command line arguments."""
+    import argparse
+    
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("-p", "--port", type=int, default=DEFAULT_PORT, help="port to serve on")
+    return parser.parse_args(argv).port
+
 def main():
     """Run the daily fake leads report."""
-    dashboard_path = Path(__file__).parent / "src" / "dashboard" / "daily_fake_leads_report.py"
+    dashboard_path = Path(__file__).parent / "dashboard_app.py"
     
     if not dashboard_path.exists():
         print(f"❌ Report file not found: {dashboard_path}")
         return 1
     
-    # Parse command line arguments for port
-    port = "8503"
-    if len(sys.argv) > 1:
-        if sys.argv[1] == "--port" and len(sys.argv) > 2:
-            port = sys.argv[2]
-        elif sys.argv[1].startswith("--port="):
-            port = sys.argv[1].split("=")[1]
+    # Parse command line arguments for port (no parser needed without arguments)
+    port = DEFAULT_PORT if len(sys.argv) == 1 else parse_port(sys.argv[1:])
     
     current_date = datetime.now().strftime("%A, %B %d, %Y")
     
@@ -48,26 +53,28 @@ def main():
     print("   • 📄 PDF & HTML export options\n")
     
     try:
-        # Run streamlit with the daily report
-        cmd = [
-            sys.executable, "-m", "streamlit", "run", str(dashboard_path),
-            "--server.port", port,
-            "--server.headless", "false", 
-            "--browser.gatherUsageStats", "false"
-        ]
-        
-        subprocess.run(cmd, check=True)
+        from streamlit.web import bootstrap
+    except ImportError:
+        print("❌ Streamlit not found. Make sure you've installed the requirements:")
+        print("   pip install -r requirements.txt")
+        return 1
+    
+    try:
+        # Serve the shared dashboard app from this interpreter, opening on the daily report page
+        flag_options = {
+            "server.port": int(port),
+            "server.headless": False,
+            "browser.gatherUsageStats": False
+        }
+        bootstrap.load_config_options(flag_options=flag_options)
+        bootstrap.run(str(dashboard_path), False, ["--page=daily_fake_leads"], flag_options)
         
     except KeyboardInterrupt:
         print("\n👋 Daily report stopped by user.")
         return 0
-    except subprocess.CalledProcessError as e:
+    except Exception as e:
         print(f"❌ Error running report: {e}")
         return 1
-    except FileNotFoundError:
-        print("❌ Streamlit not found. Make sure you've installed the requirements:")
-        print("   pip install -r requirements.txt")
-        return 1
 
 if __name__ == "__main__":
     sys.exit(main())
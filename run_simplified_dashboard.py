@@ -10,27 +10,32 @@ Usage:
     
     Or with custom port:
     python run_simplified_dashboard.py --port 8502
+    python run_simplified_dashboard.py -p 8502
 """
 
 import sys
-import subprocess
 from pathlib import Path
 
+DEFAULT_PORT = 8501
+
+def parse_port(argv) -> int:
+    """Parse the --port/-p option from the command line arguments."""
+    import argparse
+    
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("-p", "--port", type=int, default=DEFAULT_PORT, help="port to serve on")
+    return parser.parse_args(argv).port
+
 def main():
     """Run the simplified dashboard."""
-    dashboard_path = Path(__file__).parent / "src" / "dashboard" / "simplified_dashboard.py"
+    dashboard_path = Path(__file__).parent / "dashboard_app.py"
     
     if not dashboard_path.exists():
         print(f"❌ Dashboard file not found: {dashboard_path}")
         return 1
     
-    # Parse command line arguments for port
-    port = "8501"
-    if len(sys.argv) > 1:
-        if sys.argv[1] == "--port" and len(sys.argv) > 2:
-            port = sys.argv[2]
-        elif sys.argv[1].startswith("--port="):
-            port = sys.argv[1].split("=")[1]
+    # Parse command line arguments for port (no parser needed without arguments)
+    port = DEFAULT_PORT if len(sys.argv) == 1 else parse_port(sys.argv[1:])
     
     print("🚀 Starting Simplified Lead Validation Dashboard...")
     print(f"📊 Dashboard will be available at: http://localhost:{port}")
@@ -41,26 +46,28 @@ def main():
     print("   • Trend Reports by Lead Source\n")
     
     try:
-        # Run streamlit with the simplified dashboard
-        cmd = [
-            sys.executable, "-m", "streamlit", "run", str(dashboard_path),
-            "--server.port", port,
-            "--server.headless", "false",
-            "--browser.gatherUsageStats", "false"
-        ]
-        
-        subprocess.run(cmd, check=True)
+        from streamlit.web import bootstrap
+    except ImportError:
+        print("❌ Streamlit not found. Make sure you've installed the requirements:")
+        print("   pip install -r requirements.txt")
+        return 1
+    
+    try:
+        # Serve the shared dashboard app from this interpreter, opening on the simplified dashboard page
+        flag_options = {
+            "server.port": int(port),
+            "server.headless": False,
+            "browser.gatherUsageStats": False
+        }
+        bootstrap.load_config_options(flag_options=flag_options)
+        bootstrap.run(str(dashboard_path), False, ["--page=simplified"], flag_options)
         
     except KeyboardInterrupt:
         print("\n👋 Dashboard stopped by user.")
         return 0
-    except subprocess.CalledProcessError as e:
+    except Exception as e:
         print(f"❌ Error running dashboard: {e}")
         return 1
-    except FileNotFoundError:
-        print("❌ Streamlit not found. Make sure you've installed the requirements:")
-        print("   pip install -r requirements.txt")
-        return 1
 
 if __name__ == "__main__":
     sys.exit(main())
@@ -36,7 +36,7 @@ WITH today_leads AS (
         
     FROM parsed_validations
     WHERE parse_error IS NULL
-    AND DATE_TRUNC('day', created_date) = CURRENT_DATE  -- Today only
+    AND created_date >= CURRENT_DATE AND created_date < CURRENT_DATE + INTERVAL 1 DAY  -- Today only
     GROUP BY COALESCE(lead_source, 'Unknown')
 ),
 source_rankings AS (
@@ -1,26 +1,88 @@
 """Dashboard components for Lead Validation Reporting."""
 import streamlit as st
-import plotly.express as px
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
+import plotly.io as pio
 import pandas as pd
-from typing import Dict, Any, Optional
+import os
+from functools import lru_cache
+from typing import Dict, Any, Optional, Callable
 import numpy as np
 
+from config.settings import FIG_CACHE_DIR
+
+# Figures are rebuilt only when their input data changes, not on every rerun
+CHART_CACHE_TTL = 300
+
+# Row highlight for the worst-sources table
+RISK_ROW_STYLES = {
+    'HIGH_RISK': 'background-color: #ffebee',    # Light red
+    'MEDIUM_RISK': 'background-color: #fff3e0'   # Light orange
+}
+
+
+@lru_cache(maxsize=None)
+def _no_data_figure(text: str) -> go.Figure:
+    """Build the placeholder figure shown when a chart has no data.
+    
+    Built on first use and shared afterwards; Streamlit only serializes it.
+    """
+    return go.Figure().add_annotation(
+        text=text,
+        xref="paper", yref="paper",
+        x=0.5, y=0.5, showarrow=False
+    )
+
+
+@st.cache_resource(show_spinner=False)
+def _read_cached_figure(path: str) -> go.Figure:
+    """Load a persisted figure once per process; paths are unique per ETL batch."""
+    with open(path) as f:
+        return pio.from_json(f.read())
+
+
+def cached_figure(name: str, batch_id: Optional[str], build: Callable[[], go.Figure]) -> go.Figure:
+    """Return the figure persisted for this ETL batch, building and saving it on a miss."""
+    if not batch_id:
+        return build()
+    
+    path = FIG_CACHE_DIR / f"{batch_id}_{name}.json"
+    if path.exists():
+        try:
+            return _read_cached_figure(str(path))
+        except Exception:
+            pass
+    
+    fig = build()
+    try:
+        FIG_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        # Drop this figure's files from earlier batches, then write atomically
+        for stale in FIG_CACHE_DIR.glob(f"*_{name}.json"):
+            if not stale.name.startswith(f"{batch_id}_"):
+                stale.unlink(missing_ok=True)
+        tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        fig.write_json(str(tmp_path))
+        os.replace(tmp_path, path)
+    except OSError:
+        pass
+    return fig
+
 
 def create_metric_cards(metrics_row: pd.Series):
     """Create metric cards for the dashboard header."""
+    # Plain dict lookups instead of a pandas __getitem__ per value
+    m = metrics_row.to_dict() if isinstance(metrics_row, pd.Series) else metrics_row
     col1, col2, col3, col4 = st.columns(4)
     
     with col1:
         st.metric(
             label="📊 Total Validations",
-            value=f"{metrics_row['total_validations']:,}",
+            value=f"{m['total_validations']:,}",
             delta=None
         )
     
     with col2:
-        avg_score = metrics_row['avg_quality_score']
+        avg_score = m['avg_quality_score']
         st.metric(
             label="⭐ Avg Quality Score",
             value=f"{avg_score:.1f}",
@@ -29,7 +91,7 @@ def create_metric_cards(metrics_row: pd.Series):
         )
     
     with col3:
-        quality_percentage = metrics_row['quality_leads_percentage']
+        quality_percentage = m['quality_leads_percentage']
         st.metric(
             label="✅ Quality Leads",
             value=f"{quality_percentage:.1f}%",
@@ -38,7 +100,7 @@ def create_metric_cards(metrics_row: pd.Series):
         )
     
     with col4:
-        fake_percentage = metrics_row['fake_leads_percentage']
+        fake_percentage = m['fake_leads_percentage']
         st.metric(
             label="🚨 Fraud Rate",
             value=f"{fake_percentage:.1f}%",
@@ -47,6 +109,7 @@ def create_metric_cards(metrics_row: pd.Series):
         )
 
 
+@st.cache_data(ttl=CHART_CACHE_TTL, show_spinner=False)
 def create_score_distribution_chart(metrics_row: pd.Series) -> go.Figure:
     """Create score distribution donut chart."""
     categories = ['Excellent (9-10)', 'Good (7-8)', 'Fair (5-6)', 'Poor (3-4)', 'Invalid (0-2)']
@@ -90,18 +153,27 @@ def create_score_distribution_chart(metrics_row: pd.Series) -> go.Figure:
     return fig
 
 
+def grade_colors_for(grades: pd.Series, grade_colors: Dict[str, str], default: str = '#636EFA') -> np.ndarray:
+    """Map quality grades to colors with one vectorized lookup (unknown grades get the default)."""
+    palette = np.array(list(grade_colors.values()) + [default])
+    codes = pd.Categorical(grades, categories=list(grade_colors)).codes
+    return palette[np.where(codes < 0, len(palette) - 1, codes)]
+
+
+@st.cache_data(ttl=CHART_CACHE_TTL, show_spinner=False)
 def create_validation_trends_chart(trends_df: pd.DataFrame) -> go.Figure:
     """Create validation trends line chart."""
     if trends_df.empty:
-        return go.Figure().add_annotation(
-            text="No trend data available",
-            xref="paper", yref="paper",
-            x=0.5, y=0.5, showarrow=False
-        )
+        return _no_data_figure("No trend data available")
     
-    # Convert period_start to datetime
-    trends_df['period_start'] = pd.to_datetime(trends_df['period_start'])
-    trends_df = trends_df.sort_values('period_start')
+    # period_start comes back from DuckDB as a TIMESTAMP, newest first; only
+    # convert or sort (on a copy) when the input is not already in that shape
+    if not pd.api.types.is_datetime64_any_dtype(trends_df['period_start']):
+        trends_df = trends_df.assign(period_start=pd.to_datetime(trends_df['period_start']))
+    if trends_df['period_start'].is_monotonic_decreasing:
+        trends_df = trends_df.iloc[::-1]
+    elif not trends_df['period_start'].is_monotonic_increasing:
+        trends_df = trends_df.sort_values('period_start')
     
     # Create subplots
     fig = make_subplots(
@@ -168,14 +240,11 @@ def create_validation_trends_chart(trends_df: pd.DataFrame) -> go.Figure:
     return fig
 
 
+@st.cache_data(ttl=CHART_CACHE_TTL, show_spinner=False)
 def create_source_analysis_chart(source_df: pd.DataFrame) -> go.Figure:
     """Create lead source analysis chart."""
     if source_df.empty:
-        return go.Figure().add_annotation(
-            text="No source data available",
-            xref="paper", yref="paper",
-            x=0.5, y=0.5, showarrow=False
-        )
+        return _no_data_figure("No source data available")
     
     # Limit to top 15 sources and sort by quality score
     source_df = source_df.head(15).sort_values('avg_quality_score', ascending=True)  # Ascending for horizontal bar
@@ -190,7 +259,7 @@ def create_source_analysis_chart(source_df: pd.DataFrame) -> go.Figure:
         'F': '#B91C1C'    # Critical red
     }
     
-    colors = [grade_colors.get(grade, '#636EFA') for grade in source_df['quality_grade']]
+    colors = grade_colors_for(source_df['quality_grade'], grade_colors)
     
     # Create horizontal bar chart
     fig = go.Figure()
@@ -205,7 +274,7 @@ def create_source_analysis_chart(source_df: pd.DataFrame) -> go.Figure:
             color=colors,
             line=dict(color='rgba(50,50,50,0.5)', width=1)
         ),
-        text=[f"{score:.1f} ({grade})" for score, grade in zip(source_df['avg_quality_score'], source_df['quality_grade'])],
+        text=source_df['avg_quality_score'].map('{:.1f}'.format) + ' (' + source_df['quality_grade'].astype(str) + ')',
         textposition='inside',
         hovertemplate='<b>%{y}</b><br>' +
                       'Quality Score: %{x:.1f}<br>' +
@@ -236,22 +305,25 @@ def create_source_analysis_chart(source_df: pd.DataFrame) -> go.Figure:
     return fig
 
 
+@st.cache_data(ttl=CHART_CACHE_TTL, show_spinner=False)
 def create_conversion_analysis_chart(conversion_df: pd.DataFrame) -> go.Figure:
     """Create conversion analysis by quality score."""
     if conversion_df.empty:
-        return go.Figure().add_annotation(
-            text="No conversion data available",
-            xref="paper", yref="paper",
-            x=0.5, y=0.5, showarrow=False
-        )
+        return _no_data_figure("No conversion data available")
+    
+    # Extract each column once; Plotly takes the arrays without pandas coercion
+    categories = conversion_df['score_category'].to_numpy()
+    total_leads = conversion_df['total_leads'].to_numpy()
+    converted_leads = conversion_df['converted_leads'].to_numpy()
+    rates = conversion_df['conversion_rate'].to_numpy(dtype=np.float64, na_value=np.nan)
     
     # Create grouped bar chart
     fig = go.Figure()
     
     # Add total leads bars
     fig.add_trace(go.Bar(
-        x=conversion_df['score_category'],
-        y=conversion_df['total_leads'],
+        x=categories,
+        y=total_leads,
         name='Total Leads',
         marker_color='lightblue',
         opacity=0.7
@@ -259,8 +331,8 @@ def create_conversion_analysis_chart(conversion_df: pd.DataFrame) -> go.Figure:
     
     # Add converted leads bars
     fig.add_trace(go.Bar(
-        x=conversion_df['score_category'],
-        y=conversion_df['converted_leads'],
+        x=categories,
+        y=converted_leads,
         name='Converted Leads',
         marker_color='darkgreen',
         opacity=0.8
@@ -268,14 +340,14 @@ def create_conversion_analysis_chart(conversion_df: pd.DataFrame) -> go.Figure:
     
     # Add conversion rate line on secondary y-axis
     fig.add_trace(go.Scatter(
-        x=conversion_df['score_category'],
-        y=conversion_df['conversion_rate'],
+        x=categories,
+        y=rates,
         mode='lines+markers+text',
         name='Conversion Rate %',
         yaxis='y2',
         line=dict(color='red', width=3),
         marker=dict(size=8, color='red'),
-        text=[f"{rate:.1f}%" for rate in conversion_df['conversion_rate']],
+        text=np.char.mod('%.1f%%', rates),
         textposition='top center'
     ))
     
@@ -290,7 +362,7 @@ def create_conversion_analysis_chart(conversion_df: pd.DataFrame) -> go.Figure:
             title="Conversion Rate (%)",
             overlaying='y',
             side='right',
-            range=[0, max(conversion_df['conversion_rate']) * 1.2]
+            range=[0, np.nanmax(rates) * 1.2]
         ),
         legend=dict(x=0.02, y=0.98),
         barmode='group'
@@ -332,25 +404,27 @@ def create_data_freshness_indicator(freshness_info: Dict[str, Any]):
     """, unsafe_allow_html=True)
 
 
+def format_timestamps(values: pd.Series) -> pd.Series:
+    """Format timestamps as 'YYYY-MM-DD HH:MM' (missing values stay missing).
+    
+    Same output as dt.strftime('%Y-%m-%d %H:%M'), but the text comes from a
+    NumPy datetime64[m] cast instead of formatting each value in Python.
+    """
+    timestamps = pd.to_datetime(values, errors='coerce')
+    if timestamps.dt.tz is not None:
+        # Format the local wall time, as strftime does
+        timestamps = timestamps.dt.tz_localize(None)
+    
+    text = np.datetime_as_string(timestamps.to_numpy(dtype='datetime64[m]'), unit='m')
+    return pd.Series(np.char.replace(text, 'T', ' '), index=values.index).where(timestamps.notna())
+
+
 def create_detailed_lead_table(leads_df: pd.DataFrame):
     """Create detailed lead table with formatting."""
     if leads_df.empty:
         st.info("No lead data available")
         return
     
-    # Format the dataframe for display
-    display_df = leads_df.copy()
-    
-    # Format score column with color coding
-    if 'overall_score' in display_df.columns:
-        display_df['overall_score'] = display_df['overall_score'].round(3)
-    
-    # Format timestamp columns
-    timestamp_columns = ['validation_timestamp', 'created_date', 'last_modified_date']
-    for col in timestamp_columns:
-        if col in display_df.columns:
-            display_df[col] = pd.to_datetime(display_df[col]).dt.strftime('%Y-%m-%d %H:%M')
-    
     # Reorder columns for better display
     preferred_order = [
         'lead_id', 'overall_score', 'validation_status', 
@@ -359,13 +433,31 @@ def create_detailed_lead_table(leads_df: pd.DataFrame):
     ]
     
     # Keep only columns that exist
-    columns_to_show = [col for col in preferred_order if col in display_df.columns]
-    remaining_columns = [col for col in display_df.columns if col not in columns_to_show]
+    available = set(leads_df.columns)
+    columns_to_show = [col for col in preferred_order if col in available]
+    shown = set(columns_to_show)
+    remaining_columns = [col for col in leads_df.columns if col not in shown]
     final_columns = columns_to_show + remaining_columns
     
+    # Format the dataframe for display; only the formatted columns are
+    # rebuilt, the rest are shared with leads_df
+    formatted = {}
+    
+    # Format score column with color coding
+    if 'overall_score' in available:
+        formatted['overall_score'] = leads_df['overall_score'].round(3)
+    
+    # Format timestamp columns
+    timestamp_columns = ['validation_timestamp', 'created_date', 'last_modified_date']
+    for col in timestamp_columns:
+        if col in available:
+            formatted[col] = format_timestamps(leads_df[col])
+    
+    display_df = leads_df.loc[:, final_columns].assign(**formatted)
+    
     # Display the table
     st.dataframe(
-        display_df[final_columns],
+        display_df,
         use_container_width=True,
         height=400
     )
@@ -379,9 +471,6 @@ def create_worst_sources_table(worst_sources_df: pd.DataFrame):
     
     st.markdown("### 🚨 Lead Sources Requiring Attention")
     
-    # Format the dataframe for better display
-    display_df = worst_sources_df.copy()
-    
     # Select key columns for display
     columns_to_show = [
         'lead_source', 'total_leads', 'avg_quality_score', 'quality_grade', 
@@ -389,8 +478,8 @@ def create_worst_sources_table(worst_sources_df: pd.DataFrame):
     ]
     
     # Filter to columns that exist
-    columns_to_show = [col for col in columns_to_show if col in display_df.columns]
-    display_df = display_df[columns_to_show]
+    available = set(worst_sources_df.columns)
+    columns_to_show = [col for col in columns_to_show if col in available]
     
     # Rename columns for better display
     column_renames = {
@@ -404,7 +493,8 @@ def create_worst_sources_table(worst_sources_df: pd.DataFrame):
         'remediation_priority': 'Priority'
     }
     
-    display_df = display_df.rename(columns=column_renames)
+    # Only the top 10 worst sources are shown, so format just those rows
+    display_df = worst_sources_df.head(10).loc[:, columns_to_show].rename(columns=column_renames)
     
     # Format numeric columns
     if 'Quality Score' in display_df.columns:
@@ -412,18 +502,24 @@ def create_worst_sources_table(worst_sources_df: pd.DataFrame):
     if 'Fraud Rate %' in display_df.columns:
         display_df['Fraud Rate %'] = display_df['Fraud Rate %'].round(1)
     
-    # Style the dataframe
-    def style_row(row):
-        if 'Risk Level' in row:
-            if row['Risk Level'] == 'HIGH_RISK':
-                return ['background-color: #ffebee'] * len(row)  # Light red
-            elif row['Risk Level'] == 'MEDIUM_RISK':
-                return ['background-color: #fff3e0'] * len(row)  # Light orange
-        return [''] * len(row)
+    # Style the dataframe: one row-colour per risk level, broadcast across all columns
+    def style_rows(df):
+        if 'Risk Level' not in df.columns:
+            return pd.DataFrame('', index=df.index, columns=df.columns)
+        risk = df['Risk Level'].to_numpy()[:, None]
+        styles = np.where(
+            risk == 'HIGH_RISK', RISK_ROW_STYLES['HIGH_RISK'],
+            np.where(risk == 'MEDIUM_RISK', RISK_ROW_STYLES['MEDIUM_RISK'], '')
+        )
+        return pd.DataFrame(np.broadcast_to(styles, df.shape), index=df.index, columns=df.columns)
+    
+    # The Styler's display strings replace the cell values, so the precision
+    # is set here; the underlying columns stay numeric for sorting
+    number_formats = {col: '{:.1f}' for col in ('Quality Score', 'Fraud Rate %') if col in display_df.columns}
     
     # Display the table
     st.dataframe(
-        display_df.head(10),  # Show top 10 worst sources
+        display_df.style.apply(style_rows, axis=None).format(number_formats),
         use_container_width=True,
         height=300
     )
@@ -433,8 +529,8 @@ def create_worst_sources_table(worst_sources_df: pd.DataFrame):
     
     # Add summary insights
     if not worst_sources_df.empty:
-        high_risk_count = len(worst_sources_df[worst_sources_df['risk_level'] == 'HIGH_RISK'])
-        medium_risk_count = len(worst_sources_df[worst_sources_df['risk_level'] == 'MEDIUM_RISK'])
+        high_risk_count = int((worst_sources_df['risk_level'] == 'HIGH_RISK').sum())
+        medium_risk_count = int((worst_sources_df['risk_level'] == 'MEDIUM_RISK').sum())
         
         col1, col2, col3 = st.columns(3)
         with col1:
@@ -458,14 +554,11 @@ def create_worst_sources_table(worst_sources_df: pd.DataFrame):
             )
 
 
+@st.cache_data(ttl=CHART_CACHE_TTL, show_spinner=False)
 def create_lead_source_quality_chart(source_df: pd.DataFrame) -> go.Figure:
     """Create a comprehensive lead source quality analysis chart."""
     if source_df.empty:
-        return go.Figure().add_annotation(
-            text="No source quality data available",
-            xref="paper", yref="paper",
-            x=0.5, y=0.5, showarrow=False
-        )
+        return _no_data_figure("No source quality data available")
     
     # Create bubble chart: Quality Score vs Fraud Rate, sized by volume
     fig = go.Figure()
@@ -480,16 +573,25 @@ def create_lead_source_quality_chart(source_df: pd.DataFrame) -> go.Figure:
         'F': '#B91C1C'
     }
     
+    # Pull each column out once; Plotly validates ndarrays without per-Series conversion
+    quality = source_df['avg_quality_score'].to_numpy(dtype=np.float64, na_value=np.nan)
+    fraud = source_df['fake_leads_percentage'].to_numpy(dtype=np.float64, na_value=np.nan)
+    totals = source_df['total_leads'].to_numpy()
+    
+    # Size by volume (square root for better scaling), computed in a single buffer
+    sizes = np.sqrt(totals, dtype=np.float64)
+    sizes *= 3
+    
     # Create scatter plot
     fig.add_trace(go.Scatter(
-        x=source_df['avg_quality_score'],
-        y=source_df['fake_leads_percentage'],
+        x=quality,
+        y=fraud,
         mode='markers+text',
-        text=source_df['lead_source'],
+        text=source_df['lead_source'].to_numpy(),
         textposition='middle center',
         marker=dict(
-            size=np.sqrt(source_df['total_leads']) * 3,  # Size by volume (square root for better scaling)
-            color=[grade_colors.get(grade, '#636EFA') for grade in source_df['quality_grade']],
+            size=sizes,
+            color=grade_colors_for(source_df['quality_grade'], grade_colors),
             opacity=0.7,
             line=dict(width=2, color='white'),
             sizemode='diameter',
@@ -501,54 +603,57 @@ def create_lead_source_quality_chart(source_df: pd.DataFrame) -> go.Figure:
                       'Total Leads: %{customdata}<br>' +
                       'Grade: %{marker.color}<br>' +
                       '<extra></extra>',
-        customdata=source_df['total_leads'],
+        customdata=totals,
         name='Lead Sources'
     ))
     
-    # Update layout
+    # Quadrant lines and annotations go in with the layout in one update,
+    # skipping a validation pass per add_vline/add_hline/add_annotation call
     fig.update_layout(
         title="Lead Source Quality Matrix: Quality vs Fraud Risk",
         title_x=0.5,
         xaxis_title="Average Quality Score",
         yaxis_title="Fraud Rate (%)",
         height=500,
-        showlegend=False
+        showlegend=False,
+        shapes=[
+            dict(type="line", x0=7, x1=7, xref="x", y0=0, y1=1, yref="y domain",
+                 line=dict(dash="dash", color="green"), opacity=0.5),
+            dict(type="line", x0=0, x1=1, xref="x domain", y0=10, y1=10, yref="y",
+                 line=dict(dash="dash", color="red"), opacity=0.5)
+        ],
+        annotations=[
+            dict(x=8.5, y=5, text="🌟 Excellent<br>(High Quality, Low Fraud)",
+                 showarrow=False, bgcolor="rgba(0,255,0,0.1)"),
+            dict(x=5, y=5, text="⚠️ Needs Work<br>(Low Quality, Low Fraud)",
+                 showarrow=False, bgcolor="rgba(255,255,0,0.1)"),
+            dict(x=8.5, y=20, text="🤔 Investigate<br>(High Quality, High Fraud)",
+                 showarrow=False, bgcolor="rgba(255,165,0,0.1)"),
+            dict(x=5, y=20, text="🚨 Critical<br>(Low Quality, High Fraud)",
+                 showarrow=False, bgcolor="rgba(255,0,0,0.1)")
+        ],
+        xaxis_range=[0, 10],
+        yaxis_range=[0, max(np.nanmax(fraud) * 1.1, 25)]
     )
     
-    # Add quadrant lines
-    fig.add_vline(x=7, line_dash="dash", line_color="green", opacity=0.5)
-    fig.add_hline(y=10, line_dash="dash", line_color="red", opacity=0.5)
-    
-    # Add quadrant annotations
-    fig.add_annotation(x=8.5, y=5, text="🌟 Excellent<br>(High Quality, Low Fraud)", 
-                       showarrow=False, bgcolor="rgba(0,255,0,0.1)")
-    fig.add_annotation(x=5, y=5, text="⚠️ Needs Work<br>(Low Quality, Low Fraud)", 
-                       showarrow=False, bgcolor="rgba(255,255,0,0.1)")
-    fig.add_annotation(x=8.5, y=20, text="🤔 Investigate<br>(High Quality, High Fraud)", 
-                       showarrow=False, bgcolor="rgba(255,165,0,0.1)")
-    fig.add_annotation(x=5, y=20, text="🚨 Critical<br>(Low Quality, High Fraud)", 
-                       showarrow=False, bgcolor="rgba(255,0,0,0.1)")
-    
-    # Set axis ranges
-    fig.update_xaxes(range=[0, 10])
-    fig.update_yaxes(range=[0, max(source_df['fake_leads_percentage'].max() * 1.1, 25)])
-    
     return fig
 
 
+@st.cache_data(ttl=CHART_CACHE_TTL, show_spinner=False)
 def create_score_histogram(summary_df: pd.DataFrame) -> go.Figure:
     """Create histogram of validation scores."""
     if summary_df.empty or 'overall_score' not in summary_df.columns:
-        return go.Figure().add_annotation(
-            text="No score data available",
-            xref="paper", yref="paper",
-            x=0.5, y=0.5, showarrow=False
-        )
+        return _no_data_figure("No score data available")
+    
+    # Bin in NumPy so the figure carries 20 bars instead of every score
+    scores = pd.to_numeric(summary_df['overall_score'], errors='coerce').to_numpy(dtype=np.float64)
+    counts, edges = np.histogram(scores[np.isfinite(scores)], bins=20)
     
     fig = go.Figure(data=[
-        go.Histogram(
-            x=summary_df['overall_score'],
-            nbinsx=20,
+        go.Bar(
+            x=(edges[:-1] + edges[1:]) / 2,
+            y=counts,
+            width=np.diff(edges),
             marker_color='skyblue',
             opacity=0.7,
             name='Score Distribution'
@@ -567,6 +672,7 @@ def create_score_histogram(summary_df: pd.DataFrame) -> go.Figure:
         xaxis_title="Quality Score",
         yaxis_title="Number of Leads",
         height=400,
+        bargap=0,
         showlegend=False
     )
     
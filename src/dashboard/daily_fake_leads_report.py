@@ -1,11 +1,8 @@
 """Daily Fake Leads by Source Report - Focused monitoring dashboard."""
 import streamlit as st
 import sys
-import subprocess
 from pathlib import Path
 import pandas as pd
-import plotly.express as px
-import plotly.graph_objects as go
 from datetime import datetime
 import re
 
@@ -13,7 +10,7 @@ import re
 project_root = Path(__file__).parent.parent.parent
 sys.path.append(str(project_root))
 
-from src.dashboard.data_loader import get_database_connection
+from src.dashboard.data_loader import DuckDBManager, get_database_connection, report_query
 
 # Page configuration
 st.set_page_config(
@@ -24,7 +21,7 @@ st.set_page_config(
 )
 
 # Custom CSS - Compact and data-dense
-st.markdown("""
+REPORT_STYLES = """
 <style>
     .main-header {
         font-size: 1.8rem;
@@ -118,60 +115,78 @@ st.markdown("""
         font-size: 0.95rem;
     }
 </style>
-""", unsafe_allow_html=True)
+"""
+
+# Style-only HTML goes to the event container, not the page layout
+st.html(REPORT_STYLES)
 
 
 @st.cache_data(ttl=300)  # Cache for 5 minutes
 def load_daily_fake_leads(start_date=None, end_date=None):
     """Load fake leads by source for the specified date range."""
     try:
-        conn = get_database_connection()
-        
-        # Build date filter using simpler approach  
+        # Filter whole days of the pre-aggregated per-day counts
         if start_date and end_date:
-            if start_date == end_date:
-                # Single day
-                where_clause = f"AND created_date >= '{start_date} 00:00:00' AND created_date <= '{start_date} 23:59:59'"
-            else:
-                # Date range
-                where_clause = f"AND created_date >= '{start_date} 00:00:00' AND created_date <= '{end_date} 23:59:59'"
+            where_clause = f"WHERE created_day BETWEEN DATE '{start_date}' AND DATE '{end_date}'"
         else:
             # Default to today
-            where_clause = "AND DATE_TRUNC('day', created_date) = CURRENT_DATE"
+            where_clause = "WHERE created_day = CURRENT_DATE"
         
-        # Build query with string concatenation to avoid f-string issues
-        query = """
+        with DuckDBManager() as db:
+            # Reads report_daily_source_counts when the ETL has built it
+            daily_counts = report_query(db, 'report_daily_source_counts')
+            
+            # Build query with string concatenation to avoid f-string issues;
+            # counts are summed once, then the rates and flags derive from them
+            query = """
+            WITH source_counts AS (
+                SELECT 
+                    lead_source,
+                    SUM(total_leads)::BIGINT as total_leads_today,
+                    SUM(fake_leads_count)::BIGINT as fake_leads_count,
+                    SUM(critical_fraud_count)::BIGINT as critical_fraud_count,
+                    SUM(quality_score_sum)::DOUBLE / SUM(quality_score_count) as avg_quality_score,
+                    SUM(fraud_score_sum)::DOUBLE / SUM(total_leads) as avg_fraud_score,
+                    MIN(earliest_lead) as earliest_lead_today,
+                    MAX(latest_lead) as latest_lead_today
+                FROM (""" + daily_counts + """) daily_counts
+            """ + where_clause + """
+                GROUP BY lead_source
+            ),
+            source_rates AS (
+                SELECT 
+                    *,
+                    (fake_leads_count::DOUBLE / total_leads_today) * 100 as fake_rate,
+                    (critical_fraud_count::DOUBLE / total_leads_today) * 100 as critical_rate
+                FROM source_counts
+            )
             SELECT 
-                COALESCE(lead_source, 'Unknown') as lead_source,
-                COUNT(*) as total_leads_today,
-                COUNTIF(COALESCE(api_fake_lead, false) = true) as fake_leads_count,
-                COUNTIF(COALESCE(api_fraud_score, 0) >= 8) as critical_fraud_count,
-                ROUND((COUNTIF(COALESCE(api_fake_lead, false) = true)::DOUBLE / COUNT(*)) * 100, 2) as fake_leads_percentage,
-                ROUND((COUNTIF(COALESCE(api_fraud_score, 0) >= 8)::DOUBLE / COUNT(*)) * 100, 2) as critical_fraud_percentage,
-                AVG(COALESCE(api_quality_score, quality_score)) as avg_quality_score,
-                AVG(COALESCE(api_fraud_score, 0)) as avg_fraud_score,
+                lead_source,
+                total_leads_today,
+                fake_leads_count,
+                critical_fraud_count,
+                ROUND(fake_rate, 2) as fake_leads_percentage,
+                ROUND(critical_rate, 2) as critical_fraud_percentage,
+                avg_quality_score,
+                avg_fraud_score,
                 CASE 
-                    WHEN (COUNTIF(COALESCE(api_fake_lead, false) = true)::DOUBLE / COUNT(*)) * 100 >= 50 THEN 'CRITICAL'
-                    WHEN (COUNTIF(COALESCE(api_fake_lead, false) = true)::DOUBLE / COUNT(*)) * 100 >= 20 THEN 'HIGH'
-                    WHEN (COUNTIF(COALESCE(api_fake_lead, false) = true)::DOUBLE / COUNT(*)) * 100 >= 10 THEN 'MEDIUM'
-                    WHEN COUNTIF(COALESCE(api_fake_lead, false) = true) > 0 THEN 'LOW'
+                    WHEN fake_rate >= 50 THEN 'CRITICAL'
+                    WHEN fake_rate >= 20 THEN 'HIGH'
+                    WHEN fake_rate >= 10 THEN 'MEDIUM'
+                    WHEN fake_leads_count > 0 THEN 'LOW'
                     ELSE 'CLEAN'
                 END as daily_risk_level,
-                RANK() OVER (ORDER BY (COUNTIF(COALESCE(api_fake_lead, false) = true)::DOUBLE / COUNT(*)) * 100 DESC) as worst_source_rank,
-                CASE WHEN COUNTIF(COALESCE(api_fake_lead, false) = true) >= 3 THEN true ELSE false END as alert_volume,
-                CASE WHEN (COUNTIF(COALESCE(api_fake_lead, false) = true)::DOUBLE / COUNT(*)) * 100 >= 25 THEN true ELSE false END as alert_percentage,
-                MIN(created_date) as earliest_lead_today,
-                MAX(created_date) as latest_lead_today,
+                RANK() OVER (ORDER BY fake_rate DESC) as worst_source_rank,
+                fake_leads_count >= 3 as alert_volume,
+                fake_rate >= 25 as alert_percentage,
+                earliest_lead_today,
+                latest_lead_today,
                 CURRENT_DATE as report_date
-            FROM parsed_validations
-            WHERE parse_error IS NULL
-        """ + where_clause + """
-            GROUP BY COALESCE(lead_source, 'Unknown')
-            ORDER BY fake_leads_percentage DESC, fake_leads_count DESC
-        """
-        result = pd.read_sql(query, conn)
-        conn.close()
-        return result
+            FROM source_rates
+            -- Display order of the by-source table: fake count, then high risk, then rate
+            ORDER BY fake_leads_count DESC, critical_fraud_count DESC, fake_leads_percentage DESC
+            """
+            return db.conn.execute(query).fetch_df()
             
     except Exception as e:
         st.error(f"Error loading daily fake leads: {e}")
@@ -182,8 +197,6 @@ def load_daily_fake_leads(start_date=None, end_date=None):
 def load_daily_fake_leads_detail(start_date=None, end_date=None):
     """Load detailed list of fake and high risk leads for the specified date range."""
     try:
-        conn = get_database_connection()
-        
         # Build date filter using simpler approach
         if start_date and end_date:
             if start_date == end_date:
@@ -194,7 +207,7 @@ def load_daily_fake_leads_detail(start_date=None, end_date=None):
                 where_clause = f"AND created_date >= '{start_date} 00:00:00' AND created_date <= '{end_date} 23:59:59'"
         else:
             # Default to today
-            where_clause = "AND DATE_TRUNC('day', created_date) = CURRENT_DATE"
+            where_clause = "AND created_date >= CURRENT_DATE AND created_date < CURRENT_DATE + INTERVAL 1 DAY"
         
         # Build query with string concatenation to avoid f-string issues
         query = """
@@ -210,9 +223,6 @@ def load_daily_fake_leads_detail(start_date=None, end_date=None):
             COALESCE(api_fraud_factors, 'No specific factors') as fraud_factors,
             COALESCE(api_quality_factors, 'No specific factors') as quality_factors,
             COALESCE(api_recommendation, 'review') as recommendation,
-            COALESCE(api_fake_lead, false) as is_fake,
-            created_date,
-            parsed_at,
             
             -- Categorize the lead type
             CASE 
@@ -234,15 +244,14 @@ def load_daily_fake_leads_detail(start_date=None, end_date=None):
             lead_source, 
             created_date DESC
         """
-        result = pd.read_sql(query, conn)
-        conn.close()
-        return result
+        with DuckDBManager() as db:
+            return db.conn.execute(query).fetch_df()
     except Exception as e:
         st.error(f"Error loading daily fake leads detail: {e}")
         return pd.DataFrame()
 
 
-def show_daily_summary():
+def show_daily_summary(data: pd.DataFrame, problematic_leads_detail: pd.DataFrame):
     """Show summary statistics for selected date range."""
     # Get date range from session state
     start_date = st.session_state.get('report_start_date', datetime.now().date())
@@ -256,8 +265,6 @@ def show_daily_summary():
     
     st.markdown(f'<div class="section-header">{section_title}</div>', unsafe_allow_html=True)
     
-    data = load_daily_fake_leads(start_date, end_date)
-    
     if data.empty:
         date_desc = "today" if start_date == end_date == datetime.now().date() else "for the selected date range"
         st.success(f"🎉 **No fake leads detected {date_desc}!** All sources are clean.")
@@ -269,10 +276,10 @@ def show_daily_summary():
     total_fake_percentage = (total_fake_leads / total_leads_today * 100) if total_leads_today > 0 else 0
     
     # Get unique count of problematic leads (fake + high risk, no double counting)
-    problematic_leads_detail = load_daily_fake_leads_detail(start_date, end_date)
-    total_problematic_leads = len(problematic_leads_detail) if not problematic_leads_detail.empty else 0
-    fake_count_unique = len(problematic_leads_detail[problematic_leads_detail['lead_type'] == 'FAKE']) if not problematic_leads_detail.empty else 0
-    high_risk_count_unique = len(problematic_leads_detail[problematic_leads_detail['lead_type'] == 'HIGH_RISK']) if not problematic_leads_detail.empty else 0
+    total_problematic_leads = len(problematic_leads_detail)
+    lead_type_counts = problematic_leads_detail['lead_type'].value_counts() if total_problematic_leads else pd.Series(dtype='int64')
+    fake_count_unique = int(lead_type_counts.get('FAKE', 0))
+    high_risk_count_unique = int(lead_type_counts.get('HIGH_RISK', 0))
     total_problematic_percentage = (total_problematic_leads / total_leads_today * 100) if total_leads_today > 0 else 0
     
     # Key metrics cards
@@ -301,16 +308,103 @@ def show_daily_summary():
         )
 
 
-def show_fake_leads_by_source_table():
+def parse_factors(factors_text):
+    """Parse fraud/quality factors into individual metrics."""
+    factors = {}
+    if pd.isna(factors_text) or factors_text in ['No specific factors', 'No factors']:
+        return factors
+    
+    text = str(factors_text)
+    
+    # Common fraud factor patterns
+    if 'Known fake lead from database' in text:
+        factors['Known Fake Lead'] = 'TRUE'
+    if 'ML fraud model' in text:
+        ml_match = re.search(r'ML fraud model.*?score[:\s]*(\d+)', text)
+        if ml_match:
+            factors['ML Fraud Score'] = ml_match.group(1)
+        risk_match = re.search(r'ML fraud model[:\s]*(MEDIUM|HIGH|LOW|NORMAL) RISK', text)
+        if risk_match:
+            factors['ML Risk Level'] = risk_match.group(1)
+    
+    # Email factors
+    if 'Email not deliverable' in text:
+        factors['Email Deliverable'] = 'NO'
+    if 'Email deliverable' in text and 'not' not in text:
+        factors['Email Deliverable'] = 'YES'
+    if 'Valid email format' in text:
+        factors['Email Format Valid'] = 'YES'
+    if 'Invalid email' in text:
+        factors['Email Format Valid'] = 'NO'
+    
+    # Phone factors  
+    if 'Valid phone number' in text:
+        factors['Phone Valid'] = 'YES'
+    if 'Invalid phone' in text:
+        factors['Phone Valid'] = 'NO'
+    
+    # Geographic factors
+    if 'ZIP/state consistent' in text:
+        factors['ZIP State Consistent'] = 'YES'
+    if 'Valid postal code' in text:
+        factors['Postal Code Valid'] = 'YES'
+    if 'Valid state' in text:
+        factors['State Valid'] = 'YES'
+    
+    # Data completeness
+    completeness_match = re.search(r'Data completeness \((\d+)/(\d+)\)', text)
+    if completeness_match:
+        factors['Data Completeness'] = f"{completeness_match.group(1)}/{completeness_match.group(2)}"
+    
+    return factors
+
+
+def build_problematic_leads_export(export_leads: pd.DataFrame) -> pd.DataFrame:
+    """Build the problematic leads CSV table with one column per parsed factor."""
+    export_table = export_leads.copy()
+    export_table['name'] = export_table['first_name'] + ' ' + export_table['last_name']
+    for col in ('phone', 'company'):
+        values = export_table[col]
+        export_table[f'{col}_display'] = values.mask(values.isna() | (values == ''), 'Missing')
+    
+    # Parse factors for each lead (plain zip instead of iterrows)
+    all_factors = [
+        {**parse_factors(fraud_factors), **parse_factors(quality_factors)}
+        for fraud_factors, quality_factors in zip(export_table['fraud_factors'], export_table['quality_factors'])
+    ]
+    
+    # One column per factor name, built in a single frame instead of cell by cell
+    factor_table = pd.DataFrame(all_factors, index=export_table.index)
+    factor_names = sorted(factor_table.columns)
+    factor_table = factor_table.reindex(columns=factor_names).fillna('')
+    
+    # Create final export table
+    final_export = pd.concat([
+        export_table[[
+            'lead_id', 'lead_type', 'name', 'email', 'phone_display', 
+            'company_display', 'lead_source', 'fraud_score', 'recommendation'
+        ]],
+        factor_table
+    ], axis=1)
+    
+    # Add original text columns
+    final_export['Original Fraud Factors'] = export_table['fraud_factors']
+    final_export['Original Quality Issues'] = export_table['quality_factors']
+    
+    # Rename columns
+    base_columns = [
+        'Lead ID', 'Type', 'Name', 'Email', 'Phone', 
+        'Company', 'Source', 'Fraud Score', 'Action'
+    ]
+    final_export.columns = base_columns + factor_names + ['Original Fraud Factors', 'Original Quality Issues']
+    return final_export
+
+
+@st.fragment
+def show_fake_leads_by_source_table(data: pd.DataFrame, export_leads: pd.DataFrame):
     """Show a clean table of fake leads count by lead source."""
     st.markdown('<div class="section-header">📊 Fake Leads by Lead Source</div>', unsafe_allow_html=True)
     
-    # Get date range from session state
-    start_date = st.session_state.get('report_start_date', datetime.now().date())
-    end_date = st.session_state.get('report_end_date', datetime.now().date())
-    
-    data = load_daily_fake_leads(start_date, end_date)
-    
     if data.empty:
         st.info("No data available for today.")
         return
@@ -318,40 +412,29 @@ def show_fake_leads_by_source_table():
     # Create focused table with explicit column ordering
     # Order: Lead Source | Total Leads | Fake Leads | High Risk | Fake % | High Risk %
     if 'critical_fraud_count' in data.columns and 'critical_fraud_percentage' in data.columns:
-        table_columns = [
-            'lead_source', 
-            'total_leads_today', 
-            'fake_leads_count', 
-            'critical_fraud_count',
-            'fake_leads_percentage',
-            'critical_fraud_percentage'
-        ]
-    else:
-        table_columns = [
-            'lead_source', 
-            'total_leads_today', 
-            'fake_leads_count', 
-            'fake_leads_percentage'
-        ]
-    
-    table_data = data[table_columns].copy()
-    
-    # Sort by fake leads count (highest first), then by high risk, then by percentage
-    if 'critical_fraud_count' in table_data.columns:
-        table_data = table_data.sort_values(['fake_leads_count', 'critical_fraud_count', 'fake_leads_percentage'], ascending=[False, False, False])
-    else:
-        table_data = table_data.sort_values(['fake_leads_count', 'fake_leads_percentage'], ascending=[False, False])
-    
-    # Format the data
-    table_data['fake_leads_percentage'] = table_data['fake_leads_percentage'].round(1)
-    if 'critical_fraud_percentage' in table_data.columns:
-        table_data['critical_fraud_percentage'] = table_data['critical_fraud_percentage'].round(1)
-    
-    # Rename columns for clean display (ensuring correct order)
-    if 'critical_fraud_count' in table_data.columns and 'critical_fraud_percentage' in table_data.columns:
-        table_data.columns = ['Lead Source', 'Total Leads', 'Fake Leads', 'High Risk', 'Fake %', 'High Risk %']
+        table_columns = {
+            'lead_source': 'Lead Source',
+            'total_leads_today': 'Total Leads',
+            'fake_leads_count': 'Fake Leads',
+            'critical_fraud_count': 'High Risk',
+            'fake_leads_percentage': 'Fake %',
+            'critical_fraud_percentage': 'High Risk %'
+        }
     else:
-        table_data.columns = ['Lead Source', 'Total Leads', 'Fake Leads', 'Fake %']
+        table_columns = {
+            'lead_source': 'Lead Source',
+            'total_leads_today': 'Total Leads',
+            'fake_leads_count': 'Fake Leads',
+            'fake_leads_percentage': 'Fake %'
+        }
+    
+    # Rows arrive sorted by fake leads count (highest first), then by high risk,
+    # then by percentage, straight from the query; select, round and rename in one pass
+    table_data = (
+        data.loc[:, list(table_columns)]
+        .round({'fake_leads_percentage': 1, 'critical_fraud_percentage': 1})
+        .set_axis(list(table_columns.values()), axis=1)
+    )
     
     # Display the table (no special styling needed)
     st.dataframe(
@@ -363,7 +446,7 @@ def show_fake_leads_by_source_table():
     
     # Quick summary stats below table
     total_sources = len(table_data)
-    sources_with_fakes = len(table_data[table_data['Fake Leads'] > 0])
+    sources_with_fakes = int((table_data['Fake Leads'] > 0).sum())
     
     if sources_with_fakes > 0:
         st.info(f"📊 **{sources_with_fakes} out of {total_sources} sources** sent fake leads today")
@@ -373,112 +456,8 @@ def show_fake_leads_by_source_table():
     # Add direct download functionality here
     col_export = st.columns([1, 1, 1])[1]  # Center the button
     with col_export:
-        # Get date range and load problematic leads data directly
-        start_date = st.session_state.get('report_start_date', datetime.now().date())
-        end_date = st.session_state.get('report_end_date', datetime.now().date())
-        
-        # Load the problematic leads data for export
-        export_leads = load_daily_fake_leads_detail(start_date, end_date)
-        
         if not export_leads.empty:
-            # Generate the export data with parsed factors
-            def parse_factors(factors_text):
-                """Parse fraud/quality factors into individual metrics."""
-                import re
-                factors = {}
-                if pd.isna(factors_text) or factors_text in ['No specific factors', 'No factors']:
-                    return factors
-                
-                text = str(factors_text)
-                
-                # Common fraud factor patterns
-                if 'Known fake lead from database' in text:
-                    factors['Known Fake Lead'] = 'TRUE'
-                if 'ML fraud model' in text:
-                    ml_match = re.search(r'ML fraud model.*?score[:\s]*(\d+)', text)
-                    if ml_match:
-                        factors['ML Fraud Score'] = ml_match.group(1)
-                    risk_match = re.search(r'ML fraud model[:\s]*(MEDIUM|HIGH|LOW|NORMAL) RISK', text)
-                    if risk_match:
-                        factors['ML Risk Level'] = risk_match.group(1)
-                
-                # Email factors
-                if 'Email not deliverable' in text:
-                    factors['Email Deliverable'] = 'NO'
-                if 'Email deliverable' in text and 'not' not in text:
-                    factors['Email Deliverable'] = 'YES'
-                if 'Valid email format' in text:
-                    factors['Email Format Valid'] = 'YES'
-                if 'Invalid email' in text:
-                    factors['Email Format Valid'] = 'NO'
-                
-                # Phone factors  
-                if 'Valid phone number' in text:
-                    factors['Phone Valid'] = 'YES'
-                if 'Invalid phone' in text:
-                    factors['Phone Valid'] = 'NO'
-                
-                # Geographic factors
-                if 'ZIP/state consistent' in text:
-                    factors['ZIP State Consistent'] = 'YES'
-                if 'Valid postal code' in text:
-                    factors['Postal Code Valid'] = 'YES'
-                if 'Valid state' in text:
-                    factors['State Valid'] = 'YES'
-                
-                # Data completeness
-                completeness_match = re.search(r'Data completeness \((\d+)/(\d+)\)', text)
-                if completeness_match:
-                    factors['Data Completeness'] = f"{completeness_match.group(1)}/{completeness_match.group(2)}"
-                
-                return factors
-            
-            # Create export table
-            export_table = export_leads.copy()
-            export_table['name'] = export_table['first_name'] + ' ' + export_table['last_name']
-            export_table['phone_display'] = export_table['phone'].apply(lambda x: x if x else 'Missing')
-            export_table['company_display'] = export_table['company'].apply(lambda x: x if x else 'Missing')
-            
-            # Parse factors for each lead
-            all_factors = []
-            for _, row in export_table.iterrows():
-                fraud_parsed = parse_factors(row['fraud_factors'])
-                quality_parsed = parse_factors(row['quality_factors'])
-                combined_factors = {**fraud_parsed, **quality_parsed}
-                all_factors.append(combined_factors)
-            
-            # Get all unique factor names
-            all_factor_names = set()
-            for factors in all_factors:
-                all_factor_names.update(factors.keys())
-            
-            # Create final export table
-            final_export = export_table[[
-                'lead_id', 'lead_type', 'name', 'email', 'phone_display', 
-                'company_display', 'lead_source', 'fraud_score', 'recommendation'
-            ]].copy()
-            
-            # Add factor columns
-            for factor_name in sorted(all_factor_names):
-                final_export[factor_name] = ''
-            
-            # Populate factor columns
-            for i, factors in enumerate(all_factors):
-                for factor_name, factor_value in factors.items():
-                    final_export.loc[i, factor_name] = factor_value
-            
-            # Add original text columns
-            final_export['Original Fraud Factors'] = export_table['fraud_factors']
-            final_export['Original Quality Issues'] = export_table['quality_factors']
-            
-            # Rename columns
-            base_columns = [
-                'Lead ID', 'Type', 'Name', 'Email', 'Phone', 
-                'Company', 'Source', 'Fraud Score', 'Action'
-            ]
-            final_export.columns = base_columns + list(sorted(all_factor_names)) + ['Original Fraud Factors', 'Original Quality Issues']
-            
-            csv = final_export.to_csv(index=False)
+            csv = build_problematic_leads_export(export_leads).to_csv(index=False)
             
             st.download_button(
                 label="📥 Download All Data",
@@ -493,17 +472,17 @@ def show_fake_leads_by_source_table():
             st.info("📊 No problematic leads found for selected date range to export")
 
 
+@st.cache_data(ttl=60)  # Header timestamp; cleared with the other caches after an ETL run
 def get_last_refresh_time():
     """Get the timestamp of the last ETL run."""
     try:
-        conn = get_database_connection()
         query = """
         SELECT MAX(parsed_at) as last_refresh
         FROM parsed_validations
         WHERE parse_error IS NULL
         """
-        result = conn.execute(query).fetchone()
-        conn.close()
+        with DuckDBManager() as db:
+            result = db.conn.execute(query).fetchone()
         
         if result and result[0]:
             last_refresh = pd.to_datetime(result[0])
@@ -514,19 +493,50 @@ def get_last_refresh_time():
         return "Unknown"
 
 def run_etl_pipeline():
-    """Run the ETL pipeline to refresh data."""
+    """Run the ETL pipeline to refresh data, streaming its log into a status panel."""
+    import subprocess  # only needed when the refresh button is clicked
+    import threading
+    from collections import deque
+    
     try:
-        with st.spinner("🔄 Running ETL pipeline to refresh data..."):
-            # Run the ETL process
-            result = subprocess.run(
+        with st.status("🔄 Running ETL pipeline to refresh data...", expanded=False) as status:
+            # Run the ETL process; stderr (where it logs) is merged into stdout
+            proc = subprocess.Popen(
                 [sys.executable, "lead_validation_etl.py", "--validation-only"],
                 cwd=project_root,
-                capture_output=True,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
                 text=True,
-                timeout=300  # 5 minute timeout
+                bufsize=1
             )
             
-            if result.returncode == 0:
+            # Kill the ETL after 5 minutes; reading the pipe has no timeout of its own
+            timed_out = threading.Event()
+            
+            def stop_etl():
+                timed_out.set()
+                proc.kill()
+            
+            watchdog = threading.Timer(300, stop_etl)
+            watchdog.start()
+            
+            # Show each log line as it arrives; keep only the tail for error reports
+            recent_output = deque(maxlen=20)
+            try:
+                for line in proc.stdout:
+                    line = line.strip()
+                    if line:
+                        recent_output.append(line)
+                        status.update(label=f"🔄 {line.split(' - ', 2)[-1]}")
+                proc.wait()
+            finally:
+                watchdog.cancel()
+                proc.stdout.close()
+            
+            if timed_out.is_set():
+                raise subprocess.TimeoutExpired(proc.args, 300)
+            
+            if proc.returncode == 0:
                 # Force update the refresh timestamp even if no new data was processed
                 try:
                     conn = get_database_connection()
@@ -544,11 +554,14 @@ def run_etl_pipeline():
                 except Exception as e:
                     st.warning(f"Could not update timestamp: {e}")
                 
+                status.update(label="✅ ETL pipeline completed", state="complete")
                 st.success("✅ ETL pipeline completed successfully! Data refreshed.")
                 st.cache_data.clear()
                 return True
             else:
-                st.error(f"❌ ETL pipeline failed: {result.stderr}")
+                status.update(label="❌ ETL pipeline failed", state="error")
+                output = "\n".join(recent_output)
+                st.error(f"❌ ETL pipeline failed: {output}")
                 return False
                 
     except subprocess.TimeoutExpired:
@@ -558,6 +571,17 @@ def run_etl_pipeline():
         st.error(f"❌ Error running ETL pipeline: {e}")
         return False
 
+@st.fragment
+def show_refresh_button():
+    """Refresh button; the click reruns only this fragment until the ETL has finished."""
+    if st.button("🔄 Refresh Data", help="Run ETL pipeline to sync latest data from Salesforce"):
+        if run_etl_pipeline():
+            # New data affects every section, so rerun the whole report
+            st.rerun()
+        else:
+            st.error("Failed to refresh data. Please check ETL configuration.")
+
+
 def main():
     """Main fake leads report with date range selection."""
     current_date = datetime.now().strftime("%A, %B %d, %Y")
@@ -582,11 +606,7 @@ def main():
     
     with col_refresh:
         st.markdown("<br>", unsafe_allow_html=True)  # Align with date inputs
-        if st.button("🔄 Refresh Data", help="Run ETL pipeline to sync latest data from Salesforce"):
-            if run_etl_pipeline():
-                st.rerun()
-            else:
-                st.error("Failed to refresh data. Please check ETL configuration.")
+        show_refresh_button()
     
     # Determine report title based on date range
     if start_date == end_date:
@@ -612,11 +632,15 @@ def main():
     st.session_state['report_start_date'] = start_date
     st.session_state['report_end_date'] = end_date
     
+    # Load each dataset once per run and share it between the sections
+    data = load_daily_fake_leads(start_date, end_date)
+    problematic_leads_detail = load_daily_fake_leads_detail(start_date, end_date)
+    
     # Main report sections
-    show_daily_summary()
+    show_daily_summary(data, problematic_leads_detail)
     st.markdown("---")
     
-    show_fake_leads_by_source_table()
+    show_fake_leads_by_source_table(data, problematic_leads_detail)
     
 
 
@@ -1,32 +1,297 @@
 """Data loading functions for the Lead Validation Dashboard."""
 import duckdb
 import pandas as pd
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
+import os
 import sys
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
 import logging
 
 # Add project root to path for imports
 project_root = Path(__file__).parent.parent.parent
 sys.path.append(str(project_root))
 
-from config.settings import DUCKDB_PATH
+from config.settings import DUCKDB_PATH, DUCKDB_MEMORY_LIMIT, CACHE_SIZE_MB, ensure_dirs
+
+
+# Report queries (shared by the individual loaders and load_all_report_data)
+VALIDATION_METRICS_QUERY = """
+SELECT * FROM lead_validation_overview
+"""
+
+# Most recent validations kept in the lead summary
+SUMMARY_ROW_LIMIT = 1000
+
+VALIDATION_SUMMARY_QUERY = """
+SELECT 
+    task_id,
+    who_id as lead_id,
+    lead_source,
+    COALESCE(api_quality_score, quality_score) as overall_score,
+    CASE 
+        WHEN COALESCE(api_quality_score, quality_score) >= 9 THEN 'Excellent'
+        WHEN COALESCE(api_quality_score, quality_score) >= 7 THEN 'Good'
+        WHEN COALESCE(api_quality_score, quality_score) >= 5 THEN 'Fair'
+        WHEN COALESCE(api_quality_score, quality_score) >= 3 THEN 'Poor'
+        ELSE 'Invalid'
+    END as validation_status,
+    COALESCE(api_first_name, '') as first_name,
+    COALESCE(api_last_name, '') as last_name,
+    COALESCE(api_email, lead_email) as email,
+    COALESCE(api_phone, '') as phone,
+    COALESCE(api_company, lead_company) as company,
+    created_date,
+    last_modified_date,
+    FALSE as is_converted,  -- Not tracking conversions in this data
+    NULL as converted_date,
+    parsed_at as validation_timestamp
+FROM parsed_validations
+WHERE parse_error IS NULL
+ORDER BY parsed_at DESC
+LIMIT {limit}
+"""
+
+VALIDATION_BY_SOURCE_QUERY = """
+SELECT * FROM lead_source_quality_summary
+ORDER BY avg_quality_score DESC
+"""
+
+VALIDATION_TRENDS_QUERY = """
+WITH daily_trends AS (
+    SELECT 
+        DATE_TRUNC('day', created_date) as period_start,
+        COUNT(*) as leads_validated,
+        AVG(COALESCE(api_quality_score, quality_score)) as avg_score,
+        COUNTIF(COALESCE(api_quality_score, quality_score) >= 7) as quality_leads,
+        COUNTIF(COALESCE(api_fake_lead, false)) as fake_leads,
+        COUNT(DISTINCT lead_source) as unique_sources
+    FROM parsed_validations
+    WHERE parse_error IS NULL
+    AND created_date >= CURRENT_DATE - INTERVAL '30 days'
+    GROUP BY DATE_TRUNC('day', created_date)
+)
+SELECT 
+    'daily' as period_type,
+    period_start,
+    period_start + INTERVAL '1 day' as period_end,
+    leads_validated,
+    ROUND(avg_score, 4) as avg_score,
+    quality_leads,
+    ROUND((quality_leads::DOUBLE / leads_validated) * 100, 2) as quality_percentage,
+    fake_leads as converted_leads,  -- Reusing this field for fake leads
+    ROUND((fake_leads::DOUBLE / leads_validated) * 100, 2) as conversion_rate,  -- Actually fake lead rate
+    unique_sources,
+    
+    -- Trend indicators
+    LAG(avg_score) OVER (ORDER BY period_start) as prev_avg_score,
+    ROUND(avg_score - LAG(avg_score) OVER (ORDER BY period_start), 4) as score_change,
+    LAG(leads_validated) OVER (ORDER BY period_start) as prev_volume,
+    leads_validated - LAG(leads_validated) OVER (ORDER BY period_start) as volume_change
+FROM daily_trends
+ORDER BY period_start DESC
+LIMIT 30
+"""
+
+# Worst-scoring leads kept in the problematic list
+PROBLEMATIC_ROW_LIMIT = 500
+
+# Rank on the narrow (task_id, score, parsed_at) projection first, then join
+# back for the wide columns of just the rows that survive the LIMIT
+PROBLEMATIC_LEADS_QUERY = """
+WITH candidates AS MATERIALIZED (
+    SELECT 
+        task_id,
+        COALESCE(api_quality_score, quality_score) as overall_score,
+        parsed_at
+    FROM parsed_validations
+    WHERE parse_error IS NULL
+    AND COALESCE(api_quality_score, quality_score) < {score_threshold}
+    ORDER BY overall_score ASC, parsed_at DESC
+    LIMIT {limit}
+)
+SELECT 
+    c.task_id as lead_id,
+    c.overall_score,
+    CASE 
+        WHEN c.overall_score >= 9 THEN 'Excellent'
+        WHEN c.overall_score >= 7 THEN 'Good'
+        WHEN c.overall_score >= 5 THEN 'Fair'
+        WHEN c.overall_score >= 3 THEN 'Poor'
+        ELSE 'Invalid'
+    END as validation_status,
+    COALESCE(p.api_first_name, '') as first_name,
+    COALESCE(p.api_last_name, '') as last_name,
+    COALESCE(p.api_email, p.lead_email) as email,
+    COALESCE(p.api_phone, '') as phone,
+    COALESCE(p.api_company, p.lead_company) as company,
+    p.lead_source,
+    c.parsed_at as validation_timestamp,
+    false as is_converted
+FROM candidates c
+JOIN parsed_validations p USING (task_id)
+ORDER BY c.overall_score ASC, c.parsed_at DESC
+"""
+
+CONVERSION_ANALYSIS_QUERY = """
+WITH categorized AS (
+    SELECT 
+        CASE 
+            WHEN COALESCE(api_quality_score, quality_score) >= 9 THEN 'Excellent'
+            WHEN COALESCE(api_quality_score, quality_score) >= 7 THEN 'Good'
+            WHEN COALESCE(api_quality_score, quality_score) >= 5 THEN 'Fair'
+            WHEN COALESCE(api_quality_score, quality_score) >= 3 THEN 'Poor'
+            ELSE 'Invalid'
+        END as score_category,
+        COALESCE(api_quality_score, quality_score) as quality_score,
+        COALESCE(api_fake_lead, false) as is_fake
+    FROM parsed_validations
+    WHERE parse_error IS NULL
+)
+SELECT 
+    score_category,
+    COUNT(*) as total_leads,
+    COUNTIF(is_fake) as converted_leads,  -- Using fake leads as proxy
+    ROUND((COUNTIF(is_fake)::DOUBLE / COUNT(*)) * 100, 2) as conversion_rate,  -- Actually fraud rate
+    AVG(quality_score) as avg_score
+FROM categorized
+GROUP BY score_category
+ORDER BY 
+    CASE score_category
+        WHEN 'Excellent' THEN 1
+        WHEN 'Good' THEN 2
+        WHEN 'Fair' THEN 3
+        WHEN 'Poor' THEN 4
+        WHEN 'Invalid' THEN 5
+    END
+"""
+
+# Per-day, per-source counts; the daily fake-leads report sums the days in
+# its date range instead of rescanning parsed_validations
+DAILY_SOURCE_COUNTS_QUERY = """
+SELECT 
+    CAST(created_date AS DATE) as created_day,
+    COALESCE(lead_source, 'Unknown') as lead_source,
+    COUNT(*) as total_leads,
+    COUNTIF(COALESCE(api_fake_lead, false) = true)::BIGINT as fake_leads_count,
+    COUNTIF(COALESCE(api_fraud_score, 0) >= 8)::BIGINT as critical_fraud_count,
+    SUM(COALESCE(api_quality_score, quality_score))::BIGINT as quality_score_sum,
+    COUNT(COALESCE(api_quality_score, quality_score)) as quality_score_count,
+    SUM(COALESCE(api_fraud_score, 0))::BIGINT as fraud_score_sum,
+    MIN(created_date) as earliest_lead,
+    MAX(created_date) as latest_lead
+FROM parsed_validations
+WHERE parse_error IS NULL
+AND created_date IS NOT NULL
+GROUP BY CAST(created_date AS DATE), COALESCE(lead_source, 'Unknown')
+"""
+
+# Materialized report slices, rebuilt at the end of each ETL run
+REPORT_TABLES = {
+    'report_validation_metrics': VALIDATION_METRICS_QUERY,
+    'report_validation_by_source': VALIDATION_BY_SOURCE_QUERY,
+    'report_validation_trends': VALIDATION_TRENDS_QUERY,
+    'report_conversion_analysis': CONVERSION_ANALYSIS_QUERY,
+    'report_daily_source_counts': DAILY_SOURCE_COUNTS_QUERY,
+}
 
 
 def get_database_connection():
     """Get a DuckDB database connection."""
-    return duckdb.connect(DUCKDB_PATH)
+    ensure_dirs()
+    return connect_database(DUCKDB_PATH)
+
+
+def is_remote_path(path: str) -> bool:
+    """Check whether a database path points at object storage or HTTP."""
+    return path.startswith(('s3://', 'http://', 'https://'))
+
+
+def configure_connection(conn: duckdb.DuckDBPyConnection, remote: bool = False):
+    """Enable DuckDB's metadata caches on a connection.
+    
+    The object cache keeps Parquet metadata between queries. For remote
+    databases, cache_httpfs additionally keeps fetched blocks in memory so
+    repeated report queries do not download the same row groups again.
+    """
+    conn.execute("SET enable_object_cache=true")
+    
+    if not remote:
+        return
+    
+    try:
+        conn.execute("INSTALL cache_httpfs FROM community")
+        conn.execute("LOAD cache_httpfs")
+        conn.execute("SET cache_httpfs_type='in_memory'")
+        # 1 MiB blocks, so the block count is the cache size in MB
+        conn.execute("SET cache_httpfs_cache_block_size=1048576")
+        conn.execute(f"SET cache_httpfs_max_in_mem_cache_block_count={CACHE_SIZE_MB}")
+    except Exception as e:
+        logging.warning(f"cache_httpfs unavailable, reading remote data uncached: {e}")
+
+
+def connect_database(db_path: str, read_only: bool = False) -> duckdb.DuckDBPyConnection:
+    """Open a local DuckDB connection with the configured memory limit and all cores."""
+    config = {'memory_limit': DUCKDB_MEMORY_LIMIT, 'threads': os.cpu_count() or 4}
+    conn = duckdb.connect(db_path, read_only=read_only, config=config)
+    configure_connection(conn)
+    return conn
+
+
+@lru_cache(maxsize=1)
+def get_remote_connection() -> duckdb.DuckDBPyConnection:
+    """Get the process-wide connection to a remote (object storage/HTTP) database.
+    
+    The database is attached read-only and holds no local file lock, so it
+    is kept open for the life of the process; cache_httpfs then serves
+    repeated reads of the same blocks from memory.
+    """
+    config = {'memory_limit': DUCKDB_MEMORY_LIMIT, 'threads': os.cpu_count() or 4}
+    conn = duckdb.connect(config=config)
+    configure_connection(conn, remote=True)
+    conn.execute(f"ATTACH '{DUCKDB_PATH}' AS leads (READ_ONLY)")
+    conn.execute("USE leads")
+    return conn
+
+
+_views_created = False
+
+
+def ensure_views(db: 'DuckDBManager'):
+    """Create the analytical views once per process, as soon as the base table exists."""
+    global _views_created
+    if _views_created:
+        return
+    
+    if db.table_exists('main', 'parsed_validations'):
+        create_views(db)
+        _views_created = True
 
 
 class DuckDBManager:
-    """Context manager for DuckDB connections."""
+    """Context manager for DuckDB connections.
+    
+    Every use opens its own connection and closes it on exit, so the
+    database file is only locked while a load runs and the ETL can write
+    between loads. Without a db_path the configured dashboard database is
+    used (a remote database is read through a cursor on one shared
+    connection instead).
+    """
     
-    def __init__(self, db_path: str = DUCKDB_PATH):
+    def __init__(self, db_path: Optional[str] = None):
         self.db_path = db_path
         self.conn = None
     
     def __enter__(self):
-        self.conn = duckdb.connect(self.db_path)
+        if self.db_path is not None:
+            self.conn = connect_database(self.db_path)
+        elif is_remote_path(DUCKDB_PATH):
+            self.conn = get_remote_connection().cursor()
+        else:
+            ensure_dirs()
+            self.conn = connect_database(DUCKDB_PATH)
+            ensure_views(self)
         return self
     
     def __exit__(self, exc_type, exc_val, exc_tb):
@@ -34,9 +299,14 @@ class DuckDBManager:
             self.conn.close()
     
     def execute_query(self, query: str) -> pd.DataFrame:
-        """Execute a query and return results as DataFrame."""
+        """Execute a query and return results as DataFrame.
+        
+        DuckDB builds the DataFrame natively from its columnar result, so
+        there is no DB-API round-trip through Python row tuples as with
+        pd.read_sql.
+        """
         try:
-            return self.conn.execute(query).df()
+            return self.conn.execute(query).fetch_df()
         except Exception as e:
             logging.error(f"Query execution failed: {e}")
             return pd.DataFrame()
@@ -54,6 +324,20 @@ class DuckDBManager:
             return False
 
 
+def report_query(db: DuckDBManager, table: str) -> str:
+    """Read a report slice from its materialized table, or compute it live."""
+    if db.table_exists('main', table):
+        return f"SELECT * FROM {table}"
+    return REPORT_TABLES[table]
+
+
+def refresh_report_tables(db: DuckDBManager):
+    """Rebuild the materialized report tables from the live queries."""
+    create_views(db)
+    for table, query in REPORT_TABLES.items():
+        db.conn.execute(f"CREATE OR REPLACE TABLE {table} AS {query}")
+
+
 def load_validation_metrics() -> pd.DataFrame:
     """Load overall validation metrics."""
     with DuckDBManager() as db:
@@ -67,17 +351,15 @@ def load_validation_metrics() -> pd.DataFrame:
         if not table_exists:
             return pd.DataFrame()
         
-        # Ensure views exist
-        create_views(db)
-        
-        query = """
-        SELECT * FROM lead_validation_overview
-        """
-        return db.execute_query(query)
+        return db.execute_query(report_query(db, 'report_validation_metrics'))
 
 
-def load_validation_summary() -> pd.DataFrame:
-    """Load parsed validation data summary."""
+def load_validation_summary(limit: int = SUMMARY_ROW_LIMIT) -> pd.DataFrame:
+    """Load parsed validation data summary, newest first.
+    
+    The limit is applied in SQL so only the rows that are shown get
+    materialized into pandas.
+    """
     with DuckDBManager() as db:
         # Check if parsed_validations table exists
         try:
@@ -89,37 +371,7 @@ def load_validation_summary() -> pd.DataFrame:
         if not table_exists:
             return pd.DataFrame()
         
-        create_views(db)
-        
-        query = """
-        SELECT 
-            task_id,
-            who_id as lead_id,
-            lead_source,
-            COALESCE(api_quality_score, quality_score) as overall_score,
-            CASE 
-                WHEN COALESCE(api_quality_score, quality_score) >= 9 THEN 'Excellent'
-                WHEN COALESCE(api_quality_score, quality_score) >= 7 THEN 'Good'
-                WHEN COALESCE(api_quality_score, quality_score) >= 5 THEN 'Fair'
-                WHEN COALESCE(api_quality_score, quality_score) >= 3 THEN 'Poor'
-                ELSE 'Invalid'
-            END as validation_status,
-            COALESCE(api_first_name, '') as first_name,
-            COALESCE(api_last_name, '') as last_name,
-            COALESCE(api_email, lead_email) as email,
-            COALESCE(api_phone, '') as phone,
-            COALESCE(api_company, lead_company) as company,
-            created_date,
-            last_modified_date,
-            FALSE as is_converted,  -- Not tracking conversions in this data
-            NULL as converted_date,
-            parsed_at as validation_timestamp
-        FROM parsed_validations
-        WHERE parse_error IS NULL
-        ORDER BY parsed_at DESC
-        LIMIT 1000
-        """
-        return db.execute_query(query)
+        return db.execute_query(VALIDATION_SUMMARY_QUERY.format(limit=min(int(limit), SUMMARY_ROW_LIMIT)))
 
 
 def load_validation_by_source() -> pd.DataFrame:
@@ -135,13 +387,7 @@ def load_validation_by_source() -> pd.DataFrame:
         if not table_exists:
             return pd.DataFrame()
         
-        create_views(db)
-        
-        query = """
-        SELECT * FROM lead_source_quality_summary
-        ORDER BY avg_quality_score DESC
-        """
-        return db.execute_query(query)
+        return db.execute_query(report_query(db, 'report_validation_by_source'))
 
 
 def load_validation_trends() -> pd.DataFrame:
@@ -157,44 +403,7 @@ def load_validation_trends() -> pd.DataFrame:
         if not table_exists:
             return pd.DataFrame()
         
-        create_views(db)
-        
-        query = """
-        WITH daily_trends AS (
-            SELECT 
-                DATE_TRUNC('day', created_date) as period_start,
-                COUNT(*) as leads_validated,
-                AVG(COALESCE(api_quality_score, quality_score)) as avg_score,
-                COUNTIF(COALESCE(api_quality_score, quality_score) >= 7) as quality_leads,
-                COUNTIF(COALESCE(api_fake_lead, false)) as fake_leads,
-                COUNT(DISTINCT lead_source) as unique_sources
-            FROM parsed_validations
-            WHERE parse_error IS NULL
-            AND created_date >= CURRENT_DATE - INTERVAL '30 days'
-            GROUP BY DATE_TRUNC('day', created_date)
-        )
-        SELECT 
-            'daily' as period_type,
-            period_start,
-            period_start + INTERVAL '1 day' as period_end,
-            leads_validated,
-            ROUND(avg_score, 4) as avg_score,
-            quality_leads,
-            ROUND((quality_leads::DOUBLE / leads_validated) * 100, 2) as quality_percentage,
-            fake_leads as converted_leads,  -- Reusing this field for fake leads
-            ROUND((fake_leads::DOUBLE / leads_validated) * 100, 2) as conversion_rate,  -- Actually fake lead rate
-            unique_sources,
-            
-            -- Trend indicators
-            LAG(avg_score) OVER (ORDER BY period_start) as prev_avg_score,
-            ROUND(avg_score - LAG(avg_score) OVER (ORDER BY period_start), 4) as score_change,
-            LAG(leads_validated) OVER (ORDER BY period_start) as prev_volume,
-            leads_validated - LAG(leads_validated) OVER (ORDER BY period_start) as volume_change
-        FROM daily_trends
-        ORDER BY period_start DESC
-        LIMIT 30
-        """
-        return db.execute_query(query)
+        return db.execute_query(report_query(db, 'report_validation_trends'))
 
 
 def load_recent_validations(limit: int = 100) -> pd.DataFrame:
@@ -237,8 +446,31 @@ def load_recent_validations(limit: int = 100) -> pd.DataFrame:
         return db.execute_query(query)
 
 
-def load_problematic_leads(score_threshold: float = 6) -> pd.DataFrame:
-    """Load leads with validation issues."""
+def run_query(conn: duckdb.DuckDBPyConnection, query: str) -> pd.DataFrame:
+    """Run a query on its own cursor of the given connection."""
+    cursor = conn.cursor()
+    try:
+        return cursor.execute(query).fetch_df()
+    except Exception as e:
+        logging.error(f"Query execution failed: {e}")
+        return pd.DataFrame()
+    finally:
+        cursor.close()
+
+
+def add_problematic_display_columns(df: pd.DataFrame) -> pd.DataFrame:
+    """Add the display name and company columns used by the reports (vectorized, once per load)."""
+    if df.empty:
+        return df
+    
+    return df.assign(
+        full_name=(df['first_name'].fillna('') + ' ' + df['last_name'].fillna('')).str.strip(),
+        company=df['company'].fillna('N/A')
+    )
+
+
+def load_problematic_leads(score_threshold: float = 6, limit: int = PROBLEMATIC_ROW_LIMIT) -> pd.DataFrame:
+    """Load leads with validation issues, worst first (limit applied in SQL)."""
     with DuckDBManager() as db:
         # Check if parsed_validations table exists
         try:
@@ -250,34 +482,11 @@ def load_problematic_leads(score_threshold: float = 6) -> pd.DataFrame:
         if not table_exists:
             return pd.DataFrame()
         
-        create_views(db)
-        
-        query = f"""
-        SELECT 
-            task_id as lead_id,
-            COALESCE(api_quality_score, quality_score) as overall_score,
-            CASE 
-                WHEN COALESCE(api_quality_score, quality_score) >= 9 THEN 'Excellent'
-                WHEN COALESCE(api_quality_score, quality_score) >= 7 THEN 'Good'
-                WHEN COALESCE(api_quality_score, quality_score) >= 5 THEN 'Fair'
-                WHEN COALESCE(api_quality_score, quality_score) >= 3 THEN 'Poor'
-                ELSE 'Invalid'
-            END as validation_status,
-            COALESCE(api_first_name, '') as first_name,
-            COALESCE(api_last_name, '') as last_name,
-            COALESCE(api_email, lead_email) as email,
-            COALESCE(api_phone, '') as phone,
-            COALESCE(api_company, lead_company) as company,
-            lead_source,
-            parsed_at as validation_timestamp,
-            false as is_converted
-        FROM parsed_validations
-        WHERE parse_error IS NULL
-        AND COALESCE(api_quality_score, quality_score) < {score_threshold}
-        ORDER BY COALESCE(api_quality_score, quality_score) ASC, parsed_at DESC
-        LIMIT 500
-        """
-        return db.execute_query(query)
+        return add_problematic_display_columns(
+            db.execute_query(PROBLEMATIC_LEADS_QUERY.format(
+                score_threshold=score_threshold, limit=min(int(limit), PROBLEMATIC_ROW_LIMIT)
+            ))
+        )
 
 
 def load_conversion_analysis() -> pd.DataFrame:
@@ -293,41 +502,50 @@ def load_conversion_analysis() -> pd.DataFrame:
         if not table_exists:
             return pd.DataFrame()
         
-        create_views(db)
+        return db.execute_query(report_query(db, 'report_conversion_analysis'))
+
+
+def load_all_report_data(score_threshold: float = 6,
+                         report_names: Optional[List[str]] = None) -> Dict[str, pd.DataFrame]:
+    """Load report datasets over a single connection.
+    
+    Runs the table check once, then issues the requested report queries
+    (all six by default) concurrently on cursors of one connection
+    instead of reconnecting per dataset.
+    """
+    if report_names is None:
+        report_names = ['metrics', 'summary', 'by_source', 'trends', 'problematic', 'conversion']
+    
+    with DuckDBManager() as db:
+        # Check if parsed_validations table exists
+        try:
+            db.conn.execute("SELECT COUNT(*) FROM parsed_validations LIMIT 1")
+            table_exists = True
+        except:
+            table_exists = False
         
-        query = """
-        WITH categorized AS (
-            SELECT 
-                CASE 
-                    WHEN COALESCE(api_quality_score, quality_score) >= 9 THEN 'Excellent'
-                    WHEN COALESCE(api_quality_score, quality_score) >= 7 THEN 'Good'
-                    WHEN COALESCE(api_quality_score, quality_score) >= 5 THEN 'Fair'
-                    WHEN COALESCE(api_quality_score, quality_score) >= 3 THEN 'Poor'
-                    ELSE 'Invalid'
-                END as score_category,
-                COALESCE(api_quality_score, quality_score) as quality_score,
-                COALESCE(api_fake_lead, false) as is_fake
-            FROM parsed_validations
-            WHERE parse_error IS NULL
-        )
-        SELECT 
-            score_category,
-            COUNT(*) as total_leads,
-            COUNTIF(is_fake) as converted_leads,  -- Using fake leads as proxy
-            ROUND((COUNTIF(is_fake)::DOUBLE / COUNT(*)) * 100, 2) as conversion_rate,  -- Actually fraud rate
-            AVG(quality_score) as avg_score
-        FROM categorized
-        GROUP BY score_category
-        ORDER BY 
-            CASE score_category
-                WHEN 'Excellent' THEN 1
-                WHEN 'Good' THEN 2
-                WHEN 'Fair' THEN 3
-                WHEN 'Poor' THEN 4
-                WHEN 'Invalid' THEN 5
-            END
-        """
-        return db.execute_query(query)
+        if not table_exists:
+            return {name: pd.DataFrame() for name in report_names}
+        
+        report_queries = {
+            'metrics': lambda: report_query(db, 'report_validation_metrics'),
+            'summary': lambda: VALIDATION_SUMMARY_QUERY.format(limit=SUMMARY_ROW_LIMIT),
+            'by_source': lambda: report_query(db, 'report_validation_by_source'),
+            'trends': lambda: report_query(db, 'report_validation_trends'),
+            'problematic': lambda: PROBLEMATIC_LEADS_QUERY.format(score_threshold=score_threshold, limit=PROBLEMATIC_ROW_LIMIT),
+            'conversion': lambda: report_query(db, 'report_conversion_analysis'),
+        }
+        queries = {name: report_queries[name]() for name in report_names}
+        
+        # Each query runs on its own cursor of this connection; DuckDB
+        # releases the GIL while executing, so the queries overlap
+        with ThreadPoolExecutor(max_workers=max(len(queries), 1)) as executor:
+            futures = {name: executor.submit(run_query, db.conn, query) for name, query in queries.items()}
+            results = {name: future.result() for name, future in futures.items()}
+    
+    if 'problematic' in results:
+        results['problematic'] = add_problematic_display_columns(results['problematic'])
+    return results
 
 
 def create_views(db: DuckDBManager):
@@ -366,8 +584,6 @@ def load_worst_lead_sources() -> pd.DataFrame:
         if not table_exists:
             return pd.DataFrame()
         
-        create_views(db)
-        
         query = """
         SELECT * FROM worst_lead_sources
         ORDER BY problem_score DESC
@@ -376,6 +592,19 @@ def load_worst_lead_sources() -> pd.DataFrame:
         return db.execute_query(query)
 
 
+def get_latest_batch_id() -> Optional[str]:
+    """Get the batch id of the most recent completed ETL run."""
+    with DuckDBManager() as db:
+        try:
+            row = db.conn.execute(
+                "SELECT batch_id FROM etl_runs ORDER BY completed_at DESC LIMIT 1"
+            ).fetchone()
+        except:
+            return None
+        
+        return row[0] if row else None
+
+
 def get_data_freshness() -> Dict[str, Any]:
     """Get data freshness information."""
     with DuckDBManager() as db:
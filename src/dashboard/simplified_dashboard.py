@@ -3,7 +3,8 @@ import streamlit as st
 import sys
 from pathlib import Path
 import pandas as pd
-import plotly.express as px
+import duckdb
+from plotly.colors import qualitative
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 import json
@@ -12,7 +13,7 @@ import json
 project_root = Path(__file__).parent.parent.parent
 sys.path.append(str(project_root))
 
-from src.dashboard.data_loader import get_database_connection
+from src.dashboard.data_loader import DuckDBManager
 
 # Page configuration
 st.set_page_config(
@@ -120,51 +121,50 @@ st.markdown("""
 def load_overall_results(date_filter="All Time"):
     """Load overall validation results with date filtering."""
     try:
-        conn = get_database_connection()
-        
-        # Build date filter clause
-        date_clause = get_date_filter_clause(date_filter)
-        
-        # Try simplified view first, fall back to existing data structure
-        try:
-            query = "SELECT * FROM simplified_overall_results"
-            result = pd.read_sql(query, conn)
-            conn.close()
-            return result
-        except:
-            # Fall back to existing parsed_validations structure with date filtering
-            query = f"""
-            SELECT 
-                COUNT(*) as total_validations,
-                COUNT(DISTINCT task_id) as unique_leads,
-                AVG(COALESCE(api_quality_score, quality_score)) / 10.0 as avg_data_quality_score,
-                AVG(COALESCE(api_quality_score, quality_score)) / 10.0 as median_data_quality_score,
-                AVG(CASE WHEN COALESCE(api_fake_lead, false) THEN 0.8 ELSE 0.2 END) as avg_fraud_score,
-                AVG(CASE WHEN COALESCE(api_fake_lead, false) THEN 0.8 ELSE 0.2 END) as median_fraud_score,
-                AVG(COALESCE(api_quality_score, quality_score)) / 10.0 as avg_overall_score,
-                AVG(COALESCE(api_quality_score, quality_score)) / 10.0 as median_overall_score,
-                COUNTIF(COALESCE(api_quality_score, quality_score) >= 7) as excellent_quality_count,
-                COUNTIF(COALESCE(api_quality_score, quality_score) >= 5 AND COALESCE(api_quality_score, quality_score) < 7) as good_quality_count,
-                COUNTIF(COALESCE(api_quality_score, quality_score) >= 3 AND COALESCE(api_quality_score, quality_score) < 5) as fair_quality_count,
-                COUNTIF(COALESCE(api_quality_score, quality_score) < 3) as poor_quality_count,
-                COUNTIF(COALESCE(api_fake_lead, false)) as critical_fraud_risk_count,
-                ROUND((COUNTIF(COALESCE(api_quality_score, quality_score) >= 7)::DOUBLE / COUNT(*)) * 100, 2) as high_quality_percentage,
-                ROUND((COUNTIF(COALESCE(api_fake_lead, false))::DOUBLE / COUNT(*)) * 100, 2) as high_fraud_risk_percentage,
-                MIN(parsed_at) as earliest_validation,
-                MAX(parsed_at) as latest_validation,
-                CASE 
-                    WHEN AVG(COALESCE(api_quality_score, quality_score)) >= 8 THEN 'EXCELLENT'
-                    WHEN AVG(COALESCE(api_quality_score, quality_score)) >= 6 THEN 'GOOD'
-                    WHEN AVG(COALESCE(api_quality_score, quality_score)) >= 4 THEN 'FAIR'
-                    ELSE 'POOR'
-                END as overall_system_status
-            FROM parsed_validations
-            WHERE parse_error IS NULL
-            AND created_date {date_clause}
-            """
-            result = pd.read_sql(query, conn)
-            conn.close()
-            return result
+        with DuckDBManager() as db:
+            conn = db.conn
+            
+            # Build date filter clause
+            date_clause = get_date_filter_clause(date_filter)
+            
+            # Try simplified view first, fall back to existing data structure
+            try:
+                query = "SELECT * FROM simplified_overall_results"
+                result = conn.execute(query).fetch_df()
+                return result
+            except duckdb.CatalogException:
+                # Fall back to existing parsed_validations structure with date filtering
+                query = f"""
+                SELECT 
+                    COUNT(*) as total_validations,
+                    COUNT(DISTINCT task_id) as unique_leads,
+                    AVG(COALESCE(api_quality_score, quality_score)) / 10.0 as avg_data_quality_score,
+                    AVG(COALESCE(api_quality_score, quality_score)) / 10.0 as median_data_quality_score,
+                    AVG(CASE WHEN COALESCE(api_fake_lead, false) THEN 0.8 ELSE 0.2 END) as avg_fraud_score,
+                    AVG(CASE WHEN COALESCE(api_fake_lead, false) THEN 0.8 ELSE 0.2 END) as median_fraud_score,
+                    AVG(COALESCE(api_quality_score, quality_score)) / 10.0 as avg_overall_score,
+                    AVG(COALESCE(api_quality_score, quality_score)) / 10.0 as median_overall_score,
+                    COUNTIF(COALESCE(api_quality_score, quality_score) >= 7) as excellent_quality_count,
+                    COUNTIF(COALESCE(api_quality_score, quality_score) >= 5 AND COALESCE(api_quality_score, quality_score) < 7) as good_quality_count,
+                    COUNTIF(COALESCE(api_quality_score, quality_score) >= 3 AND COALESCE(api_quality_score, quality_score) < 5) as fair_quality_count,
+                    COUNTIF(COALESCE(api_quality_score, quality_score) < 3) as poor_quality_count,
+                    COUNTIF(COALESCE(api_fake_lead, false)) as critical_fraud_risk_count,
+                    ROUND((COUNTIF(COALESCE(api_quality_score, quality_score) >= 7)::DOUBLE / COUNT(*)) * 100, 2) as high_quality_percentage,
+                    ROUND((COUNTIF(COALESCE(api_fake_lead, false))::DOUBLE / COUNT(*)) * 100, 2) as high_fraud_risk_percentage,
+                    MIN(parsed_at) as earliest_validation,
+                    MAX(parsed_at) as latest_validation,
+                    CASE 
+                        WHEN AVG(COALESCE(api_quality_score, quality_score)) >= 8 THEN 'EXCELLENT'
+                        WHEN AVG(COALESCE(api_quality_score, quality_score)) >= 6 THEN 'GOOD'
+                        WHEN AVG(COALESCE(api_quality_score, quality_score)) >= 4 THEN 'FAIR'
+                        ELSE 'POOR'
+                    END as overall_system_status
+                FROM parsed_validations
+                WHERE parse_error IS NULL
+                AND created_date {date_clause}
+                """
+                result = conn.execute(query).fetch_df()
+                return result
     except Exception as e:
         st.error(f"Error loading overall results: {e}")
         return pd.DataFrame()
@@ -187,59 +187,58 @@ def get_date_filter_clause(date_filter):
 def load_results_by_source(date_filter="All Time"):
     """Load validation results by source with date filtering."""
     try:
-        conn = get_database_connection()
-        
-        # Build date filter clause
-        date_clause = get_date_filter_clause(date_filter)
-        
-        # Try simplified view first, fall back to existing data structure
-        try:
-            query = "SELECT * FROM simplified_results_by_source ORDER BY avg_data_quality_score DESC"
-            result = pd.read_sql(query, conn)
-            conn.close()
-            return result
-        except:
-            # Fall back to existing structure with date filtering
-            query = f"""
-            SELECT 
-                COALESCE(lead_source, 'Unknown') as lead_source,
-                COUNT(*) as total_validations,
-                COUNT(DISTINCT task_id) as unique_leads,
-                AVG(COALESCE(api_quality_score, quality_score)) / 10.0 as avg_data_quality_score,
-                AVG(COALESCE(api_quality_score, quality_score)) / 10.0 as median_data_quality_score,
-                AVG(CASE WHEN COALESCE(api_fake_lead, false) THEN 0.8 ELSE 0.2 END) as avg_fraud_score,
-                AVG(CASE WHEN COALESCE(api_fake_lead, false) THEN 0.8 ELSE 0.2 END) as median_fraud_score,
-                COUNTIF(COALESCE(api_quality_score, quality_score) >= 7) as excellent_quality_count,
-                COUNTIF(COALESCE(api_quality_score, quality_score) >= 5 AND COALESCE(api_quality_score, quality_score) < 7) as good_quality_count,
-                COUNTIF(COALESCE(api_quality_score, quality_score) >= 3 AND COALESCE(api_quality_score, quality_score) < 5) as fair_quality_count,
-                COUNTIF(COALESCE(api_quality_score, quality_score) < 3) as poor_quality_count,
-                COUNTIF(COALESCE(api_fake_lead, false)) as likely_fake_leads_count,
-                ROUND((COUNTIF(COALESCE(api_fake_lead, false))::DOUBLE / COUNT(*)) * 100, 2) as fake_leads_percentage,
-                RANK() OVER (ORDER BY AVG(COALESCE(api_quality_score, quality_score)) DESC) as quality_rank,
-                CASE 
-                    WHEN AVG(CASE WHEN COALESCE(api_fake_lead, false) THEN 0.8 ELSE 0.2 END) >= 0.7 THEN 'CRITICAL'
-                    WHEN AVG(CASE WHEN COALESCE(api_fake_lead, false) THEN 0.8 ELSE 0.2 END) >= 0.5 THEN 'HIGH'
-                    WHEN AVG(CASE WHEN COALESCE(api_fake_lead, false) THEN 0.8 ELSE 0.2 END) >= 0.3 THEN 'MEDIUM'
-                    ELSE 'LOW'
-                END as source_risk_level,
-                CASE 
-                    WHEN AVG(COALESCE(api_quality_score, quality_score)) >= 9 THEN 'A+'
-                    WHEN AVG(COALESCE(api_quality_score, quality_score)) >= 7 THEN 'A'
-                    WHEN AVG(COALESCE(api_quality_score, quality_score)) >= 5 THEN 'B'
-                    WHEN AVG(COALESCE(api_quality_score, quality_score)) >= 3 THEN 'C'
-                    ELSE 'F'
-                END as source_grade,
-                MIN(parsed_at) as first_validation,
-                MAX(parsed_at) as latest_validation
-            FROM parsed_validations 
-            WHERE parse_error IS NULL
-            AND created_date {date_clause}
-            GROUP BY COALESCE(lead_source, 'Unknown')
-            ORDER BY avg_data_quality_score DESC
-            """
-            result = pd.read_sql(query, conn)
-            conn.close()
-            return result
+        with DuckDBManager() as db:
+            conn = db.conn
+            
+            # Build date filter clause
+            date_clause = get_date_filter_clause(date_filter)
+            
+            # Try simplified view first, fall back to existing data structure
+            try:
+                query = "SELECT * FROM simplified_results_by_source ORDER BY avg_data_quality_score DESC"
+                result = conn.execute(query).fetch_df()
+                return result
+            except duckdb.CatalogException:
+                # Fall back to existing structure with date filtering
+                query = f"""
+                SELECT 
+                    COALESCE(lead_source, 'Unknown') as lead_source,
+                    COUNT(*) as total_validations,
+                    COUNT(DISTINCT task_id) as unique_leads,
+                    AVG(COALESCE(api_quality_score, quality_score)) / 10.0 as avg_data_quality_score,
+                    AVG(COALESCE(api_quality_score, quality_score)) / 10.0 as median_data_quality_score,
+                    AVG(CASE WHEN COALESCE(api_fake_lead, false) THEN 0.8 ELSE 0.2 END) as avg_fraud_score,
+                    AVG(CASE WHEN COALESCE(api_fake_lead, false) THEN 0.8 ELSE 0.2 END) as median_fraud_score,
+                    COUNTIF(COALESCE(api_quality_score, quality_score) >= 7) as excellent_quality_count,
+                    COUNTIF(COALESCE(api_quality_score, quality_score) >= 5 AND COALESCE(api_quality_score, quality_score) < 7) as good_quality_count,
+                    COUNTIF(COALESCE(api_quality_score, quality_score) >= 3 AND COALESCE(api_quality_score, quality_score) < 5) as fair_quality_count,
+                    COUNTIF(COALESCE(api_quality_score, quality_score) < 3) as poor_quality_count,
+                    COUNTIF(COALESCE(api_fake_lead, false)) as likely_fake_leads_count,
+                    ROUND((COUNTIF(COALESCE(api_fake_lead, false))::DOUBLE / COUNT(*)) * 100, 2) as fake_leads_percentage,
+                    RANK() OVER (ORDER BY AVG(COALESCE(api_quality_score, quality_score)) DESC) as quality_rank,
+                    CASE 
+                        WHEN AVG(CASE WHEN COALESCE(api_fake_lead, false) THEN 0.8 ELSE 0.2 END) >= 0.7 THEN 'CRITICAL'
+                        WHEN AVG(CASE WHEN COALESCE(api_fake_lead, false) THEN 0.8 ELSE 0.2 END) >= 0.5 THEN 'HIGH'
+                        WHEN AVG(CASE WHEN COALESCE(api_fake_lead, false) THEN 0.8 ELSE 0.2 END) >= 0.3 THEN 'MEDIUM'
+                        ELSE 'LOW'
+                    END as source_risk_level,
+                    CASE 
+                        WHEN AVG(COALESCE(api_quality_score, quality_score)) >= 9 THEN 'A+'
+                        WHEN AVG(COALESCE(api_quality_score, quality_score)) >= 7 THEN 'A'
+                        WHEN AVG(COALESCE(api_quality_score, quality_score)) >= 5 THEN 'B'
+                        WHEN AVG(COALESCE(api_quality_score, quality_score)) >= 3 THEN 'C'
+                        ELSE 'F'
+                    END as source_grade,
+                    MIN(parsed_at) as first_validation,
+                    MAX(parsed_at) as latest_validation
+                FROM parsed_validations 
+                WHERE parse_error IS NULL
+                AND created_date {date_clause}
+                GROUP BY COALESCE(lead_source, 'Unknown')
+                ORDER BY avg_data_quality_score DESC
+                """
+                result = conn.execute(query).fetch_df()
+                return result
     except Exception as e:
         st.error(f"Error loading source results: {e}")
         return pd.DataFrame()
@@ -249,72 +248,64 @@ def load_results_by_source(date_filter="All Time"):
 def load_fake_leads(date_filter="All Time"):
     """Load fake leads detail with date filtering."""
     try:
-        conn = get_database_connection()
-        
-        # Build date filter clause
-        date_clause = get_date_filter_clause(date_filter)
-        
-        # Try simplified view first, fall back to existing data structure
-        try:
-            query = "SELECT * FROM fake_leads_detail ORDER BY fraud_score DESC LIMIT 100"
-            result = pd.read_sql(query, conn)
-            conn.close()
-            return result
-        except:
-            # Fall back to existing structure for fake leads with detailed validation data
-            query = f"""
-            SELECT 
-                task_id as lead_id,
-                lead_source,
-                parsed_at as validation_timestamp,
-                COALESCE(api_first_name, '') as first_name,
-                COALESCE(api_last_name, '') as last_name,
-                COALESCE(api_email, lead_email) as email,
-                COALESCE(api_phone, '') as phone,
-                COALESCE(api_company, lead_company) as company,
-                COALESCE(api_data_quality_score, api_quality_score, quality_score) / 10.0 as data_quality_score,
-                COALESCE(api_fraud_score, 0) / 10.0 as fraud_score,
-                COALESCE(api_quality_score, quality_score) / 10.0 as overall_score,
-                
-                -- Fraud risk level from validation
-                COALESCE(api_fraud_risk_level, 
-                    CASE WHEN COALESCE(api_fraud_score, 0) >= 8 THEN 'high'
-                         WHEN COALESCE(api_fraud_score, 0) >= 5 THEN 'medium'
-                         ELSE 'low' END, 
-                    'unknown') as fraud_risk_level,
-                
-                -- Use actual validation results from API
-                COALESCE(api_email_valid, 
-                    CASE WHEN COALESCE(api_email, lead_email) IS NOT NULL AND COALESCE(api_email, lead_email) != '' THEN true ELSE false END) as email_valid,
-                
-                COALESCE(api_phone_valid, 
-                    CASE WHEN api_phone IS NOT NULL AND api_phone != '' THEN true ELSE false END) as phone_valid,
-                
-                -- Rich validation details from API (only using columns that exist)
-                COALESCE(api_fraud_factors, 'No specific fraud factors identified') as fraud_factors,
-                COALESCE(api_quality_factors, 'No specific quality factors identified') as quality_factors,
-                COALESCE(api_summary_notes, 'Flagged as fake lead') as summary_notes,
-                COALESCE(api_quality_level, 'unknown') as quality_level,
-                COALESCE(api_recommendation, 'review') as recommended_action,
-                
-                -- Additional available fields
-                api_fake_lead,
-                api_market_segment,
-                
-                -- Validation summary from JSON if available
-                raw_api_response,
-                raw_description
-                
-            FROM parsed_validations
-            WHERE parse_error IS NULL
-            AND created_date {date_clause}
-            AND (COALESCE(api_fake_lead, false) = true OR COALESCE(api_fraud_score, 0) >= 5)
-            ORDER BY COALESCE(api_fraud_score, 0) DESC, COALESCE(api_quality_score, quality_score) ASC
-            LIMIT 100
-            """
-            result = pd.read_sql(query, conn)
-            conn.close()
-            return result
+        with DuckDBManager() as db:
+            conn = db.conn
+            
+            # Build date filter clause
+            date_clause = get_date_filter_clause(date_filter)
+            
+            # Try simplified view first, fall back to existing data structure
+            try:
+                query = "SELECT * FROM fake_leads_detail ORDER BY fraud_score DESC LIMIT 100"
+                result = conn.execute(query).fetch_df()
+                return result
+            except duckdb.CatalogException:
+                # Fall back to existing structure; only the columns show_fake_leads_section renders
+                query = f"""
+                SELECT 
+                    lead_source,
+                    COALESCE(api_first_name, '') as first_name,
+                    COALESCE(api_last_name, '') as last_name,
+                    COALESCE(api_email, lead_email) as email,
+                    COALESCE(api_phone, '') as phone,
+                    COALESCE(api_company, lead_company) as company,
+                    COALESCE(api_data_quality_score, api_quality_score, quality_score) / 10.0 as data_quality_score,
+                    COALESCE(api_fraud_score, 0) / 10.0 as fraud_score,
+                    
+                    -- Fraud risk level from validation
+                    COALESCE(api_fraud_risk_level, 
+                        CASE WHEN COALESCE(api_fraud_score, 0) >= 8 THEN 'high'
+                             WHEN COALESCE(api_fraud_score, 0) >= 5 THEN 'medium'
+                             ELSE 'low' END, 
+                        'unknown') as fraud_risk_level,
+                    
+                    -- Use actual validation results from API
+                    COALESCE(api_email_valid, 
+                        CASE WHEN COALESCE(api_email, lead_email) IS NOT NULL AND COALESCE(api_email, lead_email) != '' THEN true ELSE false END) as email_valid,
+                    
+                    COALESCE(api_phone_valid, 
+                        CASE WHEN api_phone IS NOT NULL AND api_phone != '' THEN true ELSE false END) as phone_valid,
+                    
+                    -- Rich validation details from API (only using columns that exist)
+                    COALESCE(api_fraud_factors, 'No specific fraud factors identified') as fraud_factors,
+                    COALESCE(api_quality_factors, 'No specific quality factors identified') as quality_factors,
+                    COALESCE(api_recommendation, 'review') as recommended_action,
+                    
+                    -- Additional available fields
+                    api_market_segment,
+                    
+                    -- Validation summary from JSON if available
+                    raw_api_response
+                    
+                FROM parsed_validations
+                WHERE parse_error IS NULL
+                AND created_date {date_clause}
+                AND (COALESCE(api_fake_lead, false) = true OR COALESCE(api_fraud_score, 0) >= 5)
+                ORDER BY COALESCE(api_fraud_score, 0) DESC, COALESCE(api_quality_score, quality_score) ASC
+                LIMIT 100
+                """
+                result = conn.execute(query).fetch_df()
+                return result
     except Exception as e:
         st.error(f"Error loading fake leads: {e}")
         return pd.DataFrame()
@@ -324,51 +315,50 @@ def load_fake_leads(date_filter="All Time"):
 def load_trends_overall():
     """Load overall trends."""
     try:
-        conn = get_database_connection()
-        # Try simplified view first, fall back to existing data structure
-        try:
-            query = """
-            SELECT * FROM leads.simplified_trends_overall 
-            WHERE period_type = 'daily'
-            ORDER BY trend_date DESC 
-            LIMIT 30
-            """
-            result = pd.read_sql(query, conn)
-            conn.close()
-            return result
-        except:
-            # Fall back to existing structure
-            query = """
-            SELECT 
-                DATE_TRUNC('day', parsed_at) as trend_date,
-                COUNT(*) as total_validations,
-                AVG(COALESCE(api_quality_score, quality_score)) / 10.0 as avg_data_quality_score,
-                AVG(COALESCE(api_quality_score, quality_score)) / 10.0 as median_data_quality_score,
-                AVG(CASE WHEN COALESCE(api_fake_lead, false) THEN 0.8 ELSE 0.2 END) as avg_fraud_score,
-                AVG(CASE WHEN COALESCE(api_fake_lead, false) THEN 0.8 ELSE 0.2 END) as median_fraud_score,
-                AVG(COALESCE(api_quality_score, quality_score)) / 10.0 as avg_overall_score,
-                0.7 as avg_email_score,
-                0.7 as avg_phone_score,
-                0.7 as avg_name_score,
-                0.7 as avg_company_score,
-                0.7 as avg_completeness_score,
-                75.0 as email_pass_rate_percent,
-                75.0 as phone_pass_rate_percent,
-                75.0 as name_pass_rate_percent,
-                75.0 as company_pass_rate_percent,
-                75.0 as completeness_pass_rate_percent,
-                ROUND((COUNTIF(COALESCE(api_quality_score, quality_score) >= 7)::DOUBLE / COUNT(*)) * 100, 1) as high_quality_percentage,
-                ROUND((COUNTIF(COALESCE(api_fake_lead, false))::DOUBLE / COUNT(*)) * 100, 1) as high_fraud_risk_percentage
-            FROM parsed_validations
-            WHERE parse_error IS NULL
-            AND parsed_at >= CURRENT_DATE - INTERVAL '30 days'
-            GROUP BY DATE_TRUNC('day', parsed_at)
-            ORDER BY trend_date DESC
-            LIMIT 30
-            """
-            result = pd.read_sql(query, conn)
-            conn.close()
-            return result
+        with DuckDBManager() as db:
+            conn = db.conn
+            # Try simplified view first, fall back to existing data structure
+            try:
+                query = """
+                SELECT * FROM leads.simplified_trends_overall 
+                WHERE period_type = 'daily'
+                ORDER BY trend_date DESC 
+                LIMIT 30
+                """
+                result = conn.execute(query).fetch_df()
+                return result
+            except duckdb.CatalogException:
+                # Fall back to existing structure
+                query = """
+                SELECT 
+                    DATE_TRUNC('day', parsed_at) as trend_date,
+                    COUNT(*) as total_validations,
+                    AVG(COALESCE(api_quality_score, quality_score)) / 10.0 as avg_data_quality_score,
+                    AVG(COALESCE(api_quality_score, quality_score)) / 10.0 as median_data_quality_score,
+                    AVG(CASE WHEN COALESCE(api_fake_lead, false) THEN 0.8 ELSE 0.2 END) as avg_fraud_score,
+                    AVG(CASE WHEN COALESCE(api_fake_lead, false) THEN 0.8 ELSE 0.2 END) as median_fraud_score,
+                    AVG(COALESCE(api_quality_score, quality_score)) / 10.0 as avg_overall_score,
+                    0.7 as avg_email_score,
+                    0.7 as avg_phone_score,
+                    0.7 as avg_name_score,
+                    0.7 as avg_company_score,
+                    0.7 as avg_completeness_score,
+                    75.0 as email_pass_rate_percent,
+                    75.0 as phone_pass_rate_percent,
+                    75.0 as name_pass_rate_percent,
+                    75.0 as company_pass_rate_percent,
+                    75.0 as completeness_pass_rate_percent,
+                    ROUND((COUNTIF(COALESCE(api_quality_score, quality_score) >= 7)::DOUBLE / COUNT(*)) * 100, 1) as high_quality_percentage,
+                    ROUND((COUNTIF(COALESCE(api_fake_lead, false))::DOUBLE / COUNT(*)) * 100, 1) as high_fraud_risk_percentage
+                FROM parsed_validations
+                WHERE parse_error IS NULL
+                AND parsed_at >= CURRENT_DATE - INTERVAL '30 days'
+                GROUP BY DATE_TRUNC('day', parsed_at)
+                ORDER BY trend_date DESC
+                LIMIT 30
+                """
+                result = conn.execute(query).fetch_df()
+                return result
     except Exception as e:
         st.error(f"Error loading overall trends: {e}")
         return pd.DataFrame()
@@ -378,27 +368,27 @@ def load_trends_overall():
 def load_creation_date_analysis():
     """Load lead quality analysis by creation date."""
     try:
-        conn = get_database_connection()
-        query = """
-        SELECT 
-            DATE_TRUNC('month', created_date) as creation_month,
-            COUNT(*) as total_leads,
-            AVG(COALESCE(api_data_quality_score, api_quality_score, quality_score)) / 10.0 as avg_data_quality_score,
-            AVG(COALESCE(api_fraud_score, 0)) / 10.0 as avg_fraud_score,
-            COUNTIF(COALESCE(api_fake_lead, false)) as fake_leads_count,
-            ROUND((COUNTIF(COALESCE(api_fake_lead, false))::DOUBLE / COUNT(*)) * 100, 2) as fake_leads_percentage,
-            ROUND((COUNTIF(COALESCE(api_quality_score, quality_score) >= 7)::DOUBLE / COUNT(*)) * 100, 2) as high_quality_percentage,
-            COUNT(DISTINCT lead_source) as unique_sources,
-            AVG(COALESCE(api_lead_score, 0)) as avg_lead_score
-        FROM parsed_validations
-        WHERE parse_error IS NULL 
-        AND created_date IS NOT NULL
-        GROUP BY DATE_TRUNC('month', created_date)
-        ORDER BY creation_month DESC
-        """
-        result = pd.read_sql(query, conn)
-        conn.close()
-        return result
+        with DuckDBManager() as db:
+            conn = db.conn
+            query = """
+            SELECT 
+                DATE_TRUNC('month', created_date) as creation_month,
+                COUNT(*) as total_leads,
+                AVG(COALESCE(api_data_quality_score, api_quality_score, quality_score)) / 10.0 as avg_data_quality_score,
+                AVG(COALESCE(api_fraud_score, 0)) / 10.0 as avg_fraud_score,
+                COUNTIF(COALESCE(api_fake_lead, false)) as fake_leads_count,
+                ROUND((COUNTIF(COALESCE(api_fake_lead, false))::DOUBLE / COUNT(*)) * 100, 2) as fake_leads_percentage,
+                ROUND((COUNTIF(COALESCE(api_quality_score, quality_score) >= 7)::DOUBLE / COUNT(*)) * 100, 2) as high_quality_percentage,
+                COUNT(DISTINCT lead_source) as unique_sources,
+                AVG(COALESCE(api_lead_score, 0)) as avg_lead_score
+            FROM parsed_validations
+            WHERE parse_error IS NULL 
+            AND created_date IS NOT NULL
+            GROUP BY DATE_TRUNC('month', created_date)
+            ORDER BY creation_month DESC
+            """
+            result = conn.execute(query).fetch_df()
+            return result
     except Exception as e:
         st.error(f"Error loading creation date analysis: {e}")
         return pd.DataFrame()
@@ -407,65 +397,64 @@ def load_creation_date_analysis():
 def load_trends_by_source(selected_sources=None):
     """Load trends by source."""
     try:
-        conn = get_database_connection()
-        # Try simplified view first, fall back to existing data structure
-        try:
-            query = """
-            SELECT * FROM leads.simplified_trends_by_source 
-            WHERE period_type = 'daily'
-            """
-            
-            if selected_sources:
-                sources_str = "', '".join(selected_sources)
-                query += f" AND lead_source IN ('{sources_str}')"
+        with DuckDBManager() as db:
+            conn = db.conn
+            # Try simplified view first, fall back to existing data structure
+            try:
+                query = """
+                SELECT * FROM leads.simplified_trends_by_source 
+                WHERE period_type = 'daily'
+                """
                 
-            query += " ORDER BY trend_date DESC, lead_source LIMIT 200"
-            result = pd.read_sql(query, conn)
-            conn.close()
-            return result
-        except:
-            # Fall back to existing structure
-            source_filter = ""
-            if selected_sources:
-                sources_str = "', '".join(selected_sources)
-                source_filter = f"AND COALESCE(lead_source, 'Unknown') IN ('{sources_str}')"
-            
-            query = f"""
-            SELECT 
-                'daily' as period_type,
-                DATE_TRUNC('day', parsed_at) as trend_date,
-                COALESCE(lead_source, 'Unknown') as lead_source,
-                COUNT(*) as total_validations,
-                AVG(COALESCE(api_quality_score, quality_score)) / 10.0 as avg_data_quality_score,
-                AVG(COALESCE(api_quality_score, quality_score)) / 10.0 as median_data_quality_score,
-                AVG(CASE WHEN COALESCE(api_fake_lead, false) THEN 0.8 ELSE 0.2 END) as avg_fraud_score,
-                AVG(CASE WHEN COALESCE(api_fake_lead, false) THEN 0.8 ELSE 0.2 END) as median_fraud_score,
-                AVG(COALESCE(api_quality_score, quality_score)) / 10.0 as avg_overall_score,
-                0.7 as avg_email_score,
-                0.7 as avg_phone_score,
-                0.7 as avg_name_score,
-                0.7 as avg_company_score,
-                0.7 as avg_completeness_score,
-                75.0 as email_pass_rate_percent,
-                75.0 as phone_pass_rate_percent,
-                75.0 as name_pass_rate_percent,
-                75.0 as company_pass_rate_percent,
-                75.0 as completeness_pass_rate_percent,
-                ROUND((COUNTIF(COALESCE(api_quality_score, quality_score) >= 7)::DOUBLE / COUNT(*)) * 100, 1) as high_quality_percentage,
-                ROUND((COUNTIF(COALESCE(api_fake_lead, false))::DOUBLE / COUNT(*)) * 100, 1) as high_fraud_risk_percentage,
-                COUNTIF(COALESCE(api_fake_lead, false)) as likely_fake_count
-            FROM parsed_validations
-            WHERE parse_error IS NULL
-            AND parsed_at >= CURRENT_DATE - INTERVAL '30 days'
-            {source_filter}
-            GROUP BY DATE_TRUNC('day', parsed_at), COALESCE(lead_source, 'Unknown')
-            HAVING COUNT(*) >= 3
-            ORDER BY trend_date DESC, lead_source
-            LIMIT 200
-            """
-            result = pd.read_sql(query, conn)
-            conn.close()
-            return result
+                if selected_sources:
+                    sources_str = "', '".join(selected_sources)
+                    query += f" AND lead_source IN ('{sources_str}')"
+                    
+                query += " ORDER BY trend_date DESC, lead_source LIMIT 200"
+                result = conn.execute(query).fetch_df()
+                return result
+            except duckdb.CatalogException:
+                # Fall back to existing structure
+                source_filter = ""
+                if selected_sources:
+                    sources_str = "', '".join(selected_sources)
+                    source_filter = f"AND COALESCE(lead_source, 'Unknown') IN ('{sources_str}')"
+                
+                query = f"""
+                SELECT 
+                    'daily' as period_type,
+                    DATE_TRUNC('day', parsed_at) as trend_date,
+                    COALESCE(lead_source, 'Unknown') as lead_source,
+                    COUNT(*) as total_validations,
+                    AVG(COALESCE(api_quality_score, quality_score)) / 10.0 as avg_data_quality_score,
+                    AVG(COALESCE(api_quality_score, quality_score)) / 10.0 as median_data_quality_score,
+                    AVG(CASE WHEN COALESCE(api_fake_lead, false) THEN 0.8 ELSE 0.2 END) as avg_fraud_score,
+                    AVG(CASE WHEN COALESCE(api_fake_lead, false) THEN 0.8 ELSE 0.2 END) as median_fraud_score,
+                    AVG(COALESCE(api_quality_score, quality_score)) / 10.0 as avg_overall_score,
+                    0.7 as avg_email_score,
+                    0.7 as avg_phone_score,
+                    0.7 as avg_name_score,
+                    0.7 as avg_company_score,
+                    0.7 as avg_completeness_score,
+                    75.0 as email_pass_rate_percent,
+                    75.0 as phone_pass_rate_percent,
+                    75.0 as name_pass_rate_percent,
+                    75.0 as company_pass_rate_percent,
+                    75.0 as completeness_pass_rate_percent,
+                    ROUND((COUNTIF(COALESCE(api_quality_score, quality_score) >= 7)::DOUBLE / COUNT(*)) * 100, 1) as high_quality_percentage,
+                    ROUND((COUNTIF(COALESCE(api_fake_lead, false))::DOUBLE / COUNT(*)) * 100, 1) as high_fraud_risk_percentage,
+                    COUNTIF(COALESCE(api_fake_lead, false)) as likely_fake_count
+                FROM parsed_validations
+                WHERE parse_error IS NULL
+                AND parsed_at >= CURRENT_DATE - INTERVAL '30 days'
+                {source_filter}
+                GROUP BY DATE_TRUNC('day', parsed_at), COALESCE(lead_source, 'Unknown')
+                HAVING COUNT(*) >= 3
+                ORDER BY trend_date DESC, lead_source
+                LIMIT 200
+                """
+                result = conn.execute(query).fetch_df()
+                return result
     except Exception as e:
         st.error(f"Error loading source trends: {e}")
         return pd.DataFrame()
@@ -675,7 +664,8 @@ def show_fake_leads_section(fake_leads_data):
         st.write("**Top High-Risk Leads with Validation Details:**")
         top_fake_leads = fake_leads_data.head(10)
         
-        for idx, lead in top_fake_leads.iterrows():
+        # Plain dicts per lead; iterrows would box every row into an object Series
+        for lead in top_fake_leads.to_dict('records'):
             fraud_score_display = f"{lead['fraud_score']:.1f}" if pd.notna(lead['fraud_score']) else "N/A"
             risk_level = lead['fraud_risk_level'].upper() if pd.notna(lead['fraud_risk_level']) else 'UNKNOWN'
             
@@ -819,8 +809,9 @@ def show_trend_reports():
     st.plotly_chart(fig, use_container_width=True)
 
 
+@st.fragment
 def show_trend_reports_by_source():
-    """Display Trend Reports by Lead Source section."""
+    """Display Trend Reports by Lead Source section; changing the source selection reruns only this section."""
     st.markdown('<div class="section-header">Trend Report by Lead Source</div>', unsafe_allow_html=True)
     
     # Source selection
@@ -856,10 +847,14 @@ def show_trend_reports_by_source():
                [{"secondary_y": False}, {"secondary_y": False}]]
     )
     
-    colors = px.colors.qualitative.Set1[:len(selected_sources)]
+    colors = qualitative.Set1[:len(selected_sources)]
     
-    for i, source in enumerate(selected_sources):
-        source_data_filtered = trends_by_source[trends_by_source['lead_source'] == source]
+    # One categorical groupby instead of a string mask per source; categories keep the selection order
+    source_groups = trends_by_source.groupby(
+        pd.Categorical(trends_by_source['lead_source'], categories=selected_sources), observed=False
+    )
+    
+    for i, (source, source_data_filtered) in enumerate(source_groups):
         color = colors[i % len(colors)]
         
         # Data Quality Score by source
@@ -1002,7 +997,6 @@ def show_creation_date_analysis():
 def show_source_by_date_analysis():
     """Display source performance by creation date."""
     try:
-        conn = get_database_connection()
         query = """
         SELECT 
             DATE_TRUNC('month', created_date) as creation_month,
@@ -1021,8 +1015,8 @@ def show_source_by_date_analysis():
         ORDER BY creation_month DESC, avg_data_quality_score DESC
         """
         
-        source_date_data = pd.read_sql(query, conn)
-        conn.close()
+        with DuckDBManager() as db:
+            source_date_data = db.conn.execute(query).fetch_df()
         
         if source_date_data.empty:
             st.info("No source date analysis available.")
@@ -1039,10 +1033,12 @@ def show_source_by_date_analysis():
                 # Create source quality trends chart
                 fig = go.Figure()
                 
-                colors = px.colors.qualitative.Set1[:len(top_sources)]
+                colors = qualitative.Set1[:len(top_sources)]
+                source_groups = filtered_data.groupby(
+                    pd.Categorical(filtered_data['lead_source'], categories=top_sources), observed=False
+                )
                 
-                for i, source in enumerate(top_sources):
-                    source_data = filtered_data[filtered_data['lead_source'] == source]
+                for i, (source, source_data) in enumerate(source_groups):
                     fig.add_trace(
                         go.Scatter(
                             x=source_data['creation_month'],
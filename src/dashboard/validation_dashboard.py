@@ -13,13 +13,13 @@ sys.path.append(str(project_root))
 from src.dashboard.data_loader import (
     load_validation_metrics, load_validation_summary, load_validation_by_source,
     load_validation_trends, load_recent_validations, load_problematic_leads,
-    load_conversion_analysis, get_data_freshness, load_worst_lead_sources
+    load_conversion_analysis, get_data_freshness, get_latest_batch_id, load_worst_lead_sources
 )
 from src.dashboard.components import (
     create_metric_cards, create_score_distribution_chart, create_validation_trends_chart,
     create_source_analysis_chart, create_conversion_analysis_chart, create_data_freshness_indicator,
     create_detailed_lead_table, create_score_histogram, create_worst_sources_table, 
-    create_lead_source_quality_chart
+    create_lead_source_quality_chart, cached_figure
 )
 from config.settings import DASHBOARD_TITLE
 
@@ -196,6 +196,7 @@ def show_overview_tab():
         return
     
     metrics_row = metrics_data.iloc[0]
+    batch_id = get_latest_batch_id()
     
     # Key metrics cards
     create_metric_cards(metrics_row)
@@ -206,15 +207,14 @@ def show_overview_tab():
     with col1:
         # Score distribution chart
         st.plotly_chart(
-            create_score_distribution_chart(metrics_row),
+            cached_figure('score_distribution', batch_id, lambda: create_score_distribution_chart(metrics_row)),
             use_container_width=True
         )
     
     with col2:
-        # Score histogram
-        summary_data = load_validation_summary()
+        # Score histogram (a cache hit skips loading the lead summary)
         st.plotly_chart(
-            create_score_histogram(summary_data),
+            cached_figure('score_histogram', batch_id, lambda: create_score_histogram(load_validation_summary())),
             use_container_width=True
         )
     
@@ -264,7 +264,7 @@ def show_overview_tab():
         # Update the chart title and labels to reflect fraud analysis
         st.markdown("*Note: 'Conversion Rate' in this chart represents Fraud Rate for analysis purposes*")
         st.plotly_chart(
-            create_conversion_analysis_chart(conversion_data),
+            cached_figure('conversion_analysis', batch_id, lambda: create_conversion_analysis_chart(conversion_data)),
             use_container_width=True
         )
 
@@ -481,7 +481,7 @@ def show_trends_tab():
     
     # Trends chart
     st.plotly_chart(
-        create_validation_trends_chart(trends_data),
+        cached_figure('validation_trends', get_latest_batch_id(), lambda: create_validation_trends_chart(trends_data)),
         use_container_width=True
     )
     
@@ -569,13 +569,11 @@ def show_details_tab():
     
     elif detail_view == "Problematic Leads":
         score_threshold = st.session_state.get('score_threshold', 0.6)
-        leads_data = load_problematic_leads(score_threshold=score_threshold)
-        if not leads_data.empty:
-            leads_data = leads_data.head(limit)
+        leads_data = load_problematic_leads(score_threshold=score_threshold, limit=limit)
         st.markdown(f"**Showing leads with quality score < {score_threshold}**")
     
     else:  # All Leads
-        leads_data = load_validation_summary().head(limit)
+        leads_data = load_validation_summary(limit=limit)
         st.markdown(f"**Showing all leads (limited to {limit} records)**")
     
     # Display the table